@@ -0,0 +1,42 @@
+"""Benchmarks for the National Energy Dashboard NL client."""
+
+from datetime import UTC, datetime, timedelta
+
+import orjson
+
+
+def synthetic_page(rows: int) -> bytes:
+    """Build a utilizations response body with the given number of rows."""
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    last_update = (start + timedelta(days=400)).isoformat()
+    members = [
+        {
+            "@id": f"/v1/utilizations/{index}",
+            "@type": "Utilization",
+            "id": index,
+            "point": "/v1/points/0",
+            "type": "/v1/types/2",
+            "granularity": "/v1/granularities/3",
+            "granularitytimezone": "/v1/granularity_time_zones/0",
+            "activity": "/v1/activities/1",
+            "classification": "/v1/classifications/2",
+            "capacity": index * 7 % 5000,
+            "volume": index * 3 % 1000,
+            "percentage": 0.25,
+            "emission": 0,
+            "emissionfactor": 0,
+            "validfrom": (start + timedelta(minutes=15 * index)).isoformat(),
+            "validto": (start + timedelta(minutes=15 * (index + 1))).isoformat(),
+            "lastupdate": last_update,
+        }
+        for index in range(rows)
+    ]
+    return orjson.dumps(
+        {
+            "@context": "/v1/contexts/Utilization",
+            "@id": "/v1/utilizations",
+            "@type": "hydra:Collection",
+            "hydra:member": members,
+            "hydra:totalItems": rows,
+        }
+    )
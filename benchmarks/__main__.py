@@ -0,0 +1,143 @@
+"""Run the benchmark suite and compare the results with a baseline.
+
+Usage:
+
+    python -m benchmarks [--save results.json] [--compare baseline.json]
+
+All results are "lower is better": seconds per operation, or peak bytes.
+With `--compare`, the run fails when a result is more than `--threshold`
+worse than in the baseline, so regressions can be tracked over time (for
+example by saving the results of the main branch as baseline in CI).
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import timeit
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+import orjson
+
+from nednl import UtilizationSeries
+from nednl.decoder import decode_utilizations
+from nednl.models import UtilizationsResponse
+
+from . import synthetic_page
+from .response_memory import peak_memory
+from .server import stub_client, stub_server
+
+SIZES = (1_000, 10_000, 100_000)
+SERIES = [
+    UtilizationSeries(
+        point_id=point,
+        type_id=2,
+        granularity_id=3,
+        granularity_timezone_id=1,
+        classification_id=2,
+        activity_id=1,
+    )
+    for point in range(16)
+]
+
+
+def best_of(function: Callable[[], object], number: int) -> float:
+    """Get the fastest time of a function, in seconds per call."""
+    return min(timeit.repeat(function, number=number, repeat=5)) / number
+
+
+def parse_benchmarks() -> dict[str, float]:
+    """Measure parsing time and peak memory of synthetic pages."""
+    results: dict[str, float] = {}
+    for rows in SIZES:
+        body = synthetic_page(rows)
+        number = max(1, 20_000 // rows)
+        results[f"from_json[{rows}]"] = best_of(
+            partial(UtilizationsResponse.from_json, body),
+            number,
+        )
+        results[f"decode_utilizations[{rows}]"] = best_of(
+            partial(decode_utilizations, body),
+            number,
+        )
+        results[f"peak_memory[{rows}]"] = peak_memory(
+            partial(decode_utilizations, body)
+        )
+    return results
+
+
+async def request_benchmarks() -> dict[str, float]:
+    """Measure request overhead and fan-out time against a stub server."""
+    results: dict[str, float] = {}
+    async with (
+        stub_server(rows_per_page=1000, pages=10) as base_url,
+        stub_client(base_url) as client,
+    ):
+        requests = 500
+        await client.all_points()
+        start = time.perf_counter()
+        for _ in range(requests):
+            await client.all_points()
+        results["request_overhead"] = (time.perf_counter() - start) / requests
+
+        start = time.perf_counter()
+        await client.utilization_many(
+            series=SERIES,
+            start_date="2024-01-01",
+            end_date="2024-02-01",
+            max_concurrency=8,
+        )
+        results["fan_out[16x10x1000]"] = time.perf_counter() - start
+    return results
+
+
+def compare(
+    results: dict[str, float],
+    baseline: dict[str, float],
+    threshold: float,
+) -> list[str]:
+    """Get the names of the results that regressed compared to the baseline."""
+    return [
+        name
+        for name, value in results.items()
+        if name in baseline and value > baseline[name] * (1 + threshold)
+    ]
+
+
+def main() -> int:
+    """Run all benchmarks, print the results and check for regressions."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", type=Path, help="write the results as JSON")
+    parser.add_argument("--compare", type=Path, help="baseline results to compare")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="allowed slowdown compared to the baseline (default: 0.1)",
+    )
+    arguments = parser.parse_args()
+
+    results = parse_benchmarks()
+    results.update(asyncio.run(request_benchmarks()))
+    baseline: dict[str, float] = (
+        orjson.loads(arguments.compare.read_bytes()) if arguments.compare else {}
+    )
+    regressions = compare(results, baseline, arguments.threshold)
+
+    for name, value in results.items():
+        line = f"{name:<32} {value:>14.6g}"
+        if name in baseline:
+            line += f"  {value / baseline[name]:6.2f}x baseline"
+        if name in regressions:
+            line += "  REGRESSION"
+        print(line)
+
+    if arguments.save:
+        arguments.save.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+"""Compare decoding utilizations with the models and with the fast path."""
+
+import timeit
+from functools import partial
+from typing import TYPE_CHECKING
+
+from nednl.decoder import decode_compact_utilizations, decode_utilizations
+from nednl.frame import UtilizationFrame
+from nednl.models import UtilizationsResponse
+
+from . import synthetic_page
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def main() -> None:
+    """Time each decoder on synthetic pages of increasing size."""
+    for rows in (1_000, 10_000, 100_000):
+        body = synthetic_page(rows)
+        text = body.decode()
+        number = max(1, 100_000 // rows)
+        decoders: dict[str, Callable[[], object]] = {
+            "models": partial(UtilizationsResponse.from_json, text),
+            "fast path": partial(decode_utilizations, body),
+            "compact": partial(decode_compact_utilizations, body),
+            "frame": partial(UtilizationFrame.from_json, body),
+        }
+        baseline = 0.0
+        for name, decode in decoders.items():
+            seconds = min(timeit.repeat(decode, number=number, repeat=5)) / number
+            baseline = baseline or seconds
+            print(
+                f"{rows:>7} rows  {name:<10} {seconds * 1000:9.2f} ms"
+                f"  {baseline / seconds:5.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Compare peak memory of the ways to decode a utilizations response."""
+
+import tracemalloc
+from collections.abc import Callable
+from functools import partial
+
+from nednl.decoder import (
+    decode_compact_utilizations,
+    decode_utilization_records,
+    decode_utilizations,
+)
+from nednl.frame import UtilizationFrame
+from nednl.stream import HydraCollectionParser
+
+from . import synthetic_page
+
+
+def peak_memory(decode: Callable[[], object]) -> int:
+    """Get the peak memory allocated while decoding, in bytes."""
+    tracemalloc.start()
+    try:
+        result = decode()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+def text(body: bytes) -> int:
+    """Decode a body after converting it to text, like before reading bytes."""
+    return len(decode_utilizations(body.decode()).data)
+
+
+def stream(body: bytes, chunk_size: int = 65536) -> int:
+    """Decode a body in chunks like a streamed response, dropping each row."""
+    parser = HydraCollectionParser()
+    rows = 0
+    for start in range(0, len(body), chunk_size):
+        chunk = body[start : start + chunk_size]
+        rows += len(decode_utilization_records(parser.feed(chunk)))
+    return rows
+
+
+def main() -> None:
+    """Measure each decode path on synthetic pages of increasing size."""
+    for rows in (1_000, 10_000, 100_000):
+        body = synthetic_page(rows)
+        paths: dict[str, Callable[[], object]] = {
+            "text": partial(text, body),
+            "bytes": partial(decode_utilizations, body),
+            "compact": partial(decode_compact_utilizations, body),
+            "frame": partial(UtilizationFrame.from_json, body),
+            "stream": partial(stream, body),
+        }
+        for name, decode in paths.items():
+            peak = peak_memory(decode)
+            print(
+                f"{rows:>7} rows  {name:<7} body {len(body) / 2**20:7.2f} MiB"
+                f"  peak {peak / 2**20:7.2f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Local stub of the API, to benchmark the client without the network."""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+from unittest.mock import patch
+
+import orjson
+from aiohttp import web
+from yarl import URL
+
+from nednl import NedNL
+from nednl import nednl as client_module
+
+from . import synthetic_page
+
+CONTENT_TYPE = "application/ld+json"
+
+
+def _points() -> bytes:
+    """Build a small reference data response."""
+    return orjson.dumps(
+        {
+            "hydra:member": [
+                {"id": index, "name": f"Point {index}", "nameshort": f"P{index}"}
+                for index in range(10)
+            ],
+            "hydra:totalItems": 10,
+        }
+    )
+
+
+def _page(body: bytes, request: web.Request, page: int, pages: int) -> bytes:
+    """Add Hydra pagination links to a synthetic page."""
+    document = orjson.loads(body)
+    if page < pages:
+        query = {**request.query, "page": str(page + 1)}
+        document["hydra:view"] = {
+            "@id": str(request.rel_url),
+            "hydra:next": str(request.rel_url.with_query(query)),
+        }
+    document["hydra:totalItems"] = len(document["hydra:member"]) * pages
+    return orjson.dumps(document)
+
+
+@asynccontextmanager
+async def stub_server(rows_per_page: int = 1000, pages: int = 10) -> AsyncIterator[URL]:
+    """Serve the points and a paginated utilizations endpoint on localhost.
+
+    Every utilizations query returns `pages` pages of `rows_per_page` rows.
+    Bodies are built once, so the server adds as little time as possible.
+
+    Yields the base URL of the stub, to be used with `stub_client`.
+    """
+    points = _points()
+    body = synthetic_page(rows_per_page)
+    rendered: dict[str, bytes] = {}
+
+    async def utilizations(request: web.Request) -> web.Response:
+        page = int(request.query.get("page", "1"))
+        key = str(request.rel_url)
+        if key not in rendered:
+            rendered[key] = _page(body, request, page, pages)
+        return web.Response(body=rendered[key], content_type=CONTENT_TYPE)
+
+    async def reference(_request: web.Request) -> web.Response:
+        return web.Response(body=points, content_type=CONTENT_TYPE)
+
+    app = web.Application()
+    app.router.add_get("/v1/points", reference)
+    app.router.add_get("/v1/utilizations", utilizations)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+    try:
+        yield URL.build(scheme="http", host=host, port=port, path="/v1/")
+    finally:
+        await runner.cleanup()
+
+
+@asynccontextmanager
+async def stub_client(base_url: URL, **options: Any) -> AsyncIterator[NedNL]:
+    """Create a client that sends its requests to the stub server."""
+    client_module._build_url.cache_clear()  # noqa: SLF001, pylint: disable=protected-access
+    try:
+        with patch.object(client_module, "BASE_URL", base_url):
+            async with NedNL("BENCHMARK", **options) as client:
+                yield client
+    finally:
+        client_module._build_url.cache_clear()  # noqa: SLF001, pylint: disable=protected-access
@@ -1,5 +1,8 @@
 """Asynchronous Python client for National Energy Dashboard NL."""
 
+from .cache import CachedResponse, ResponseCache, SQLiteResponseCache, TTLCache
+from .catalog import NedCatalog
+from .concurrency import AdaptiveConcurrency
 from .exceptions import (
     NedNLAuthenticationError,
     NedNLClientError,
@@ -11,22 +14,41 @@ from .exceptions import (
     NedNLTimeoutError,
     NedNLValidationError,
 )
+from .frame import UtilizationFrame
+from .metrics import (
+    OpenTelemetryHook,
+    PrometheusHook,
+    RequestHook,
+    RequestMetrics,
+    create_trace_config,
+)
 from .models import (
     Activity,
     Classification,
+    CompactUtilization,
     Granularity,
     GranularityTimezone,
     Point,
     Type,
     Utilization,
+    UtilizationSeries,
 )
 from .nednl import NedNL
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .store import SQLiteUtilizationStore, UtilizationStore
+from .stream import UtilizationStream
+from .sync import SyncResult, SyncState, SyncWatermark
 
 __all__ = [
     "Activity",
+    "AdaptiveConcurrency",
+    "CachedResponse",
     "Classification",
+    "CompactUtilization",
     "Granularity",
     "GranularityTimezone",
+    "NedCatalog",
     "NedNL",
     "NedNLAuthenticationError",
     "NedNLClientError",
@@ -37,7 +59,25 @@ __all__ = [
     "NedNLServerError",
     "NedNLTimeoutError",
     "NedNLValidationError",
+    "OpenTelemetryHook",
     "Point",
+    "PrometheusHook",
+    "RateLimiter",
+    "RequestHook",
+    "RequestMetrics",
+    "ResponseCache",
+    "RetryPolicy",
+    "SQLiteResponseCache",
+    "SQLiteUtilizationStore",
+    "SyncResult",
+    "SyncState",
+    "SyncWatermark",
+    "TTLCache",
     "Type",
     "Utilization",
+    "UtilizationFrame",
+    "UtilizationSeries",
+    "UtilizationStore",
+    "UtilizationStream",
+    "create_trace_config",
 ]
@@ -0,0 +1,196 @@
+"""Asynchronous Python client for National Energy Dashboard NL."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import time
+from contextlib import closing
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Protocol
+
+from .util import sqlite_transaction
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from pathlib import Path
+
+
+@dataclass
+class TTLCache:
+    """In-memory cache with a time-to-live per key.
+
+    Used by NedNL to cache the reference data endpoints, keyed by endpoint
+    name (for example 'points' or 'granularity_time_zones'). Concurrent calls
+    for a key that is not cached share a single fetch.
+    """
+
+    default_ttl: float = 3600.0
+    ttls: dict[str, float] = field(default_factory=dict)
+
+    _entries: dict[str, tuple[float, Any]] = field(init=False, default_factory=dict)
+    _inflight: dict[str, asyncio.Task[Any]] = field(init=False, default_factory=dict)
+
+    async def get_or_fetch[T](self, key: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Get a value from the cache, fetching it when missing or expired.
+
+        Cancelling a caller does not cancel a fetch shared with other callers.
+        Errors are passed on to all waiting callers and are not cached.
+
+        Args:
+        ----
+            key: The cache key.
+            fetch: Coroutine function that fetches the value.
+
+        Returns:
+        -------
+            The cached or freshly fetched value.
+
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            value: T = entry[1]
+            return value
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(key, fetch))
+            self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    async def _fetch[T](self, key: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        """Fetch a value and store it in the cache.
+
+        Args:
+        ----
+            key: The cache key.
+            fetch: Coroutine function that fetches the value.
+
+        Returns:
+        -------
+            The fetched value.
+
+        """
+        task = asyncio.current_task()
+        try:
+            value = await fetch()
+        finally:
+            # The key was invalidated while fetching, when the task was dropped
+            invalidated = self._inflight.get(key) is not task
+            if not invalidated:
+                del self._inflight[key]
+        if not invalidated:
+            ttl = self.ttls.get(key, self.default_ttl)
+            self._entries[key] = (time.monotonic() + ttl, value)
+        return value
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Remove a key, or all keys, from the cache.
+
+        A fetch that is in flight for a removed key is not cached when it
+        completes, as it may return the data from before the invalidation.
+
+        Args:
+        ----
+            key: The cache key to remove, or None to clear the whole cache.
+
+        """
+        if key is None:
+            self._entries.clear()
+            self._inflight.clear()
+        else:
+            self._entries.pop(key, None)
+            self._inflight.pop(key, None)
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """Object representing a response body stored in a response cache."""
+
+    body: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+    final: bool = False
+
+
+class ResponseCache(Protocol):
+    """Interface of a persistent cache for raw API responses.
+
+    Keys are built from the request URL and its normalized query parameters.
+    Responses marked as final are served without contacting the API, others
+    are revalidated with a conditional request.
+    """
+
+    async def get(self, key: str) -> CachedResponse | None:
+        """Get a cached response, or None if the key is not cached."""
+
+    async def set(self, key: str, response: CachedResponse) -> None:
+        """Store a response in the cache."""
+
+
+@dataclass
+class SQLiteResponseCache:
+    """Response cache stored in a SQLite database file."""
+
+    path: str | Path
+
+    def __post_init__(self) -> None:
+        """Create the cache table if it does not exist yet."""
+        with sqlite_transaction(self.path) as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, "
+                "last_modified TEXT, final INTEGER NOT NULL)"
+            )
+
+    def _get(self, key: str) -> CachedResponse | None:
+        """Read a cached response from the database."""
+        with closing(sqlite3.connect(self.path)) as connection:
+            row = connection.execute(
+                "SELECT body, etag, last_modified, final FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        return CachedResponse(
+            body=row[0], etag=row[1], last_modified=row[2], final=bool(row[3])
+        )
+
+    def _set(self, key: str, response: CachedResponse) -> None:
+        """Write a response to the database."""
+        with sqlite_transaction(self.path) as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    response.body,
+                    response.etag,
+                    response.last_modified,
+                    int(response.final),
+                ),
+            )
+
+    async def get(self, key: str) -> CachedResponse | None:
+        """Get a cached response, or None if the key is not cached.
+
+        Args:
+        ----
+            key: The cache key.
+
+        Returns:
+        -------
+            The cached response, if any.
+
+        """
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, response: CachedResponse) -> None:
+        """Store a response in the cache.
+
+        Args:
+        ----
+            key: The cache key.
+            response: The response to store.
+
+        """
+        await asyncio.to_thread(self._set, key, response)
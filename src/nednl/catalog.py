@@ -0,0 +1,260 @@
+"""Asynchronous Python client for National Energy Dashboard NL."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Self
+
+import orjson
+
+from .models import (
+    Activity,
+    Classification,
+    Granularity,
+    GranularityTimezone,
+    Point,
+    Type,
+    UtilizationSeries,
+)
+
+if TYPE_CHECKING:
+    from .nednl import NedNL
+
+# An id, a name or shortname (case insensitive), or the reference data itself
+ActivityRef = int | str | Activity
+ClassificationRef = int | str | Classification
+GranularityRef = int | str | Granularity
+GranularityTimezoneRef = int | str | GranularityTimezone
+PointRef = int | str | Point
+TypeRef = int | str | Type  # pylint: disable=invalid-name
+
+
+@dataclass(slots=True)
+class _Index[T]:
+    """Lookup of reference data by id and by (short) name."""
+
+    kind: str
+    by_id: dict[int, T] = field(default_factory=dict)
+    by_name: dict[str, T] = field(default_factory=dict)
+
+    def get(self, value: int | str | T) -> T:
+        """Get an item by id or name, or return the given item.
+
+        Raises
+        ------
+            ValueError: If no item has the id or name.
+
+        """
+        if isinstance(value, int):
+            item = self.by_id.get(value)
+        elif isinstance(value, str):
+            item = self.by_name.get(value.casefold())
+        else:
+            return value
+        if item is None:
+            msg = f"Unknown {self.kind}: {value!r}"
+            raise ValueError(msg)
+        return item
+
+
+def _index(kind: str, items: list[Any]) -> _Index[Any]:
+    """Index reference data by id, name and shortname.
+
+    When names collide, the first item wins, and names take precedence over
+    shortnames.
+    """
+    index: _Index[Any] = _Index(kind)
+    for item in items:
+        index.by_id.setdefault(item.id, item)
+        index.by_name.setdefault(item.name.casefold(), item)
+    for item in items:
+        if (shortname := getattr(item, "shortname", None)) is not None:
+            index.by_name.setdefault(shortname.casefold(), item)
+    return index
+
+
+@dataclass
+class NedCatalog:
+    """Reference data of National Energy Dashboard NL, indexed for lookups.
+
+    Resolves ids, names and shortnames (case insensitive) of the activities,
+    classifications, granularities, granularity timezones, points and types
+    in constant time. Load it once with `load`, and store it with `to_json`
+    for a fast start without requests.
+    """
+
+    activities: list[Activity] = field(default_factory=list)
+    classifications: list[Classification] = field(default_factory=list)
+    granularities: list[Granularity] = field(default_factory=list)
+    granularity_timezones: list[GranularityTimezone] = field(default_factory=list)
+    points: list[Point] = field(default_factory=list)
+    types: list[Type] = field(default_factory=list)
+
+    _activities: _Index[Activity] = field(init=False, repr=False, compare=False)
+    _classifications: _Index[Classification] = field(
+        init=False, repr=False, compare=False
+    )
+    _granularities: _Index[Granularity] = field(init=False, repr=False, compare=False)
+    _granularity_timezones: _Index[GranularityTimezone] = field(
+        init=False, repr=False, compare=False
+    )
+    _points: _Index[Point] = field(init=False, repr=False, compare=False)
+    _types: _Index[Type] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Build the indexes."""
+        self._activities = _index("activity", self.activities)
+        self._classifications = _index("classification", self.classifications)
+        self._granularities = _index("granularity", self.granularities)
+        self._granularity_timezones = _index(
+            "granularity timezone", self.granularity_timezones
+        )
+        self._points = _index("point", self.points)
+        self._types = _index("type", self.types)
+
+    @classmethod
+    async def load(cls, client: NedNL) -> Self:
+        """Load all reference data concurrently.
+
+        Args:
+        ----
+            client: The client to request the reference data with.
+
+        Returns:
+        -------
+            The catalog.
+
+        """
+        (
+            activities,
+            classifications,
+            granularities,
+            granularity_timezones,
+            points,
+            types,
+        ) = await asyncio.gather(
+            client.all_activities(),
+            client.all_classifications(),
+            client.all_granularities(),
+            client.all_granularity_timezones(),
+            client.all_points(),
+            client.all_types(),
+        )
+        return cls(
+            activities=activities,
+            classifications=classifications,
+            granularities=granularities,
+            granularity_timezones=granularity_timezones,
+            points=points,
+            types=types,
+        )
+
+    def to_json(self) -> bytes:
+        """Serialize the reference data, to store it between runs.
+
+        Returns
+        -------
+            The reference data as JSON.
+
+        """
+        return orjson.dumps(
+            {
+                "activities": [item.to_dict() for item in self.activities],
+                "classifications": [item.to_dict() for item in self.classifications],
+                "granularities": [item.to_dict() for item in self.granularities],
+                "granularity_timezones": [
+                    item.to_dict() for item in self.granularity_timezones
+                ],
+                "points": [item.to_dict() for item in self.points],
+                "types": [item.to_dict() for item in self.types],
+            }
+        )
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> Self:
+        """Restore a catalog serialized with `to_json`.
+
+        Args:
+        ----
+            data: The reference data as JSON.
+
+        Returns:
+        -------
+            The catalog.
+
+        """
+        document = orjson.loads(data)
+        return cls(
+            activities=[Activity.from_dict(item) for item in document["activities"]],
+            classifications=[
+                Classification.from_dict(item) for item in document["classifications"]
+            ],
+            granularities=[
+                Granularity.from_dict(item) for item in document["granularities"]
+            ],
+            granularity_timezones=[
+                GranularityTimezone.from_dict(item)
+                for item in document["granularity_timezones"]
+            ],
+            points=[Point.from_dict(item) for item in document["points"]],
+            types=[Type.from_dict(item) for item in document["types"]],
+        )
+
+    def get_activity(self, value: ActivityRef) -> Activity:
+        """Get an activity by id or name."""
+        return self._activities.get(value)
+
+    def get_classification(self, value: ClassificationRef) -> Classification:
+        """Get a classification by id or name."""
+        return self._classifications.get(value)
+
+    def get_granularity(self, value: GranularityRef) -> Granularity:
+        """Get a granularity by id or name."""
+        return self._granularities.get(value)
+
+    def get_granularity_timezone(
+        self, value: GranularityTimezoneRef
+    ) -> GranularityTimezone:
+        """Get a granularity timezone by id or name."""
+        return self._granularity_timezones.get(value)
+
+    def get_point(self, value: PointRef) -> Point:
+        """Get a point by id, name or shortname."""
+        return self._points.get(value)
+
+    def get_type(self, value: TypeRef) -> Type:
+        """Get a type by id, name or shortname."""
+        return self._types.get(value)
+
+    def series(  # noqa: PLR0913, pylint: disable=too-many-arguments
+        self,
+        *,
+        point_id: PointRef,
+        type_id: TypeRef,
+        granularity_id: GranularityRef,
+        granularity_timezone_id: GranularityTimezoneRef,
+        classification_id: ClassificationRef,
+        activity_id: ActivityRef,
+    ) -> UtilizationSeries:
+        """Identify a utilization series by ids, names or reference data.
+
+        Returns
+        -------
+            The series, with the ids of the given reference data.
+
+        Raises
+        ------
+            ValueError: If an id or name is unknown.
+
+        """
+        return UtilizationSeries(
+            point_id=self.get_point(point_id).id,
+            type_id=self.get_type(type_id).id,
+            granularity_id=self.get_granularity(granularity_id).id,
+            granularity_timezone_id=self.get_granularity_timezone(
+                granularity_timezone_id
+            ).id,
+            classification_id=self.get_classification(classification_id).id,
+            activity_id=self.get_activity(activity_id).id,
+        )
@@ -0,0 +1,201 @@
+"""Command line interface for National Energy Dashboard NL."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from datetime import date
+from itertools import product
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .exceptions import NedNLError
+from .export import EXPORT_FORMATS, export_utilizations
+from .models import UtilizationSeries
+from .nednl import NedNL
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+
+    from .export import ExportResult
+
+ALL = "all"
+
+
+def _ids(value: str) -> list[int] | None:
+    """Parse a comma separated list of ids, or 'all' (returned as None)."""
+    if value.strip().lower() == ALL:
+        return None
+    try:
+        return [int(item) for item in value.split(",") if item.strip()]
+    except ValueError as exception:
+        msg = f"expected comma separated ids or '{ALL}', got {value!r}"
+        raise argparse.ArgumentTypeError(msg) from exception
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the parser of the command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="nednl", description="National Energy Dashboard NL client."
+    )
+    parser.add_argument(
+        "--api-key",
+        default=os.environ.get("NEDNL_API_KEY"),
+        help="API key (default: the NEDNL_API_KEY environment variable)",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser(
+        "export",
+        help="export utilizations to files",
+        description=(
+            "Export the utilizations of every combination of the given ids, one "
+            "part file per page in a directory per series. Each id option takes "
+            f"comma separated ids, or '{ALL}' to use every id of the reference data."
+        ),
+    )
+    for option, default in (
+        ("points", None),
+        ("types", None),
+        ("granularities", "3"),
+        ("granularity-timezones", "1"),
+        ("classifications", "2"),
+        ("activities", "1"),
+    ):
+        export.add_argument(
+            f"--{option}",
+            type=_ids,
+            default=None if default is None else _ids(default),
+            required=default is None,
+            metavar="IDS",
+            help=f"ids of the {option.replace('-', ' ')}"
+            + ("" if default is None else f" (default: {default})"),
+        )
+    export.add_argument(
+        "--from",
+        dest="start_date",
+        type=date.fromisoformat,
+        required=True,
+        help="start date (inclusive), for example 2023-01-01",
+    )
+    export.add_argument(
+        "--to",
+        dest="end_date",
+        type=date.fromisoformat,
+        required=True,
+        help="end date (exclusive), for example 2024-01-01",
+    )
+    export.add_argument("--format", choices=EXPORT_FORMATS, default="csv")
+    export.add_argument("--output", type=Path, default=Path("nednl-export"))
+    export.add_argument(
+        "--shard",
+        choices=("day", "week", "month", "year"),
+        default="month",
+        help="period downloaded per query (default: month)",
+    )
+    export.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=8,
+        help="queries downloaded in parallel (default: 8)",
+    )
+    export.add_argument("--items-per-page", type=int)
+    export.add_argument(
+        "--requests-per-minute",
+        type=float,
+        default=RateLimiter.requests_per_minute,
+        help=f"rate limit (default: {RateLimiter.requests_per_minute:g})",
+    )
+    export.add_argument(
+        "--processes",
+        type=int,
+        default=0,
+        help="worker processes that decode and write the pages, "
+        "0 to do so in the main process (default: 0)",
+    )
+    return parser
+
+
+async def _resolve(
+    ids: list[int] | None,
+    fetch: Callable[[], Awaitable[Sequence[Any]]],
+) -> list[int]:
+    """Get the given ids, or all ids of the reference data when None."""
+    if ids is not None:
+        return ids
+    return [item.id for item in await fetch()]
+
+
+async def _export(arguments: argparse.Namespace) -> ExportResult:
+    """Run the export command."""
+    async with NedNL(
+        arguments.api_key,
+        rate_limiter=RateLimiter(requests_per_minute=arguments.requests_per_minute),
+        retry_policy=RetryPolicy(),
+    ) as client:
+        ids = await asyncio.gather(
+            _resolve(arguments.points, client.all_points),
+            _resolve(arguments.types, client.all_types),
+            _resolve(arguments.granularities, client.all_granularities),
+            _resolve(arguments.granularity_timezones, client.all_granularity_timezones),
+            _resolve(arguments.classifications, client.all_classifications),
+            _resolve(arguments.activities, client.all_activities),
+        )
+        series = [UtilizationSeries(*combination) for combination in product(*ids)]
+        with (
+            ProcessPoolExecutor(arguments.processes)
+            if arguments.processes > 0
+            else nullcontext()
+        ) as executor:
+            return await export_utilizations(
+                client,
+                series,
+                start_date=arguments.start_date,
+                end_date=arguments.end_date,
+                output=arguments.output,
+                file_format=arguments.format,
+                shard=arguments.shard,
+                max_concurrency=arguments.max_concurrency,
+                items_per_page=arguments.items_per_page,
+                executor=executor,
+            )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line interface.
+
+    Args:
+    ----
+        argv: The command line arguments, without the program name.
+
+    Returns:
+    -------
+        The exit code.
+
+    """
+    parser = _build_parser()
+    arguments = parser.parse_args(argv)
+    if not arguments.api_key:
+        parser.error("an API key is required, use --api-key or NEDNL_API_KEY")
+    if arguments.max_concurrency < 1:
+        parser.error("--max-concurrency must be at least 1")
+
+    try:
+        result = asyncio.run(_export(arguments))
+    except (NedNLError, ImportError) as exception:
+        sys.stderr.write(f"nednl: error: {exception}\n")
+        return 1
+    sys.stdout.write(
+        f"Exported {result.rows} rows to {result.files} files in {arguments.output}\n"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
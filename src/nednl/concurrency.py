@@ -0,0 +1,138 @@
+"""Asynchronous Python client for National Energy Dashboard NL."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+from .exceptions import (
+    NedNLError,
+    NedNLRateLimitError,
+    NedNLServerError,
+    NedNLTimeoutError,
+)
+
+
+@dataclass
+class AdaptiveConcurrency:
+    """Adaptive limit on the number of requests in flight (AIMD).
+
+    While requests succeed and their latency stays within `latency_tolerance`
+    times the baseline (the lowest recent latency), the limit grows by
+    `increase` per limit's worth of requests, so roughly once per round trip.
+    On an overload signal (rate limiting, a server error or a timeout) the
+    limit is multiplied by `decrease`. Requests that were already in flight
+    when the limit was decreased do not decrease it again, so a burst of
+    failures only counts once. Like the rate limiter, one controller can be
+    shared between clients using the same API key.
+    """
+
+    initial_limit: int = 4
+    min_limit: int = 1
+    max_limit: int = 64
+    increase: float = 1.0
+    decrease: float = 0.5
+    latency_tolerance: float = 2.0
+    overload_on: tuple[type[NedNLError], ...] = (
+        NedNLRateLimitError,
+        NedNLServerError,
+        NedNLTimeoutError,
+    )
+
+    _limit: float = field(init=False)
+    _in_flight: int = field(init=False, default=0)
+    _baseline: float | None = field(init=False, default=None)
+    _decreased_at: float = field(init=False, default=0.0)
+    _waiters: deque[asyncio.Future[None]] = field(init=False, default_factory=deque)
+
+    def __post_init__(self) -> None:
+        """Validate the configuration and start at the initial limit.
+
+        Raises
+        ------
+            ValueError: If the limits or factors are out of range.
+
+        """
+        if not 1 <= self.min_limit <= self.initial_limit <= self.max_limit:
+            msg = "Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit."
+            raise ValueError(msg)
+        if self.increase <= 0 or not 0 < self.decrease < 1:
+            msg = "Increase must be positive and decrease between 0 and 1."
+            raise ValueError(msg)
+        self._limit = float(self.initial_limit)
+
+    @property
+    def limit(self) -> int:
+        """The current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests in flight."""
+        return self._in_flight
+
+    async def acquire(self) -> float:
+        """Wait until a request is allowed in flight and take a slot.
+
+        Waiters are served in the order they started waiting.
+
+        Returns
+        -------
+            The moment the slot was taken, to pass to `release`.
+
+        """
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+        else:
+            waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # The slot was handed over right before the cancellation
+                    self._in_flight -= 1
+                    self._wake()
+                raise
+        return time.monotonic()
+
+    def release(self, started: float, exception: BaseException | None = None) -> None:
+        """Free a slot and adapt the limit to the outcome of the request.
+
+        Args:
+        ----
+            started: The moment the slot was taken, as returned by `acquire`.
+            exception: The exception raised by the request, if it failed.
+                Failures that do not signal an overload (such as a request
+                for a missing resource) leave the limit unchanged.
+
+        """
+        self._in_flight -= 1
+        if exception is None:
+            self._on_success(time.monotonic() - started)
+        elif isinstance(exception, self.overload_on) and started >= self._decreased_at:
+            self._limit = max(float(self.min_limit), self._limit * self.decrease)
+            self._decreased_at = time.monotonic()
+        self._wake()
+
+    def _on_success(self, latency: float) -> None:
+        """Grow the limit when the latency of a request is stable."""
+        if self._baseline is None or latency < self._baseline:
+            self._baseline = latency
+        else:
+            # Let the baseline follow a slower API, but only gradually
+            self._baseline += (latency - self._baseline) * 0.01
+        if latency <= self._baseline * self.latency_tolerance:
+            self._limit = min(
+                float(self.max_limit), self._limit + self.increase / self._limit
+            )
+
+    def _wake(self) -> None:
+        """Hand free slots to the waiters, in order."""
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
@@ -0,0 +1,168 @@
+"""Asynchronous Python client for National Energy Dashboard NL."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+import orjson
+
+from .models import CompactUtilization, HydraView, Utilization, UtilizationsResponse
+
+
+def decode_utilization_records(records: list[dict[str, Any]]) -> list[Utilization]:
+    """Convert raw utilization records of the API to utilizations.
+
+    Produces the same objects as the mashumaro model, but without its generic
+    per-field conversion: the API sends integers for the integer fields, so
+    only the float fields are converted. Timestamps repeat a lot (the valid to
+    of one row is the valid from of the next, and rows share their last
+    update), so each distinct timestamp is parsed only once. Datetimes are
+    immutable, so rows can safely share them.
+
+    Args:
+    ----
+        records: The 'hydra:member' items of a utilizations response.
+
+    Returns:
+    -------
+        List of utilizations.
+
+    """
+    parsed: dict[str, datetime] = {}
+    get_parsed = parsed.get
+    fromisoformat = datetime.fromisoformat
+    utilizations: list[Utilization] = []
+    append = utilizations.append
+    for record in records:
+        value = record["validfrom"]
+        if (valid_from := get_parsed(value)) is None:
+            valid_from = parsed[value] = fromisoformat(value)
+        value = record["validto"]
+        if (valid_to := get_parsed(value)) is None:
+            valid_to = parsed[value] = fromisoformat(value)
+        value = record["lastupdate"]
+        if (last_update := get_parsed(value)) is None:
+            last_update = parsed[value] = fromisoformat(value)
+        # Positional arguments, keyword arguments are notably slower here
+        append(
+            Utilization(
+                record["id"],
+                record["capacity"],
+                record["volume"],
+                float(record["percentage"]),
+                record["emission"],
+                float(record["emissionfactor"]),
+                valid_from,
+                valid_to,
+                last_update,
+            )
+        )
+    return utilizations
+
+
+def decode_utilizations(data: str | bytes) -> UtilizationsResponse:
+    """Decode a utilizations response without the generic model conversion.
+
+    Args:
+    ----
+        data: The JSON body of a utilizations response.
+
+    Returns:
+    -------
+        The utilizations response.
+
+    """
+    document = orjson.loads(data)
+    view = document.get("hydra:view")
+    return UtilizationsResponse(
+        data=decode_utilization_records(document["hydra:member"]),
+        items=document["hydra:totalItems"],
+        view=HydraView.from_dict(view) if view is not None else None,
+    )
+
+
+def decode_compact_utilizations(data: str | bytes) -> list[CompactUtilization]:
+    """Decode the utilizations of a response as compact utilizations.
+
+    Args:
+    ----
+        data: The JSON body of a utilizations response.
+
+    Returns:
+    -------
+        List of compact utilizations.
+
+    """
+    return decode_compact_utilization_records(orjson.loads(data)["hydra:member"])
+
+
+def decode_compact_utilization_records(
+    records: list[dict[str, Any]],
+) -> list[CompactUtilization]:
+    """Convert raw utilization records of the API to compact utilizations.
+
+    Args:
+    ----
+        records: The 'hydra:member' items of a utilizations response.
+
+    Returns:
+    -------
+        List of compact utilizations.
+
+    """
+    valid_from, valid_to, last_update = decode_timestamps(
+        records, "validfrom", "validto", "lastupdate"
+    )
+    return [
+        CompactUtilization(
+            record["id"],
+            record["capacity"],
+            record["volume"],
+            float(record["percentage"]),
+            record["emission"],
+            float(record["emissionfactor"]),
+            valid_from_timestamp,
+            valid_to_timestamp,
+            last_update_timestamp,
+        )
+        for (
+            record,
+            valid_from_timestamp,
+            valid_to_timestamp,
+            last_update_timestamp,
+        ) in zip(records, valid_from, valid_to, last_update, strict=True)
+    ]
+
+
+def decode_timestamps(
+    records: list[dict[str, Any]],
+    *keys: str,
+) -> tuple[list[int], ...]:
+    """Get timestamp fields of raw records as epoch seconds.
+
+    The fields share one cache of parsed timestamps, since the valid to of one
+    row usually is the valid from of the next.
+
+    Args:
+    ----
+        records: The 'hydra:member' items of a utilizations response.
+        keys: The API field names of the timestamps.
+
+    Returns:
+    -------
+        For each field, the timestamps of all records in seconds since the epoch.
+
+    """
+    parsed: dict[str, int] = {}
+    get_parsed = parsed.get
+    fromisoformat = datetime.fromisoformat
+    columns: tuple[list[int], ...] = tuple([] for _ in keys)
+    for key, column in zip(keys, columns, strict=True):
+        append = column.append
+        for record in records:
+            value = record[key]
+            if (timestamp := get_parsed(value)) is None:
+                timestamp = parsed[value] = int(fromisoformat(value).timestamp())
+            append(timestamp)
+    return columns
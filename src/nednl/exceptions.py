@@ -41,6 +41,22 @@ class NedNLTimeoutError(NedNLConnectionError):
 class NedNLRateLimitError(NedNLError):
     """NED NL rate limit exception (HTTP 429)."""
 
+    def __init__(
+        self,
+        data: dict[str, Any] | str,
+        retry_after: float | None = None,
+    ) -> None:
+        """Initialize the exception.
+
+        Args:
+        ----
+            data: Either an error response dict or a plain error message string.
+            retry_after: Seconds to wait before retrying, from the Retry-After header.
+
+        """
+        super().__init__(data)
+        self.retry_after = retry_after
+
 
 class NedNLClientError(NedNLError):
     """NED NL client error exception (HTTP 4xx)."""
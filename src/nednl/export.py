@@ -0,0 +1,286 @@
+"""Asynchronous Python client for National Energy Dashboard NL."""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import partial
+from typing import TYPE_CHECKING, Literal
+
+import orjson
+
+from .frame import UtilizationFrame
+from .util import split_date_range
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from concurrent.futures import Executor
+    from datetime import date
+    from pathlib import Path
+
+    from .models import UtilizationSeries
+    from .nednl import NedNL
+    from .util import Shard
+
+ExportFormat = Literal["csv", "jsonl", "parquet"]
+EXPORT_FORMATS: tuple[ExportFormat, ...] = ("csv", "jsonl", "parquet")
+
+
+@dataclass(slots=True)
+class ExportResult:
+    """Object representing the outcome of an export."""
+
+    rows: int = 0
+    files: int = 0
+
+
+def _iso(timestamp: int) -> str:
+    """Format epoch seconds as an ISO 8601 UTC datetime."""
+    return datetime.fromtimestamp(timestamp, UTC).isoformat()
+
+
+def _rows(frame: UtilizationFrame) -> Iterable[list[object]]:
+    """Get the rows of a frame, with timestamps in ISO 8601."""
+    columns = [
+        map(_iso, getattr(frame, name))
+        if name in frame.TIMESTAMP_COLUMNS
+        else getattr(frame, name)
+        for name in frame.COLUMNS
+    ]
+    return map(list, zip(*columns, strict=True))
+
+
+def write_frame(frame: UtilizationFrame, path: Path, file_format: ExportFormat) -> None:
+    """Write a utilization frame to a file.
+
+    Args:
+    ----
+        frame: The utilizations to write.
+        path: The file to write, its directory is created when missing.
+        file_format: 'csv', 'jsonl' or 'parquet'.
+
+    Raises:
+    ------
+        ImportError: If parquet is requested and pyarrow is not installed.
+        ValueError: If the format is unknown.
+
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if file_format == "csv":
+        with path.open("w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(frame.COLUMNS)
+            writer.writerows(_rows(frame))
+    elif file_format == "jsonl":
+        with path.open("wb") as file:
+            file.writelines(
+                orjson.dumps(dict(zip(frame.COLUMNS, row, strict=True))) + b"\n"
+                for row in _rows(frame)
+            )
+    elif file_format == "parquet":
+        try:
+            import pyarrow as pa  # noqa: PLC0415, pylint: disable=import-outside-toplevel
+            from pyarrow import (  # noqa: PLC0415, pylint: disable=import-outside-toplevel
+                parquet,
+            )
+        except ImportError as exception:
+            msg = "Writing parquet requires the pyarrow package."
+            raise ImportError(msg) from exception
+
+        timestamp = pa.timestamp("s", tz="UTC")
+        table = pa.table(
+            {
+                name: pa.array(getattr(frame, name)).cast(timestamp)
+                if name in frame.TIMESTAMP_COLUMNS
+                else pa.array(getattr(frame, name))
+                for name in frame.COLUMNS
+            }
+        )
+        parquet.write_table(table, path)
+    else:
+        msg = f"Unknown export format: {file_format}"
+        raise ValueError(msg)
+
+
+def export_page(
+    body: bytes,
+    path: Path,
+    file_format: ExportFormat,
+) -> tuple[int, str | None]:
+    """Decode a raw utilizations page and write it to a file.
+
+    This is the CPU bound part of an export, and runs in a worker process
+    when the export uses a process pool.
+
+    Args:
+    ----
+        body: The raw JSON body of the page.
+        path: The file to write.
+        file_format: 'csv', 'jsonl' or 'parquet'.
+
+    Returns:
+    -------
+        The number of rows written, and the link to the next page if any.
+
+    """
+    document = orjson.loads(body)
+    frame = UtilizationFrame.from_records(document["hydra:member"])
+    write_frame(frame, path, file_format)
+    view = document.get("hydra:view") or {}
+    return len(frame), view.get("hydra:next")
+
+
+def series_directory(output: Path, series: UtilizationSeries) -> Path:
+    """Get the directory of the files of a series.
+
+    The directories are named as Hive partitions (for example 'point=0'),
+    so the export can be read as a single partitioned dataset.
+
+    Args:
+    ----
+        output: The directory of the export.
+        series: The series to get the directory of.
+
+    Returns:
+    -------
+        The directory of the series.
+
+    """
+    names = {
+        "point": series.point_id,
+        "type": series.type_id,
+        "granularity": series.granularity_id,
+        "granularity_timezone": series.granularity_timezone_id,
+        "classification": series.classification_id,
+        "activity": series.activity_id,
+    }
+    return output.joinpath(*(f"{name}={value}" for name, value in names.items()))
+
+
+async def _export_shard(  # noqa: PLR0913, pylint: disable=too-many-arguments
+    client: NedNL,
+    series: UtilizationSeries,
+    shard_start: date,
+    shard_end: date,
+    *,
+    directory: Path,
+    file_format: ExportFormat,
+    items_per_page: int | None,
+    executor: Executor | None,
+    result: ExportResult,
+) -> None:
+    """Export all pages of a shard of a series, each to its own part file.
+
+    Args:
+    ----
+        client: The client to download the pages with.
+        series: The series to export.
+        shard_start: The start of the shard (inclusive).
+        shard_end: The end of the shard (exclusive).
+        directory: The directory of the files of the series.
+        file_format: 'csv', 'jsonl' or 'parquet'.
+        items_per_page: The number of items to request per page.
+        executor: Executor to decode and write the pages in, or None to do
+            so in the event loop.
+        result: The outcome of the export, updated with the written pages.
+
+    """
+    next_page: str | None = None
+    page = 1
+    while True:
+        body = await client.utilization_page(
+            series,
+            start_date=shard_start.isoformat(),
+            end_date=shard_end.isoformat(),
+            items_per_page=items_per_page,
+            next_page=next_page,
+        )
+        path = directory / f"part-{shard_start}-{page:04d}.{file_format}"
+        write = partial(export_page, body, path, file_format)
+        if executor is None:
+            rows, next_page = write()
+        else:
+            rows, next_page = await asyncio.get_running_loop().run_in_executor(
+                executor, write
+            )
+        result.rows += rows
+        result.files += 1
+        if next_page is None:
+            return
+        page += 1
+
+
+async def export_utilizations(  # noqa: PLR0913, pylint: disable=too-many-arguments
+    client: NedNL,
+    series: Iterable[UtilizationSeries],
+    *,
+    start_date: date,
+    end_date: date,
+    output: Path,
+    file_format: ExportFormat = "csv",
+    shard: Shard = "month",
+    max_concurrency: int = 8,
+    items_per_page: int | None = None,
+    executor: Executor | None = None,
+) -> ExportResult:
+    """Export the utilizations of many series to files.
+
+    Every series is split in shards, which are downloaded concurrently with at
+    most `max_concurrency` shards in flight. Each page is written to its own
+    part file, in a directory per series (see `series_directory`). Pages are
+    decoded and written by the executor when given, such as a process pool,
+    so parsing is not limited to the single core running the event loop.
+
+    Args:
+    ----
+        client: The client to download the pages with, including its rate
+            limiter and retry policy.
+        series: The series to export.
+        start_date: The start of the period (inclusive).
+        end_date: The end of the period (exclusive).
+        output: The directory to write the files to.
+        file_format: 'csv', 'jsonl' or 'parquet'.
+        shard: The size of the shards: 'day', 'week', 'month' or 'year'.
+        max_concurrency: The maximum number of shards downloaded in parallel.
+        items_per_page: The number of items to request per page.
+        executor: Executor to decode and write the pages in, or None to do
+            so in the event loop.
+
+    Returns:
+    -------
+        The number of rows and files written.
+
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    result = ExportResult()
+
+    async def export_shard(
+        item: UtilizationSeries, shard_start: date, shard_end: date
+    ) -> None:
+        async with semaphore:
+            await _export_shard(
+                client,
+                item,
+                shard_start,
+                shard_end,
+                directory=series_directory(output, item),
+                file_format=file_format,
+                items_per_page=items_per_page,
+                executor=executor,
+                result=result,
+            )
+
+    tasks = [
+        asyncio.create_task(export_shard(item, shard_start, shard_end))
+        for item in dict.fromkeys(series)
+        for shard_start, shard_end in split_date_range(start_date, end_date, shard)
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    return result
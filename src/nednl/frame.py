@@ -0,0 +1,387 @@
+"""Asynchronous Python client for National Energy Dashboard NL."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass, field, fields
+from datetime import UTC, datetime
+from itertools import islice
+from operator import le, mul
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, overload
+
+import orjson
+
+from .decoder import decode_timestamps
+from .models import Granularity, GranularityTimezone, Utilization
+from .util import floor_slot, next_slot
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from .util import GranularityName
+
+Column = Literal[
+    "id",
+    "capacity",
+    "volume",
+    "percentage",
+    "emission",
+    "emission_factor",
+    "valid_from",
+    "valid_to",
+    "last_update",
+]
+
+
+def _int_column() -> array[int]:
+    return array("q")
+
+
+def _float_column() -> array[float]:
+    return array("d")
+
+
+def _timestamp(value: datetime) -> int:
+    """Convert a datetime to epoch seconds."""
+    return int(value.timestamp())
+
+
+@dataclass(slots=True)
+class UtilizationFrame:
+    """Columnar utilization data, ordered by valid from.
+
+    Every column is a compact `array`, timestamps are stored as epoch seconds.
+    Compared to a list of `Utilization` objects this needs a fraction of the
+    memory, while rows can still be converted back on demand.
+    """
+
+    COLUMNS: ClassVar[tuple[str, ...]] = (
+        "id",
+        "capacity",
+        "volume",
+        "percentage",
+        "emission",
+        "emission_factor",
+        "valid_from",
+        "valid_to",
+        "last_update",
+    )
+    TIMESTAMP_COLUMNS: ClassVar[frozenset[str]] = frozenset(
+        {"valid_from", "valid_to", "last_update"}
+    )
+
+    id: array[int] = field(default_factory=_int_column)  # noqa: A003, RUF100
+    capacity: array[int] = field(default_factory=_int_column)
+    volume: array[int] = field(default_factory=_int_column)
+    percentage: array[float] = field(default_factory=_float_column)
+    emission: array[int] = field(default_factory=_int_column)
+    emission_factor: array[float] = field(default_factory=_float_column)
+    valid_from: array[int] = field(default_factory=_int_column)
+    valid_to: array[int] = field(default_factory=_int_column)
+    last_update: array[int] = field(default_factory=_int_column)
+
+    @classmethod
+    def from_records(cls, records: list[dict[str, Any]]) -> UtilizationFrame:
+        """Create a frame from raw utilization records of the API.
+
+        Args:
+        ----
+            records: The 'hydra:member' items of a utilizations response.
+
+        Returns:
+        -------
+            The utilization frame.
+
+        """
+        valid_from, valid_to, last_update = decode_timestamps(
+            records, "validfrom", "validto", "lastupdate"
+        )
+        return cls(
+            id=array("q", [record["id"] for record in records]),
+            capacity=array("q", [record["capacity"] for record in records]),
+            volume=array("q", [record["volume"] for record in records]),
+            percentage=array("d", [float(record["percentage"]) for record in records]),
+            emission=array("q", [record["emission"] for record in records]),
+            emission_factor=array(
+                "d", [float(record["emissionfactor"]) for record in records]
+            ),
+            valid_from=array("q", valid_from),
+            valid_to=array("q", valid_to),
+            last_update=array("q", last_update),
+        ).sorted()
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> UtilizationFrame:
+        """Create a frame from a raw utilizations response body.
+
+        Args:
+        ----
+            data: The JSON body of a utilizations response.
+
+        Returns:
+        -------
+            The utilization frame.
+
+        """
+        return cls.from_records(orjson.loads(data)["hydra:member"])
+
+    @classmethod
+    def from_utilizations(cls, utilizations: Iterable[Utilization]) -> UtilizationFrame:
+        """Create a frame from utilization objects.
+
+        Args:
+        ----
+            utilizations: The utilizations to store.
+
+        Returns:
+        -------
+            The utilization frame.
+
+        """
+        frame = cls()
+        for utilization in utilizations:
+            for name in cls.COLUMNS:
+                value = getattr(utilization, name)
+                getattr(frame, name).append(
+                    _timestamp(value) if name in cls.TIMESTAMP_COLUMNS else value
+                )
+        return frame.sorted()
+
+    @classmethod
+    def concat(cls, frames: Iterable[UtilizationFrame]) -> UtilizationFrame:
+        """Combine multiple frames into one.
+
+        Args:
+        ----
+            frames: The frames to combine.
+
+        Returns:
+        -------
+            A frame with the rows of all frames.
+
+        """
+        result = cls()
+        for frame in frames:
+            for name in cls.COLUMNS:
+                getattr(result, name).extend(getattr(frame, name))
+        return result.sorted()
+
+    def unique(self) -> UtilizationFrame:
+        """Get the frame with every id only once.
+
+        Returns
+        -------
+            This frame if no id repeats, otherwise a copy with the first row
+            of every id.
+
+        """
+        first: dict[int, int] = {}
+        for index, row_id in enumerate(self.id):
+            first.setdefault(row_id, index)
+        if len(first) == len(self):
+            return self
+        return self._take(sorted(first.values()))
+
+    def sorted(self) -> UtilizationFrame:
+        """Get the frame ordered by valid from.
+
+        Returns
+        -------
+            This frame if already ordered, otherwise an ordered copy.
+
+        """
+        valid_from = self.valid_from
+        if all(map(le, valid_from, islice(valid_from, 1, None))):
+            return self
+        order = sorted(range(len(valid_from)), key=valid_from.__getitem__)
+        return self._take(order)
+
+    def _take(self, indices: Iterable[int]) -> UtilizationFrame:
+        """Get a new frame with the rows at the given indices."""
+        indices = list(indices)
+        return UtilizationFrame(
+            **{
+                column.name: array(
+                    getattr(self, column.name).typecode,
+                    map(getattr(self, column.name).__getitem__, indices),
+                )
+                for column in fields(self)
+            }
+        )
+
+    def __len__(self) -> int:
+        """Get the number of rows."""
+        return len(self.id)
+
+    @overload
+    def __getitem__(self, index: int) -> Utilization: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> UtilizationFrame: ...
+
+    def __getitem__(self, index: int | slice) -> Utilization | UtilizationFrame:
+        """Get a single row as utilization, or a slice of rows as frame."""
+        if isinstance(index, slice):
+            return UtilizationFrame(
+                **{
+                    column.name: getattr(self, column.name)[index]
+                    for column in fields(self)
+                }
+            )
+        return Utilization(
+            id=self.id[index],
+            capacity=self.capacity[index],
+            volume=self.volume[index],
+            percentage=self.percentage[index],
+            emission=self.emission[index],
+            emission_factor=self.emission_factor[index],
+            valid_from=datetime.fromtimestamp(self.valid_from[index], UTC),
+            valid_to=datetime.fromtimestamp(self.valid_to[index], UTC),
+            last_update=datetime.fromtimestamp(self.last_update[index], UTC),
+        )
+
+    def __iter__(self) -> Iterator[Utilization]:
+        """Iterate over the rows as utilizations."""
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_utilizations(self) -> list[Utilization]:
+        """Convert the rows back to utilization objects.
+
+        Returns
+        -------
+            List of utilizations.
+
+        """
+        return list(self)
+
+    def between(self, start: datetime, end: datetime) -> UtilizationFrame:
+        """Get the rows valid from within a period.
+
+        Args:
+        ----
+            start: The start of the period (inclusive).
+            end: The end of the period (exclusive).
+
+        Returns:
+        -------
+            A frame with the rows in the period.
+
+        """
+        lower = bisect_left(self.valid_from, _timestamp(start))
+        upper = bisect_left(self.valid_from, _timestamp(end))
+        return self[lower:upper]
+
+    def sum(self, column: Column) -> float:
+        """Get the sum of a column.
+
+        Args:
+        ----
+            column: The name of the column.
+
+        Returns:
+        -------
+            The sum of all values in the column.
+
+        """
+        total: float = sum(getattr(self, column))
+        return total
+
+    def mean(self, column: Column) -> float | None:
+        """Get the mean of a column.
+
+        Args:
+        ----
+            column: The name of the column.
+
+        Returns:
+        -------
+            The mean of the values in the column, or None if the frame is empty.
+
+        """
+        if not self:
+            return None
+        return self.sum(column) / len(self)
+
+    def min(self, column: Column) -> float | None:
+        """Get the minimum of a column.
+
+        Args:
+        ----
+            column: The name of the column.
+
+        Returns:
+        -------
+            The smallest value in the column, or None if the frame is empty.
+
+        """
+        return min(getattr(self, column), default=None)
+
+    def max(self, column: Column) -> float | None:
+        """Get the maximum of a column.
+
+        Args:
+        ----
+            column: The name of the column.
+
+        Returns:
+        -------
+            The largest value in the column, or None if the frame is empty.
+
+        """
+        return max(getattr(self, column), default=None)
+
+    def resample(
+        self,
+        granularity: Granularity | GranularityName | str,
+        timezone: GranularityTimezone | str = "UTC",
+    ) -> UtilizationFrame:
+        """Aggregate the rows to a coarser granularity.
+
+        Volume and emission are summed, capacity and percentage averaged, and
+        the emission factor is weighted by volume. Days, months and years
+        start at midnight in the given timezone, so a day can last 23 or 25
+        hours when daylight saving time changes. Empty slots are left out.
+
+        Args:
+        ----
+            granularity: The granularity to aggregate to, for example 'Hour'.
+            timezone: The granularity timezone, for example 'Europe/Amsterdam'.
+
+        Returns:
+        -------
+            A frame with one row per slot. The id of these rows is 0, as they
+            do not exist in the API, and the capacity is rounded.
+
+        """
+        name = granularity.name if isinstance(granularity, Granularity) else granularity
+        zone = timezone.name if isinstance(timezone, GranularityTimezone) else timezone
+        result = UtilizationFrame()
+        valid_from = self.valid_from
+        lower = 0
+        while lower < len(valid_from):
+            start = floor_slot(
+                datetime.fromtimestamp(valid_from[lower], UTC), name, zone
+            )
+            end = _timestamp(next_slot(start, name, zone))
+            upper = bisect_left(valid_from, end, lower)
+            rows = upper - lower
+            volume = self.volume[lower:upper]
+            emission_factor = self.emission_factor[lower:upper]
+            total_volume = sum(volume)
+            result.id.append(0)
+            result.capacity.append(round(sum(self.capacity[lower:upper]) / rows))
+            result.volume.append(total_volume)
+            result.percentage.append(sum(self.percentage[lower:upper]) / rows)
+            result.emission.append(sum(self.emission[lower:upper]))
+            result.emission_factor.append(
+                sum(map(mul, emission_factor, volume)) / total_volume
+                if total_volume
+                else sum(emission_factor) / rows
+            )
+            result.valid_from.append(_timestamp(start))
+            result.valid_to.append(end)
+            result.last_update.append(max(self.last_update[lower:upper]))
+            lower = upper
+        return result
@@ -0,0 +1,340 @@
+"""Asynchronous Python client for National Energy Dashboard NL."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal, Protocol
+
+from aiohttp import TraceConfig
+
+if TYPE_CHECKING:
+    from types import SimpleNamespace
+
+    from aiohttp import (
+        ClientSession,
+        TraceConnectionCreateEndParams,
+        TraceConnectionCreateStartParams,
+        TraceConnectionQueuedEndParams,
+        TraceConnectionQueuedStartParams,
+        TraceDnsResolveHostEndParams,
+        TraceDnsResolveHostStartParams,
+        TraceRequestEndParams,
+        TraceRequestStartParams,
+    )
+
+CacheOutcome = Literal["hit", "miss", "revalidated", "coalesced"]
+
+
+@dataclass(slots=True)
+class RequestMetrics:
+    """Object representing the measurements of a single API request.
+
+    Durations are in seconds, and None when the phase did not take place (for
+    example no DNS lookup for a reused connection). The connection timings
+    come from aiohttp tracing, and are only available when the session was
+    created by NedNL while it had hooks, or uses `create_trace_config`. Hooks
+    added after NedNL created its session get no connection timings. The
+    connect time includes the TLS handshake, as aiohttp does not report it
+    separately. With adaptive concurrency, `concurrency_limit` is the limit
+    after the request finished.
+    """
+
+    method: str
+    endpoint: str
+    params: dict[str, Any]
+    status: int | None = None
+    attempts: int = 0
+    cache: CacheOutcome | None = None
+    rate_limit_wait: float | None = None
+    concurrency_wait: float | None = None
+    concurrency_limit: int | None = None
+    queued: float | None = None
+    dns: float | None = None
+    connect: float | None = None
+    ttfb: float | None = None
+    body: float | None = None
+    bytes_received: int = 0
+    parse_time: float | None = None
+    total: float | None = None
+    error: BaseException | None = None
+
+    _started: dict[str, float] = field(default_factory=dict, repr=False)
+
+    def start(self, phase: str) -> None:
+        """Mark the start of a phase."""
+        self._started[phase] = time.perf_counter()
+
+    def stop(self, phase: str) -> float | None:
+        """Get the duration of a phase that was started, if any."""
+        started = self._started.pop(phase, None)
+        if started is None:
+            return None
+        return time.perf_counter() - started
+
+
+class RequestHook(Protocol):  # pylint: disable=too-few-public-methods
+    """Callback that receives the metrics of every finished request."""
+
+    def __call__(self, metrics: RequestMetrics, /) -> None:
+        """Handle the metrics of a finished request."""
+
+
+def _metrics(trace_config_ctx: SimpleNamespace) -> RequestMetrics | None:
+    """Get the metrics of a traced request, if it is measured."""
+    metrics = trace_config_ctx.trace_request_ctx
+    return metrics if isinstance(metrics, RequestMetrics) else None
+
+
+async def _on_request_start(
+    _session: ClientSession,
+    trace_config_ctx: SimpleNamespace,
+    _params: TraceRequestStartParams,
+) -> None:
+    if metrics := _metrics(trace_config_ctx):
+        metrics.start("ttfb")
+
+
+async def _on_request_end(
+    _session: ClientSession,
+    trace_config_ctx: SimpleNamespace,
+    _params: TraceRequestEndParams,
+) -> None:
+    if metrics := _metrics(trace_config_ctx):
+        metrics.ttfb = metrics.stop("ttfb")
+
+
+async def _on_connection_queued_start(
+    _session: ClientSession,
+    trace_config_ctx: SimpleNamespace,
+    _params: TraceConnectionQueuedStartParams,
+) -> None:
+    if metrics := _metrics(trace_config_ctx):
+        metrics.start("queued")
+
+
+async def _on_connection_queued_end(
+    _session: ClientSession,
+    trace_config_ctx: SimpleNamespace,
+    _params: TraceConnectionQueuedEndParams,
+) -> None:
+    if metrics := _metrics(trace_config_ctx):
+        metrics.queued = metrics.stop("queued")
+
+
+async def _on_connection_create_start(
+    _session: ClientSession,
+    trace_config_ctx: SimpleNamespace,
+    _params: TraceConnectionCreateStartParams,
+) -> None:
+    if metrics := _metrics(trace_config_ctx):
+        metrics.start("connect")
+
+
+async def _on_connection_create_end(
+    _session: ClientSession,
+    trace_config_ctx: SimpleNamespace,
+    _params: TraceConnectionCreateEndParams,
+) -> None:
+    if metrics := _metrics(trace_config_ctx):
+        metrics.connect = metrics.stop("connect")
+
+
+async def _on_dns_resolvehost_start(
+    _session: ClientSession,
+    trace_config_ctx: SimpleNamespace,
+    _params: TraceDnsResolveHostStartParams,
+) -> None:
+    if metrics := _metrics(trace_config_ctx):
+        metrics.start("dns")
+
+
+async def _on_dns_resolvehost_end(
+    _session: ClientSession,
+    trace_config_ctx: SimpleNamespace,
+    _params: TraceDnsResolveHostEndParams,
+) -> None:
+    if metrics := _metrics(trace_config_ctx):
+        metrics.dns = metrics.stop("dns")
+
+
+def create_trace_config() -> TraceConfig:
+    """Create an aiohttp trace config that fills in the request metrics.
+
+    NedNL adds it to the session it creates itself. Pass it in the
+    `trace_configs` of your own session to get the same timings.
+
+    Returns
+    -------
+        The trace config.
+
+    """
+    trace_config = TraceConfig()
+    trace_config.on_request_start.append(_on_request_start)
+    trace_config.on_request_end.append(_on_request_end)
+    trace_config.on_connection_queued_start.append(_on_connection_queued_start)
+    trace_config.on_connection_queued_end.append(_on_connection_queued_end)
+    trace_config.on_connection_create_start.append(_on_connection_create_start)
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    trace_config.on_dns_resolvehost_start.append(_on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(_on_dns_resolvehost_end)
+    return trace_config
+
+
+_DURATIONS = (
+    "rate_limit_wait",
+    "concurrency_wait",
+    "queued",
+    "dns",
+    "connect",
+    "ttfb",
+    "body",
+    "parse_time",
+    "total",
+)
+
+
+def _labels(metrics: RequestMetrics) -> dict[str, str]:
+    """Get the labels to record the metrics of a request with."""
+    return {
+        "endpoint": metrics.endpoint,
+        "status": str(metrics.status or 0),
+        "cache": metrics.cache or "none",
+    }
+
+
+@dataclass
+class OpenTelemetryHook:
+    """Request hook that records the metrics with an OpenTelemetry meter.
+
+    Only the meter API is used (histograms and counters), so any compatible
+    meter works and no OpenTelemetry package is required by this library.
+    """
+
+    meter: Any
+    prefix: str = "nednl"
+
+    _durations: Any = field(init=False)
+    _bytes: Any = field(init=False)
+    _requests: Any = field(init=False)
+    _retries: Any = field(init=False)
+    _concurrency_limit: Any = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Create the instruments."""
+        self._durations = self.meter.create_histogram(
+            f"{self.prefix}.request.duration",
+            unit="s",
+            description="Duration of the phases of NED NL API requests.",
+        )
+        self._bytes = self.meter.create_counter(
+            f"{self.prefix}.response.size",
+            unit="By",
+            description="Bytes received from the NED NL API.",
+        )
+        self._requests = self.meter.create_counter(
+            f"{self.prefix}.requests",
+            description="Requests to the NED NL API.",
+        )
+        self._retries = self.meter.create_counter(
+            f"{self.prefix}.retries",
+            description="Retried requests to the NED NL API.",
+        )
+        self._concurrency_limit = self.meter.create_gauge(
+            f"{self.prefix}.concurrency.limit",
+            description="Adaptive limit of NED NL API requests in flight.",
+        )
+
+    def __call__(self, metrics: RequestMetrics) -> None:
+        """Record the metrics of a finished request."""
+        labels = _labels(metrics)
+        for phase in _DURATIONS:
+            if (duration := getattr(metrics, phase)) is not None:
+                self._durations.record(duration, {**labels, "phase": phase})
+        self._bytes.add(metrics.bytes_received, labels)
+        self._requests.add(1, labels)
+        if metrics.attempts > 1:
+            self._retries.add(metrics.attempts - 1, labels)
+        if metrics.concurrency_limit is not None:
+            self._concurrency_limit.set(metrics.concurrency_limit)
+
+
+@dataclass
+class PrometheusHook:
+    """Request hook that records the metrics with the Prometheus client.
+
+    Requires the optional `prometheus_client` package.
+    """
+
+    registry: Any = None
+    prefix: str = "nednl"
+
+    _durations: Any = field(init=False)
+    _bytes: Any = field(init=False)
+    _requests: Any = field(init=False)
+    _retries: Any = field(init=False)
+    _concurrency_limit: Any = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Create the metrics.
+
+        Raises
+        ------
+            ImportError: If the Prometheus client is not installed.
+
+        """
+        try:
+            from prometheus_client import (  # noqa: PLC0415, pylint: disable=import-outside-toplevel
+                REGISTRY,
+                Counter,
+                Gauge,
+                Histogram,
+            )
+        except ImportError as exception:
+            msg = "The Prometheus hook requires the prometheus_client package."
+            raise ImportError(msg) from exception
+
+        registry = self.registry or REGISTRY
+        labels = ("endpoint", "status", "cache")
+        self._durations = Histogram(
+            f"{self.prefix}_request_duration_seconds",
+            "Duration of the phases of NED NL API requests.",
+            (*labels, "phase"),
+            registry=registry,
+        )
+        self._bytes = Counter(
+            f"{self.prefix}_response_bytes",
+            "Bytes received from the NED NL API.",
+            labels,
+            registry=registry,
+        )
+        self._requests = Counter(
+            f"{self.prefix}_requests",
+            "Requests to the NED NL API.",
+            labels,
+            registry=registry,
+        )
+        self._retries = Counter(
+            f"{self.prefix}_retries",
+            "Retried requests to the NED NL API.",
+            labels,
+            registry=registry,
+        )
+        self._concurrency_limit = Gauge(
+            f"{self.prefix}_concurrency_limit",
+            "Adaptive limit of NED NL API requests in flight.",
+            registry=registry,
+        )
+
+    def __call__(self, metrics: RequestMetrics) -> None:
+        """Record the metrics of a finished request."""
+        labels = _labels(metrics)
+        for phase in _DURATIONS:
+            if (duration := getattr(metrics, phase)) is not None:
+                self._durations.labels(**labels, phase=phase).observe(duration)
+        self._bytes.labels(**labels).inc(metrics.bytes_received)
+        self._requests.labels(**labels).inc()
+        if metrics.attempts > 1:
+            self._retries.labels(**labels).inc(metrics.attempts - 1)
+        if metrics.concurrency_limit is not None:
+            self._concurrency_limit.set(metrics.concurrency_limit)
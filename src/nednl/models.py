@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime
 
 from mashumaro import field_options
 from mashumaro.config import BaseConfig
@@ -22,12 +22,30 @@ class NedDataMixin(DataClassDictMixin):
         serialize_by_alias = True
 
 
+@dataclass(slots=True)
+class HydraView(NedDataMixin, DataClassORJSONMixin):
+    """Object representing the pagination view of a Hydra collection."""
+
+    id: str = field(metadata=field_options(alias="@id"))  # noqa: A003, RUF100
+    first: str | None = field(default=None, metadata=field_options(alias="hydra:first"))
+    last: str | None = field(default=None, metadata=field_options(alias="hydra:last"))
+    previous: str | None = field(
+        default=None, metadata=field_options(alias="hydra:previous")
+    )
+    next: str | None = field(  # noqa: A003, RUF100
+        default=None, metadata=field_options(alias="hydra:next")
+    )
+
+
 @dataclass
 class BaseResponse[ResultDataT](NedDataMixin, DataClassORJSONMixin):
     """Base object representing the API response."""
 
     data: ResultDataT = field(metadata=field_options(alias="hydra:member"))
     items: int = field(metadata=field_options(alias="hydra:totalItems"))
+    view: HydraView | None = field(
+        default=None, metadata=field_options(alias="hydra:view")
+    )
 
 
 @dataclass(slots=True)
@@ -95,6 +113,98 @@ class Utilization(NedDataMixin, DataClassORJSONMixin):
     last_update: datetime = field(metadata=field_options(alias="lastupdate"))
 
 
+@dataclass(slots=True)
+class CompactUtilization:
+    """Lightweight utilization, with the timestamps stored as epoch seconds.
+
+    Has the same fields as `Utilization`, but the timestamps are only
+    converted to (UTC) datetimes when they are accessed. Use the raw
+    timestamp fields to sort or bucket rows without any conversion.
+    """
+
+    id: int  # noqa: A003, RUF100
+    capacity: int
+    volume: int
+    percentage: float
+    emission: int
+    emission_factor: float
+    valid_from_timestamp: int
+    valid_to_timestamp: int
+    last_update_timestamp: int
+
+    @property
+    def valid_from(self) -> datetime:
+        """Get the start of the period the utilization applies to."""
+        return datetime.fromtimestamp(self.valid_from_timestamp, UTC)
+
+    @property
+    def valid_to(self) -> datetime:
+        """Get the end of the period the utilization applies to."""
+        return datetime.fromtimestamp(self.valid_to_timestamp, UTC)
+
+    @property
+    def last_update(self) -> datetime:
+        """Get the moment the utilization was last updated."""
+        return datetime.fromtimestamp(self.last_update_timestamp, UTC)
+
+    @classmethod
+    def from_utilization(cls, utilization: Utilization) -> CompactUtilization:
+        """Create a compact utilization from a regular utilization.
+
+        Args:
+        ----
+            utilization: The utilization to convert.
+
+        Returns:
+        -------
+            The compact utilization.
+
+        """
+        return cls(
+            id=utilization.id,
+            capacity=utilization.capacity,
+            volume=utilization.volume,
+            percentage=utilization.percentage,
+            emission=utilization.emission,
+            emission_factor=utilization.emission_factor,
+            valid_from_timestamp=int(utilization.valid_from.timestamp()),
+            valid_to_timestamp=int(utilization.valid_to.timestamp()),
+            last_update_timestamp=int(utilization.last_update.timestamp()),
+        )
+
+    def to_utilization(self) -> Utilization:
+        """Convert to a regular utilization.
+
+        Returns
+        -------
+            The utilization, with the timestamps as UTC datetimes.
+
+        """
+        return Utilization(
+            id=self.id,
+            capacity=self.capacity,
+            volume=self.volume,
+            percentage=self.percentage,
+            emission=self.emission,
+            emission_factor=self.emission_factor,
+            valid_from=self.valid_from,
+            valid_to=self.valid_to,
+            last_update=self.last_update,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class UtilizationSeries:
+    """Object identifying a utilization series from National Energy Dashboard NL."""
+
+    point_id: int
+    type_id: int
+    granularity_id: int
+    granularity_timezone_id: int
+    classification_id: int
+    activity_id: int
+
+
 @dataclass(slots=True)
 class ActivitiesResponse(BaseResponse[list[Activity]]):
     """Object representing an Activities API response."""
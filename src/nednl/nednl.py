@@ -4,15 +4,48 @@ from __future__ import annotations
 
 import asyncio
 import json
+import logging
+import math
+import random
 import socket
-from dataclasses import dataclass
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field, replace
+from datetime import UTC, datetime, timedelta
+from email.utils import parsedate_to_datetime
+from functools import lru_cache, partial
+from http import HTTPStatus
 from importlib import metadata
-from typing import Any, Self
+from itertools import chain
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Literal, Self, overload
 
-from aiohttp import ClientError, ClientResponseError, ClientSession
-from aiohttp.hdrs import METH_GET
+import orjson
+from aiohttp import (
+    ClientError,
+    ClientResponse,
+    ClientResponseError,
+    ClientSession,
+    TCPConnector,
+)
+from aiohttp.hdrs import (
+    ETAG,
+    IF_MODIFIED_SINCE,
+    IF_NONE_MATCH,
+    LAST_MODIFIED,
+    METH_GET,
+    RETRY_AFTER,
+)
 from yarl import URL
 
+from .cache import CachedResponse
+from .catalog import NedCatalog
+from .decoder import (
+    decode_compact_utilization_records,
+    decode_compact_utilizations,
+    decode_utilization_records,
+    decode_utilizations,
+)
 from .exceptions import (
     NedNLAuthenticationError,
     NedNLClientError,
@@ -24,11 +57,14 @@ from .exceptions import (
     NedNLTimeoutError,
     NedNLValidationError,
 )
+from .frame import UtilizationFrame
+from .metrics import RequestMetrics, create_trace_config
 from .models import (
     ActivitiesResponse,
     Activity,
     Classification,
     ClassificationsResponse,
+    CompactUtilization,
     GranularitiesResponse,
     Granularity,
     GranularityTimezone,
@@ -38,10 +74,110 @@ from .models import (
     Type,
     TypesResponse,
     Utilization,
+    UtilizationSeries,
     UtilizationsResponse,
 )
+from .planner import plan_refetch
+from .stream import UtilizationStream
+from .sync import SyncState
+from .util import (
+    Shard,
+    floor_slot,
+    next_slot,
+    parse_datetime,
+    split_date_range,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import (
+        AsyncGenerator,
+        AsyncIterator,
+        Awaitable,
+        Callable,
+        Iterable,
+    )
+    from datetime import date
+
+    from .cache import ResponseCache, TTLCache
+    from .catalog import (
+        ActivityRef,
+        ClassificationRef,
+        GranularityRef,
+        GranularityTimezoneRef,
+        PointRef,
+        TypeRef,
+    )
+    from .concurrency import AdaptiveConcurrency
+    from .metrics import RequestHook
+    from .models import BaseResponse
+    from .ratelimit import RateLimiter
+    from .retry import RetryPolicy
+    from .store import UtilizationStore
+    from .sync import SyncResult
+
+_LOGGER = logging.getLogger(__name__)
 
 VERSION = metadata.version(__package__)
+BASE_URL = URL.build(scheme="https", host="api.ned.nl", path="/v1/")
+
+
+@lru_cache(maxsize=128)
+def _build_url(uri: str) -> URL:
+    """Build the full URL for a request URI.
+
+    Args:
+    ----
+        uri: Request URI, relative to '/v1/' or an absolute path.
+
+    Returns:
+    -------
+        The full URL of the request.
+
+    """
+    return BASE_URL.join(URL(uri))
+
+
+@lru_cache(maxsize=8)
+def _build_headers(api_key: str) -> dict[str, str]:
+    """Build the headers sent with every request.
+
+    Args:
+    ----
+        api_key: The API key to authenticate with.
+
+    Returns:
+    -------
+        The request headers. Shared between calls, so not to be modified.
+
+    """
+    return {
+        "Accept": "application/ld+json",
+        "User-Agent": f"python-nednl/{VERSION}",
+        "X-AUTH-TOKEN": api_key,
+    }
+
+
+def _merge_pages[T: (Utilization, CompactUtilization)](
+    pages: Iterable[list[T]],
+    key: Callable[[T], Any],
+) -> list[T]:
+    """Merge pages of utilizations, keeping the first row of every id.
+
+    Args:
+    ----
+        pages: The pages to merge.
+        key: Function to get the valid from of a utilization.
+
+    Returns:
+    -------
+        The utilizations of all pages, ordered by valid from.
+
+    """
+    utilizations: dict[int, T] = {}
+    for page in pages:
+        for utilization in page:
+            utilizations.setdefault(utilization.id, utilization)
+    return sorted(utilizations.values(), key=key)
 
 
 @dataclass
@@ -51,16 +187,32 @@ class NedNL:
     api_key: str
     request_timeout: float = 10.0
     session: ClientSession | None = None
+    rate_limiter: RateLimiter | None = None
+    retry_policy: RetryPolicy | None = None
+    cache: TTLCache | None = None
+    response_cache: ResponseCache | None = None
+    store: UtilizationStore | None = None
+    finalized_after: timedelta = timedelta(days=7)
+    coalesce_requests: bool = True
+    connection_limit: int = 100
+    connection_limit_per_host: int = 0
+    keepalive_timeout: float = 30.0
+    dns_cache_ttl: int = 300
+    keep_alive: bool = True
+    hooks: list[RequestHook] = field(default_factory=list)
+    catalog: NedCatalog | None = None
+    concurrency: AdaptiveConcurrency | None = None
 
     _close_session: bool = False
+    _inflight: dict[str, asyncio.Task[bytes]] = field(init=False, default_factory=dict)
 
     @staticmethod
-    def _parse_error_response(response_text: str, status: int) -> dict[str, Any]:
+    def _parse_error_response(response_body: bytes, status: int) -> dict[str, Any]:
         """Parse error response body as JSON.
 
         Args:
         ----
-            response_text: The response body text.
+            response_body: The raw response body.
             status: HTTP status code.
 
         Returns:
@@ -69,7 +221,9 @@ class NedNL:
 
         """
         try:
-            data: dict[str, Any] = json.loads(response_text)
+            data: dict[str, Any] = json.loads(
+                response_body.decode("utf-8", errors="replace")
+            )
         except json.JSONDecodeError:
             return {"message": f"HTTP {status} error"}
         else:
@@ -92,6 +246,31 @@ class NedNL:
             msg = f"Unexpected content type: {content_type}"
             raise NedNLError(msg)
 
+    @staticmethod
+    def _parse_retry_after(value: str | None) -> float | None:
+        """Parse the Retry-After header into a number of seconds.
+
+        Args:
+        ----
+            value: The Retry-After header value, in seconds or as an HTTP date.
+
+        Returns:
+        -------
+            Number of seconds to wait, or None if the header is missing or invalid.
+
+        """
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
     @staticmethod
     def _handle_http_error(
         exception: ClientResponseError,
@@ -117,7 +296,10 @@ class NedNL:
         if exception.status in (401, 403):
             raise NedNLAuthenticationError(error_data) from exception
         if exception.status == 429:
-            raise NedNLRateLimitError(error_data) from exception
+            retry_after = NedNL._parse_retry_after(
+                exception.headers.get(RETRY_AFTER) if exception.headers else None
+            )
+            raise NedNLRateLimitError(error_data, retry_after) from exception
         if exception.status == 400:
             raise NedNLValidationError(error_data) from exception
         if exception.status == 404:
@@ -132,18 +314,21 @@ class NedNL:
         *,
         method: str = METH_GET,
         params: dict[str, Any] | None = None,
-    ) -> Any:
+        metrics: RequestMetrics | None = None,
+    ) -> bytes:
         """Handle a request to the National Energy Dashboard NL API.
 
         Args:
         ----
-            uri: Request URI, without '/api/', for example, 'status'.
+            uri: Request URI, relative to '/v1/', for example, 'points'. Absolute
+                paths, such as Hydra pagination links, are used as is.
             method: HTTP method to use.
             params: Extra options to improve or limit the response.
+            metrics: The measurements to fill in, if the request is measured.
 
         Returns:
         -------
-            The response data from the API.
+            The raw response body from the API.
 
         Raises:
         ------
@@ -158,47 +343,455 @@ class NedNL:
             NedNLError: If an unexpected response is received from the API.
 
         """
-        url = URL.build(scheme="https", host="api.ned.nl", path="/v1/").join(URL(uri))
-
         if self.api_key is None or self.api_key == "":
             msg = "No API key provided."
             raise NedNLAuthenticationError(msg)
 
-        headers = {
-            "Accept": "application/ld+json",
-            "User-Agent": f"python-nednl/{VERSION}",
-            "X-AUTH-TOKEN": self.api_key,
+        url = _build_url(uri)
+        if method != METH_GET or not self.coalesce_requests:
+            return await self._execute(method, url, params, metrics)
+
+        # Identical requests in flight share a single response
+        key = self._cache_key(url, params)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._execute(method, url, params, metrics))
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._request_done, key))
+        elif metrics is not None:
+            metrics.cache = "coalesced"
+        return await asyncio.shield(task)
+
+    def _request_done(self, key: str, task: asyncio.Task[bytes]) -> None:
+        """Forget a finished in-flight request.
+
+        Args:
+        ----
+            key: The key of the request.
+            task: The finished request task.
+
+        """
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Retrieve the exception, in case all waiting callers were cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _execute(
+        self,
+        method: str,
+        url: URL,
+        params: dict[str, Any] | None,
+        metrics: RequestMetrics | None = None,
+    ) -> bytes:
+        """Execute a request, using the response cache and retry policy.
+
+        Args:
+        ----
+            method: HTTP method to use.
+            url: The full URL of the request.
+            params: Extra options to improve or limit the response.
+            metrics: The measurements to fill in, if the request is measured.
+
+        Returns:
+        -------
+            The response body.
+
+        """
+        response_cache = self.response_cache if method == METH_GET else None
+        cache_key = ""
+        cached: CachedResponse | None = None
+        headers: dict[str, str] = {}
+        if response_cache is not None:
+            cache_key = self._cache_key(url, params)
+            cached = await response_cache.get(cache_key)
+            if cached is not None:
+                if cached.final:
+                    if metrics is not None:
+                        metrics.cache = "hit"
+                    return cached.body
+                if cached.etag:
+                    headers[IF_NONE_MATCH] = cached.etag
+                if cached.last_modified:
+                    headers[IF_MODIFIED_SINCE] = cached.last_modified
+
+        response, body = await self._send_with_retry(
+            method, url, params=params, headers=headers, metrics=metrics
+        )
+        if cached is not None and response.status == HTTPStatus.NOT_MODIFIED:
+            if metrics is not None:
+                metrics.cache = "revalidated"
+            # The window may have become final since the response was cached
+            if response_cache is not None and self._is_finalized(url, params):
+                await response_cache.set(cache_key, replace(cached, final=True))
+            return cached.body
+        if response_cache is not None:
+            if metrics is not None:
+                metrics.cache = "miss"
+            entry = CachedResponse(
+                body=body,
+                etag=response.headers.get(ETAG),
+                last_modified=response.headers.get(LAST_MODIFIED),
+                final=self._is_finalized(url, params),
+            )
+            if entry.etag or entry.last_modified or entry.final:
+                await response_cache.set(cache_key, entry)
+        return body
+
+    async def _send_with_retry(  # noqa: PLR0913, pylint: disable=too-many-arguments
+        self,
+        method: str,
+        url: URL,
+        *,
+        params: dict[str, Any] | None,
+        headers: dict[str, str],
+        read_body: bool = True,
+        metrics: RequestMetrics | None = None,
+    ) -> tuple[ClientResponse, bytes]:
+        """Send a request, retrying failed attempts according to the retry policy.
+
+        Args:
+        ----
+            method: HTTP method to use.
+            url: The full URL of the request.
+            params: Extra options to improve or limit the response.
+            headers: Extra headers, such as conditional request headers.
+            read_body: Whether to read the body of a successful response.
+            metrics: The measurements to fill in, if the request is measured.
+
+        Returns:
+        -------
+            The response and its body.
+
+        """
+        attempt = 1
+        while True:
+            if metrics is not None:
+                metrics.attempts = attempt
+            await self._wait_for_rate_limit(metrics)
+            try:
+                return await self._send_in_slot(
+                    method,
+                    url,
+                    params=params,
+                    headers=headers,
+                    read_body=read_body,
+                    metrics=metrics,
+                )
+            except NedNLError as exception:
+                if self.retry_policy is None or not self.retry_policy.should_retry(
+                    exception, attempt
+                ):
+                    raise
+                await asyncio.sleep(self.retry_policy.delay(attempt, exception))
+                attempt += 1
+
+    async def _wait_for_rate_limit(self, metrics: RequestMetrics | None) -> None:
+        """Wait for the rate limiter, if any, before an attempt.
+
+        Args:
+        ----
+            metrics: The measurements to fill in, if the request is measured.
+
+        """
+        if self.rate_limiter is None:
+            return
+        if metrics is not None:
+            metrics.start("rate_limit_wait")
+        await self.rate_limiter.acquire()
+        if metrics is not None:
+            metrics.rate_limit_wait = metrics.stop("rate_limit_wait")
+
+    async def _send_in_slot(  # noqa: PLR0913, pylint: disable=too-many-arguments
+        self,
+        method: str,
+        url: URL,
+        *,
+        params: dict[str, Any] | None,
+        headers: dict[str, str],
+        read_body: bool,
+        metrics: RequestMetrics | None,
+    ) -> tuple[ClientResponse, bytes]:
+        """Send a request within the adaptive concurrency limit, if any.
+
+        The outcome of the request is reported to the controller, to adapt
+        the limit. Only the request itself is measured, waiting for the rate
+        limiter happens before.
+
+        Args:
+        ----
+            method: HTTP method to use.
+            url: The full URL of the request.
+            params: Extra options to improve or limit the response.
+            headers: Extra headers, such as conditional request headers.
+            read_body: Whether to read the body of a successful response.
+            metrics: The measurements to fill in, if the request is measured.
+
+        Returns:
+        -------
+            The response and its body.
+
+        """
+        concurrency = self.concurrency
+        if concurrency is None:
+            return await self._send(
+                method,
+                url,
+                params=params,
+                headers=headers,
+                read_body=read_body,
+                metrics=metrics,
+            )
+
+        if metrics is not None:
+            metrics.start("concurrency_wait")
+        started = await concurrency.acquire()
+        if metrics is not None:
+            metrics.concurrency_wait = metrics.stop("concurrency_wait")
+        failure: BaseException | None = None
+        try:
+            return await self._send(
+                method,
+                url,
+                params=params,
+                headers=headers,
+                read_body=read_body,
+                metrics=metrics,
+            )
+        except BaseException as exception:
+            failure = exception
+            raise
+        finally:
+            concurrency.release(started, failure)
+            if metrics is not None:
+                metrics.concurrency_limit = concurrency.limit
+
+    @staticmethod
+    def _cache_key(url: URL, params: dict[str, Any] | None) -> str:
+        """Build a response cache key from the URL and normalized parameters.
+
+        Args:
+        ----
+            url: The full URL of the request.
+            params: Extra options of the request.
+
+        Returns:
+        -------
+            The cache key.
+
+        """
+        query = {
+            **url.query,
+            **{key: str(value) for key, value in (params or {}).items()},
         }
+        return str(url.with_query(sorted(query.items())))
+
+    def _is_finalized(self, url: URL, params: dict[str, Any] | None) -> bool:
+        """Check whether a request covers a period that no longer changes.
+
+        A request is considered final when it filters on a valid from before a
+        moment that lies more than `finalized_after` in the past.
+
+        Args:
+        ----
+            url: The full URL of the request.
+            params: Extra options of the request.
+
+        Returns:
+        -------
+            True if the response can be served from cache without revalidation.
+
+        """
+        query = {**url.query, **(params or {})}
+        end = query.get("validfrom[strictly_before]") or query.get("validfrom[before]")
+        if end is None:
+            return False
+        try:
+            end_date = parse_datetime(str(end))
+        except ValueError:
+            return False
+        return end_date < datetime.now(UTC) - self.finalized_after
+
+    async def _send(  # noqa: PLR0913, pylint: disable=too-many-arguments
+        self,
+        method: str,
+        url: URL,
+        *,
+        params: dict[str, Any] | None,
+        headers: dict[str, str],
+        read_body: bool = True,
+        metrics: RequestMetrics | None = None,
+    ) -> tuple[ClientResponse, bytes]:
+        """Send a single request to the National Energy Dashboard NL API.
+
+        Args:
+        ----
+            method: HTTP method to use.
+            url: The full URL of the request.
+            params: Extra options to improve or limit the response.
+            headers: Extra headers, such as conditional request headers.
+            read_body: Whether to read the body of a successful response. When
+                disabled the body is left to be streamed by the caller, and an
+                empty body is returned.
+            metrics: The measurements to fill in, if the request is measured.
+                Timings and status describe the last attempt.
+
+        Returns:
+        -------
+            The response and its body.
 
+        Raises:
+        ------
+            NedNLTimeoutError: If the request times out.
+            NedNLConnectionError: If an error occurs while connecting to the API.
+
+        """
         if self.session is None:
-            self.session = ClientSession()
+            # aiohttp rejects a keepalive timeout for connections that are closed
+            connection_reuse: dict[str, Any] = (
+                {"keepalive_timeout": self.keepalive_timeout}
+                if self.keep_alive
+                else {"force_close": True}
+            )
+            self.session = ClientSession(
+                connector=TCPConnector(
+                    limit=self.connection_limit,
+                    limit_per_host=self.connection_limit_per_host,
+                    ttl_dns_cache=self.dns_cache_ttl,
+                    **connection_reuse,
+                ),
+                # Tracing costs a little per request, so only when measured.
+                # Hooks added later get no connection timings.
+                trace_configs=[create_trace_config()] if self.hooks else None,
+            )
             self._close_session = True
 
-        response_text: str
+        # Looked up per request, so a changed API key is used right away
+        base_headers = _build_headers(self.api_key)
+        response_body: bytes = b""
         try:
             async with asyncio.timeout(self.request_timeout):
                 response = await self.session.request(
                     method,
                     url,
                     params=params,
-                    headers=headers,
+                    headers={**base_headers, **headers} if headers else base_headers,
                     ssl=True,
+                    trace_request_ctx=metrics,
                 )
-                # Read response body before checking status
-                response_text = await response.text()
+                if metrics is not None:
+                    metrics.status = response.status
+                    metrics.start("body")
+                # Read response body before checking status, as raw bytes since
+                # the JSON parsers do not need a decoded string
+                if read_body or not response.ok:
+                    response_body = await response.read()
+                    if metrics is not None:
+                        metrics.body = metrics.stop("body")
+                        metrics.bytes_received = len(response_body)
                 response.raise_for_status()
         except TimeoutError as exception:
             msg = "Timeout occurred while connecting to NED NL API."
             raise NedNLTimeoutError(msg) from exception
         except ClientResponseError as exception:
-            error_data = self._parse_error_response(response_text, exception.status)
+            error_data = self._parse_error_response(response_body, exception.status)
             self._handle_http_error(exception, error_data)
         except (ClientError, socket.gaierror) as exception:
             msg = "Error occurred while communicating with NED NL API."
             raise NedNLConnectionError(msg) from exception
 
-        self._validate_content_type(response.headers.get("Content-Type", ""))
-        return response_text
+        if response.status != HTTPStatus.NOT_MODIFIED:
+            try:
+                self._validate_content_type(response.headers.get("Content-Type", ""))
+            except NedNLError:
+                response.release()
+                raise
+        return response, response_body
+
+    async def _fetch[T](
+        self,
+        uri: str,
+        decode: Callable[[bytes], T],
+        *,
+        params: dict[str, Any] | None = None,
+    ) -> T:
+        """Request and decode a response, reporting its metrics to the hooks.
+
+        Args:
+        ----
+            uri: Request URI, relative to '/v1/' or an absolute path.
+            decode: Function to decode the response body with.
+            params: Extra options to improve or limit the response.
+
+        Returns:
+        -------
+            The decoded response.
+
+        """
+        if not self.hooks:
+            return decode(await self._request(uri, params=params))
+
+        metrics = RequestMetrics(METH_GET, _build_url(uri).path, dict(params or {}))
+        started = time.perf_counter()
+        try:
+            body = await self._request(uri, params=params, metrics=metrics)
+            parse_started = time.perf_counter()
+            result = decode(body)
+            metrics.parse_time = time.perf_counter() - parse_started
+        except BaseException as exception:
+            metrics.error = exception
+            raise
+        finally:
+            metrics.total = time.perf_counter() - started
+            self._emit(metrics)
+        return result
+
+    def _emit(self, metrics: RequestMetrics) -> None:
+        """Report the metrics of a finished request to all hooks.
+
+        A hook that raises is logged and skipped, so it can not replace the
+        result or the error of the request.
+
+        Args:
+        ----
+            metrics: The measurements of the request.
+
+        """
+        for hook in self.hooks:
+            try:
+                hook(metrics)
+            except Exception:  # pylint: disable=broad-exception-caught
+                _LOGGER.exception("Error in request hook %r", hook)
+
+    async def _reference_data[T](
+        self,
+        uri: str,
+        response_type: type[BaseResponse[list[T]]],
+        params: dict[str, Any] | None = None,
+    ) -> list[T]:
+        """Get reference data, from the cache when enabled.
+
+        Args:
+        ----
+            uri: Request URI of the reference data, also used as cache key.
+            response_type: The response model to parse the data with.
+            params: Extra options to improve or limit the response.
+
+        Returns:
+        -------
+            List of reference data items.
+
+        """
+
+        async def fetch() -> list[T]:
+            return await self._fetch(
+                uri, lambda body: response_type.from_json(body).data, params=params
+            )
+
+        if self.cache is None:
+            return await fetch()
+        # Copy so callers cannot modify the cached list
+        return list(await self.cache.get_or_fetch(uri, fetch))
 
     async def all_activities(self) -> list[Activity]:
         """Get list of all activities.
@@ -208,8 +801,7 @@ class NedNL:
             List of all activities.
 
         """
-        response = await self._request("activities")
-        return ActivitiesResponse.from_json(response).data
+        return await self._reference_data("activities", ActivitiesResponse)
 
     async def all_classifications(self) -> list[Classification]:
         """Get list of all classifications.
@@ -219,8 +811,7 @@ class NedNL:
             List of all classifications.
 
         """
-        response = await self._request("classifications")
-        return ClassificationsResponse.from_json(response).data
+        return await self._reference_data("classifications", ClassificationsResponse)
 
     async def all_granularities(self) -> list[Granularity]:
         """Get list of all granularities.
@@ -230,8 +821,7 @@ class NedNL:
             List of all granularities.
 
         """
-        response = await self._request("granularities")
-        return GranularitiesResponse.from_json(response).data
+        return await self._reference_data("granularities", GranularitiesResponse)
 
     async def all_granularity_timezones(self) -> list[GranularityTimezone]:
         """Get list of all granularity timezones.
@@ -241,8 +831,9 @@ class NedNL:
             List of all granularity timezones.
 
         """
-        response = await self._request("granularity_time_zones")
-        return GranularityTimezonesResponse.from_json(response).data
+        return await self._reference_data(
+            "granularity_time_zones", GranularityTimezonesResponse
+        )
 
     async def all_points(self) -> list[Point]:
         """Get list of all area points.
@@ -252,8 +843,7 @@ class NedNL:
             List of all area points.
 
         """
-        response = await self._request("points")
-        return PointsResponse.from_json(response).data
+        return await self._reference_data("points", PointsResponse)
 
     async def all_types(self) -> list[Type]:
         """Get list of all types.
@@ -263,11 +853,113 @@ class NedNL:
             List of all types.
 
         """
-        response = await self._request("types", params={"itemsPerPage": 100})
-        return TypesResponse.from_json(response).data
+        return await self._reference_data(
+            "types", TypesResponse, params={"itemsPerPage": 100}
+        )
 
-    async def utilization(  # noqa: PLR0913, pylint: disable=too-many-arguments
+    async def load_catalog(self) -> NedCatalog:
+        """Load the reference data, to use names instead of ids.
+
+        The catalog is kept on the client, after which the utilization methods
+        accept names and shortnames. Set `catalog` instead to use a catalog
+        that was loaded before, for example restored with `from_json`.
+
+        Returns
+        -------
+            The catalog.
+
+        """
+        self.catalog = await NedCatalog.load(self)
+        return self.catalog
+
+    def _series(  # noqa: PLR0913, pylint: disable=too-many-arguments
+        self,
+        *,
+        point_id: PointRef,
+        type_id: TypeRef,
+        granularity_id: GranularityRef,
+        granularity_timezone_id: GranularityTimezoneRef,
+        classification_id: ClassificationRef,
+        activity_id: ActivityRef,
+    ) -> UtilizationSeries:
+        """Identify a series by ids, names or reference data.
+
+        Returns
+        -------
+            The series.
+
+        Raises
+        ------
+            ValueError: If a name is used without a catalog, or is unknown.
+
+        """
+        refs = (
+            point_id,
+            type_id,
+            granularity_id,
+            granularity_timezone_id,
+            classification_id,
+            activity_id,
+        )
+        if any(isinstance(ref, str) for ref in refs):
+            if self.catalog is None:
+                msg = "Names can only be used with a catalog, see load_catalog."
+                raise ValueError(msg)
+            return self.catalog.series(
+                point_id=point_id,
+                type_id=type_id,
+                granularity_id=granularity_id,
+                granularity_timezone_id=granularity_timezone_id,
+                classification_id=classification_id,
+                activity_id=activity_id,
+            )
+        return UtilizationSeries(
+            *(ref if isinstance(ref, int) else ref.id for ref in refs)  # type: ignore[union-attr]
+        )
+
+    def _series_params(  # noqa: PLR0913, pylint: disable=too-many-arguments
         self,
+        *,
+        point_id: PointRef,
+        type_id: TypeRef,
+        granularity_id: GranularityRef,
+        granularity_timezone_id: GranularityTimezoneRef,
+        classification_id: ClassificationRef,
+        activity_id: ActivityRef,
+        start_date: str,
+        end_date: str,
+        items_per_page: int | None = None,
+    ) -> dict[str, Any]:
+        """Build the query parameters for a series given by ids or names.
+
+        Returns
+        -------
+            Query parameters for the utilizations endpoint.
+
+        Raises
+        ------
+            ValueError: If a name is used without a catalog, or is unknown.
+
+        """
+        series = self._series(
+            point_id=point_id,
+            type_id=type_id,
+            granularity_id=granularity_id,
+            granularity_timezone_id=granularity_timezone_id,
+            classification_id=classification_id,
+            activity_id=activity_id,
+        )
+        params = self._utilization_params(
+            **asdict(series),
+            start_date=start_date,
+            end_date=end_date,
+        )
+        if items_per_page is not None:
+            params["itemsPerPage"] = items_per_page
+        return params
+
+    @staticmethod
+    def _utilization_params(  # noqa: PLR0913, pylint: disable=too-many-arguments
         *,
         point_id: int,
         type_id: int,
@@ -277,39 +969,1250 @@ class NedNL:
         activity_id: int,
         start_date: str,
         end_date: str,
-    ) -> list[Utilization]:
+        start_inclusive: bool = False,
+    ) -> dict[str, Any]:
+        """Build the query parameters for the utilizations endpoint.
+
+        Returns
+        -------
+            Query parameters for the utilizations endpoint.
+
+        """
+        start_filter = "after" if start_inclusive else "strictly_after"
+        return {
+            "point": point_id,
+            "type": type_id,
+            "granularity": granularity_id,
+            "granularitytimezone": granularity_timezone_id,
+            "classification": classification_id,
+            "activity": activity_id,
+            f"validfrom[{start_filter}]": start_date,
+            "validfrom[strictly_before]": end_date,
+        }
+
+    @overload
+    async def utilization(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        point_id: PointRef,
+        type_id: TypeRef,
+        granularity_id: GranularityRef,
+        granularity_timezone_id: GranularityTimezoneRef,
+        classification_id: ClassificationRef,
+        activity_id: ActivityRef,
+        start_date: str,
+        end_date: str,
+        as_frame: Literal[False] = False,
+        compact: Literal[False] = False,
+    ) -> list[Utilization]: ...
+
+    @overload
+    async def utilization(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        point_id: PointRef,
+        type_id: TypeRef,
+        granularity_id: GranularityRef,
+        granularity_timezone_id: GranularityTimezoneRef,
+        classification_id: ClassificationRef,
+        activity_id: ActivityRef,
+        start_date: str,
+        end_date: str,
+        as_frame: Literal[True],
+        compact: Literal[False] = False,
+    ) -> UtilizationFrame: ...
+
+    @overload
+    async def utilization(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        point_id: PointRef,
+        type_id: TypeRef,
+        granularity_id: GranularityRef,
+        granularity_timezone_id: GranularityTimezoneRef,
+        classification_id: ClassificationRef,
+        activity_id: ActivityRef,
+        start_date: str,
+        end_date: str,
+        as_frame: Literal[False] = False,
+        compact: Literal[True],
+    ) -> list[CompactUtilization]: ...
+
+    async def utilization(  # noqa: PLR0913, pylint: disable=too-many-arguments
+        self,
+        *,
+        point_id: PointRef,
+        type_id: TypeRef,
+        granularity_id: GranularityRef,
+        granularity_timezone_id: GranularityTimezoneRef,
+        classification_id: ClassificationRef,
+        activity_id: ActivityRef,
+        start_date: str,
+        end_date: str,
+        as_frame: bool = False,
+        compact: bool = False,
+    ) -> list[Utilization] | UtilizationFrame | list[CompactUtilization]:
         """Get utilization data for a specific point, granularity, and time.
 
+        Only the first page of the result is returned, use `iter_utilizations`
+        to retrieve all pages. The utilization store is not used, see
+        `backfill_utilizations` instead.
+
         Args:
         ----
-            point_id: The ID of the point.
-            type_id: The ID of the type.
-            granularity_id: The ID of the granularity.
-            granularity_timezone_id: The ID of the granularity timezone.
-            classification_id: The ID of the classification.
-            activity_id: The ID of the activity.
+            point_id: The ID, name or shortname of the point, or the point.
+            type_id: The ID, name or shortname of the type, or the type.
+            granularity_id: The ID or name of the granularity, or the granularity.
+            granularity_timezone_id: The ID or name of the granularity timezone,
+                or the granularity timezone.
+            classification_id: The ID or name of the classification, or the
+                classification.
+            activity_id: The ID or name of the activity, or the activity.
             start_date: The start date of the data.
             end_date: The end date of the data.
+            as_frame: Return the data as columnar frame instead of a list.
+            compact: Return compact utilizations, that keep the timestamps as
+                epoch seconds until they are accessed.
 
         Returns:
         -------
             Utilization data for the specific point, granularity, and time.
 
+        Raises:
+        ------
+            ValueError: If both a frame and compact utilizations are requested,
+                or a name is unknown or used without a catalog.
+
         """
-        response = await self._request(
-            "utilizations",
-            params={
-                "point": point_id,
-                "type": type_id,
-                "granularity": granularity_id,
-                "granularitytimezone": granularity_timezone_id,
-                "classification": classification_id,
-                "activity": activity_id,
-                "validfrom[strictly_after]": start_date,
-                "validfrom[strictly_before]": end_date,
-            },
+        if as_frame and compact:
+            msg = "A frame cannot be combined with compact utilizations."
+            raise ValueError(msg)
+        params = self._series_params(
+            point_id=point_id,
+            type_id=type_id,
+            granularity_id=granularity_id,
+            granularity_timezone_id=granularity_timezone_id,
+            classification_id=classification_id,
+            activity_id=activity_id,
+            start_date=start_date,
+            end_date=end_date,
         )
-        return UtilizationsResponse.from_json(response).data
+        if as_frame:
+            return await self._fetch(
+                "utilizations", UtilizationFrame.from_json, params=params
+            )
+        if compact:
+            return await self._fetch(
+                "utilizations", decode_compact_utilizations, params=params
+            )
+        return (
+            await self._fetch("utilizations", decode_utilizations, params=params)
+        ).data
+
+    async def iter_utilizations(  # noqa: PLR0913, pylint: disable=too-many-arguments
+        self,
+        *,
+        point_id: PointRef,
+        type_id: TypeRef,
+        granularity_id: GranularityRef,
+        granularity_timezone_id: GranularityTimezoneRef,
+        classification_id: ClassificationRef,
+        activity_id: ActivityRef,
+        start_date: str,
+        end_date: str,
+        items_per_page: int | None = None,
+        max_concurrency: int = 1,
+    ) -> AsyncIterator[Utilization]:
+        """Iterate over all utilization data, following the pagination links.
+
+        By default pages are fetched one at a time when the previous page has
+        been consumed, so only a single page is kept in memory. With a
+        `max_concurrency` above one, the remaining pages are requested in
+        parallel once the first page is known, while still yielding the
+        utilizations in page order.
+
+        Args:
+        ----
+            point_id: The ID, name or shortname of the point, or the point.
+            type_id: The ID, name or shortname of the type, or the type.
+            granularity_id: The ID or name of the granularity, or the granularity.
+            granularity_timezone_id: The ID or name of the granularity timezone,
+                or the granularity timezone.
+            classification_id: The ID or name of the classification, or the
+                classification.
+            activity_id: The ID or name of the activity, or the activity.
+            start_date: The start date of the data.
+            end_date: The end date of the data.
+            items_per_page: The number of items to request per page.
+            max_concurrency: The maximum number of pages requested in parallel.
+
+        Yields:
+        ------
+            Utilization data for the specific point, granularity, and time.
+
+        """
+        params = self._series_params(
+            point_id=point_id,
+            type_id=type_id,
+            granularity_id=granularity_id,
+            granularity_timezone_id=granularity_timezone_id,
+            classification_id=classification_id,
+            activity_id=activity_id,
+            start_date=start_date,
+            end_date=end_date,
+            items_per_page=items_per_page,
+        )
+        pages = (
+            self._iter_pages_concurrently("utilizations", params, max_concurrency)
+            if max_concurrency > 1
+            else self._iter_pages("utilizations", params)
+        )
+        async for page in pages:
+            for utilization in page.data:
+                yield utilization
+
+    def stream_utilizations(  # noqa: PLR0913, pylint: disable=too-many-arguments
+        self,
+        *,
+        point_id: PointRef,
+        type_id: TypeRef,
+        granularity_id: GranularityRef,
+        granularity_timezone_id: GranularityTimezoneRef,
+        classification_id: ClassificationRef,
+        activity_id: ActivityRef,
+        start_date: str,
+        end_date: str,
+        items_per_page: int | None = None,
+        chunk_size: int = 65536,
+    ) -> UtilizationStream:
+        """Get utilization data of a single page, decoded while it is received.
+
+        The response is read in chunks and every utilization is yielded as
+        soon as it is complete, so neither the full body nor all utilizations
+        are kept in memory at once. This is meant for very large page sizes.
+        The total number of items is available on the stream once it has been
+        received. Streamed responses bypass the response cache and are not
+        shared with identical requests.
+
+        Args:
+        ----
+            point_id: The ID, name or shortname of the point, or the point.
+            type_id: The ID, name or shortname of the type, or the type.
+            granularity_id: The ID or name of the granularity, or the granularity.
+            granularity_timezone_id: The ID or name of the granularity timezone,
+                or the granularity timezone.
+            classification_id: The ID or name of the classification, or the
+                classification.
+            activity_id: The ID or name of the activity, or the activity.
+            start_date: The start date of the data.
+            end_date: The end date of the data.
+            items_per_page: The number of items to request.
+            chunk_size: The maximum number of bytes to read at once.
+
+        Returns:
+        -------
+            Stream of utilization data for the specific point, granularity,
+            and time. The request is sent when iteration starts.
+
+        """
+        params = self._series_params(
+            point_id=point_id,
+            type_id=type_id,
+            granularity_id=granularity_id,
+            granularity_timezone_id=granularity_timezone_id,
+            classification_id=classification_id,
+            activity_id=activity_id,
+            start_date=start_date,
+            end_date=end_date,
+            items_per_page=items_per_page,
+        )
+        return UtilizationStream(self._iter_chunks("utilizations", params, chunk_size))
+
+    async def utilization_page(
+        self,
+        series: UtilizationSeries,
+        *,
+        start_date: str,
+        end_date: str,
+        items_per_page: int | None = None,
+        next_page: str | None = None,
+    ) -> bytes:
+        """Get a single page of utilization data as raw response body.
+
+        The body is not decoded, so it can be decoded elsewhere, for example
+        in another process. Like `backfill_utilizations`, the page includes
+        utilizations valid from the start date.
+
+        Args:
+        ----
+            series: The series to get the utilization data for.
+            start_date: The start date of the data (inclusive).
+            end_date: The end date of the data (exclusive).
+            items_per_page: The number of items to request per page.
+            next_page: The 'hydra:next' link of the previous page, to get the
+                page following it instead of the first page.
+
+        Returns:
+        -------
+            The raw JSON body of the page.
+
+        """
+        if next_page is not None:
+            # The next link already carries all query parameters
+            return await self._fetch(next_page, bytes)
+        params = self._utilization_params(
+            **asdict(series),
+            start_date=start_date,
+            end_date=end_date,
+            start_inclusive=True,
+        )
+        params["order[validfrom]"] = "asc"
+        if items_per_page is not None:
+            params["itemsPerPage"] = items_per_page
+        return await self._fetch("utilizations", bytes, params=params)
+
+    @overload
+    async def backfill_utilizations(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        point_id: PointRef,
+        type_id: TypeRef,
+        granularity_id: GranularityRef,
+        granularity_timezone_id: GranularityTimezoneRef,
+        classification_id: ClassificationRef,
+        activity_id: ActivityRef,
+        start_date: date,
+        end_date: date,
+        shard: Shard = "month",
+        max_concurrency: int = 4,
+        items_per_page: int | None = None,
+        as_frame: Literal[False] = False,
+        compact: Literal[False] = False,
+    ) -> list[Utilization]: ...
+
+    @overload
+    async def backfill_utilizations(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        point_id: PointRef,
+        type_id: TypeRef,
+        granularity_id: GranularityRef,
+        granularity_timezone_id: GranularityTimezoneRef,
+        classification_id: ClassificationRef,
+        activity_id: ActivityRef,
+        start_date: date,
+        end_date: date,
+        shard: Shard = "month",
+        max_concurrency: int = 4,
+        items_per_page: int | None = None,
+        as_frame: Literal[True],
+        compact: Literal[False] = False,
+    ) -> UtilizationFrame: ...
+
+    @overload
+    async def backfill_utilizations(  # pylint: disable=too-many-arguments
+        self,
+        *,
+        point_id: PointRef,
+        type_id: TypeRef,
+        granularity_id: GranularityRef,
+        granularity_timezone_id: GranularityTimezoneRef,
+        classification_id: ClassificationRef,
+        activity_id: ActivityRef,
+        start_date: date,
+        end_date: date,
+        shard: Shard = "month",
+        max_concurrency: int = 4,
+        items_per_page: int | None = None,
+        as_frame: Literal[False] = False,
+        compact: Literal[True],
+    ) -> list[CompactUtilization]: ...
+
+    async def backfill_utilizations(  # noqa: PLR0913, pylint: disable=too-many-arguments
+        self,
+        *,
+        point_id: PointRef,
+        type_id: TypeRef,
+        granularity_id: GranularityRef,
+        granularity_timezone_id: GranularityTimezoneRef,
+        classification_id: ClassificationRef,
+        activity_id: ActivityRef,
+        start_date: date,
+        end_date: date,
+        shard: Shard = "month",
+        max_concurrency: int = 4,
+        items_per_page: int | None = None,
+        as_frame: bool = False,
+        compact: bool = False,
+    ) -> list[Utilization] | UtilizationFrame | list[CompactUtilization]:
+        """Get all utilization data for a long period, split in shards.
+
+        The period is split into non-overlapping shards which are fetched as
+        independent (paginated) queries, with at most `max_concurrency` shards
+        in flight. Each shard includes utilizations valid from its start and
+        excludes those valid from its end, so no rows are dropped on the
+        boundaries. Rows returned by more than one shard are de-duplicated.
+
+        With a utilization store, the stored data is used and only the periods
+        that are missing from the store are fetched, split in shards the same
+        way.
+
+        Args:
+        ----
+            point_id: The ID, name or shortname of the point, or the point.
+            type_id: The ID, name or shortname of the type, or the type.
+            granularity_id: The ID or name of the granularity, or the granularity.
+            granularity_timezone_id: The ID or name of the granularity timezone,
+                or the granularity timezone.
+            classification_id: The ID or name of the classification, or the
+                classification.
+            activity_id: The ID or name of the activity, or the activity.
+            start_date: The start of the period (inclusive).
+            end_date: The end of the period (exclusive).
+            shard: The size of each shard: 'day', 'week', 'month' or 'year'.
+            max_concurrency: The maximum number of shards fetched in parallel.
+            items_per_page: The number of items to request per page.
+            as_frame: Return the data as columnar frame instead of a list.
+                Every page is decoded straight into a frame, without creating
+                `Utilization` objects.
+            compact: Return compact utilizations, that keep the timestamps as
+                epoch seconds until they are accessed.
+
+        Returns:
+        -------
+            Utilization data for the whole period, ordered by valid from.
+
+        Raises:
+        ------
+            ValueError: If both a frame and compact utilizations are requested,
+                or a name is unknown or used without a catalog.
+
+        """
+        series = self._series(
+            point_id=point_id,
+            type_id=type_id,
+            granularity_id=granularity_id,
+            granularity_timezone_id=granularity_timezone_id,
+            classification_id=classification_id,
+            activity_id=activity_id,
+        )
+        return await self._backfill(
+            series,
+            start_date,
+            end_date,
+            shard=shard,
+            max_concurrency=max_concurrency,
+            items_per_page=items_per_page,
+            as_frame=as_frame,
+            compact=compact,
+        )
+
+    async def _backfill(  # noqa: PLR0913, pylint: disable=too-many-arguments
+        self,
+        series: UtilizationSeries,
+        start_date: date,
+        end_date: date,
+        *,
+        shard: Shard,
+        max_concurrency: int,
+        items_per_page: int | None,
+        as_frame: bool,
+        compact: bool,
+    ) -> list[Utilization] | UtilizationFrame | list[CompactUtilization]:
+        """Get all utilization data of a series for a long period.
+
+        See `backfill_utilizations` for the arguments.
+
+        Returns
+        -------
+            Utilization data for the whole period, ordered by valid from.
+
+        Raises
+        ------
+            ValueError: If both a frame and compact utilizations are requested.
+
+        """
+        if as_frame and compact:
+            msg = "A frame cannot be combined with compact utilizations."
+            raise ValueError(msg)
+        if self.store is not None:
+            utilizations = await self._stored_utilizations(
+                self.store,
+                series,
+                parse_datetime(start_date.isoformat()),
+                parse_datetime(end_date.isoformat()),
+                shard=shard,
+                max_concurrency=max_concurrency,
+                items_per_page=items_per_page,
+            )
+            if as_frame:
+                return UtilizationFrame.from_utilizations(utilizations)
+            if compact:
+                return [
+                    CompactUtilization.from_utilization(item) for item in utilizations
+                ]
+            return utilizations
+
+        windows = split_date_range(start_date, end_date, shard)
+        if as_frame:
+            frames = await self._fetch_windows(
+                series,
+                windows,
+                UtilizationFrame.from_records,
+                max_concurrency=max_concurrency,
+                items_per_page=items_per_page,
+            )
+            return UtilizationFrame.concat(frames).unique()
+        if compact:
+            compact_pages = await self._fetch_windows(
+                series,
+                windows,
+                decode_compact_utilization_records,
+                max_concurrency=max_concurrency,
+                items_per_page=items_per_page,
+            )
+            return _merge_pages(compact_pages, key=attrgetter("valid_from_timestamp"))
+        pages = await self._fetch_windows(
+            series,
+            windows,
+            decode_utilization_records,
+            max_concurrency=max_concurrency,
+            items_per_page=items_per_page,
+        )
+        return _merge_pages(pages, key=attrgetter("valid_from"))
+
+    async def utilization_many(
+        self,
+        *,
+        series: Iterable[UtilizationSeries],
+        start_date: str,
+        end_date: str,
+        max_concurrency: int = 8,
+        items_per_page: int | None = None,
+    ) -> dict[UtilizationSeries, list[Utilization] | NedNLError]:
+        """Get utilization data for many series over the same period.
+
+        All series are fetched over the same session, with at most
+        `max_concurrency` series in flight. A series that fails with a
+        `NedNLError` does not cancel the others, its error is returned in place
+        of the data. Any other exception is raised and cancels all series.
+
+        Args:
+        ----
+            series: The series to get the utilization data for.
+            start_date: The start date of the data.
+            end_date: The end date of the data.
+            max_concurrency: The maximum number of series fetched in parallel.
+            items_per_page: The number of items to request per page.
+
+        Returns:
+        -------
+            Mapping of each series to its utilization data or the error that
+            occurred while fetching it.
+
+        Raises:
+        ------
+            Exception: Any error that is not a `NedNLError`, after cancelling
+                the remaining series.
+
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_series(
+            item: UtilizationSeries,
+        ) -> list[Utilization] | NedNLError:
+            params = self._utilization_params(
+                **asdict(item), start_date=start_date, end_date=end_date
+            )
+            if items_per_page is not None:
+                params["itemsPerPage"] = items_per_page
+            async with semaphore:
+                try:
+                    return await self._fetch_all_pages("utilizations", params)
+                except NedNLError as exception:
+                    return exception
+
+        unique_series = list(dict.fromkeys(series))
+        tasks = [asyncio.create_task(fetch_series(item)) for item in unique_series]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return dict(zip(unique_series, results, strict=True))
+
+    async def fill_gaps(  # noqa: PLR0913, pylint: disable=too-many-arguments
+        self,
+        series: UtilizationSeries,
+        utilizations: Iterable[Utilization],
+        *,
+        start_date: datetime,
+        end_date: datetime,
+        max_concurrency: int = 4,
+        items_per_page: int = 200,
+    ) -> list[Utilization]:
+        """Fetch the utilizations missing from a series, with the least requests.
+
+        The granularity and timezone of the series are looked up in the
+        reference data, to know which valid from moments are expected. The
+        missing slots are then fetched with the fewest single page queries,
+        with at most `max_concurrency` queries in flight.
+
+        Args:
+        ----
+            series: The series the utilizations belong to.
+            utilizations: The utilizations that are already available.
+            start_date: The start of the period (inclusive).
+            end_date: The end of the period (exclusive).
+            max_concurrency: The maximum number of queries fetched in parallel.
+            items_per_page: The number of items to request per page.
+
+        Returns:
+        -------
+            The available and fetched utilizations, ordered by valid from.
+
+        Raises:
+        ------
+            ValueError: If the start or end date has no timezone.
+
+        """
+        if start_date.tzinfo is None or end_date.tzinfo is None:
+            msg = "Start and end date must be timezone aware."
+            raise ValueError(msg)
+        granularity, timezone = await self._slot_names(series)
+        utilizations = list(utilizations)
+        queries = plan_refetch(
+            utilizations,
+            start_date,
+            end_date,
+            granularity,
+            timezone,
+            items_per_page=items_per_page,
+        )
+        results = await self._fetch_queries(
+            series,
+            queries,
+            max_concurrency=max_concurrency,
+            items_per_page=items_per_page,
+        )
+        merged = {utilization.id: utilization for utilization in utilizations}
+        for result in results:
+            merged.update((utilization.id, utilization) for utilization in result)
+        return sorted(merged.values(), key=lambda item: item.valid_from)
+
+    async def _fetch_queries(
+        self,
+        series: UtilizationSeries,
+        queries: Iterable[tuple[datetime, datetime]],
+        *,
+        max_concurrency: int,
+        items_per_page: int,
+    ) -> list[list[Utilization]]:
+        """Fetch the utilizations of planned queries, with limited concurrency.
+
+        Args:
+        ----
+            series: The series the queries belong to.
+            queries: The periods to query, including their start.
+            max_concurrency: The maximum number of queries fetched in parallel.
+            items_per_page: The number of items to request per page.
+
+        Returns:
+        -------
+            The utilizations of each query, in the order of the queries.
+
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_query(
+            query_start: datetime, query_end: datetime
+        ) -> list[Utilization]:
+            params = self._utilization_params(
+                **asdict(series),
+                start_date=query_start.isoformat(),
+                end_date=query_end.isoformat(),
+                start_inclusive=True,
+            )
+            params["itemsPerPage"] = items_per_page
+            async with semaphore:
+                return await self._fetch_all_pages("utilizations", params)
+
+        tasks = [
+            asyncio.create_task(fetch_query(query_start, query_end))
+            for query_start, query_end in queries
+        ]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return results
+
+    async def sync_utilizations(  # noqa: PLR0913, pylint: disable=too-many-arguments
+        self,
+        series: UtilizationSeries,
+        state: SyncState,
+        *,
+        initial_start: datetime | None = None,
+        look_back: timedelta = timedelta(hours=2),
+        horizon: timedelta = timedelta(days=1),
+        items_per_page: int | None = None,
+    ) -> SyncResult:
+        """Get the utilizations of a series that changed since the last sync.
+
+        Only the tail of the series is fetched: from the watermark of the
+        series in the state (or now, if forecasts put the watermark ahead of
+        now), minus `look_back` to pick up revisions of recent rows, up to
+        `horizon` from now. Rows valid from after the watermark
+        are returned as inserts, older rows that were updated after the
+        watermark as updates. The watermark is moved forward in the state.
+
+        Args:
+        ----
+            series: The series to sync.
+            state: The watermarks of earlier syncs, updated in place.
+            initial_start: Where to start when the series has not been synced
+                before. Defaults to the start of the current day (UTC).
+            look_back: How far before the watermark to look for revisions.
+            horizon: How far after now to fetch, for example for forecasts.
+            items_per_page: The number of items to request per page.
+
+        Returns:
+        -------
+            The inserted and updated utilizations, ordered by valid from.
+
+        """
+        now = datetime.now(UTC)
+        watermark = state.watermarks.get(series)
+        if watermark is not None:
+            # Forecasts can put the watermark ahead of now, while the rows
+            # between now and the watermark can still be revised
+            start = min(watermark.valid_from, now) - look_back
+        elif initial_start is not None:
+            start = initial_start
+        else:
+            start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+        params = self._utilization_params(
+            **asdict(series),
+            start_date=start.isoformat(),
+            end_date=(now + horizon).isoformat(),
+            start_inclusive=True,
+        )
+        params["order[validfrom]"] = "asc"
+        if items_per_page is not None:
+            params["itemsPerPage"] = items_per_page
+        return state.apply(series, await self._fetch_all_pages("utilizations", params))
+
+    async def watch_utilizations(  # noqa: PLR0913, pylint: disable=too-many-arguments
+        self,
+        series: Iterable[UtilizationSeries],
+        *,
+        interval: timedelta | None = None,
+        state: SyncState | None = None,
+        look_back: timedelta = timedelta(hours=2),
+        horizon: timedelta = timedelta(0),
+        delay: timedelta = timedelta(seconds=30),
+        jitter: timedelta = timedelta(seconds=30),
+        items_per_page: int | None = None,
+    ) -> AsyncGenerator[tuple[UtilizationSeries, SyncResult], None]:
+        """Watch series for new and revised utilizations.
+
+        Every series is polled with `sync_utilizations`, so each poll only
+        fetches the newest window and only changed rows are yielded. Polls are
+        aligned to the slot boundaries of the granularity of the series (in
+        its timezone), when new rows are expected, or to multiples of
+        `interval` when given. Each poll waits `delay` after the boundary, to
+        give the API time to publish, plus a random part of `jitter`, so many
+        series do not all poll at the same moment. A poll that fails on the
+        connection, a rate limit or a server error is retried at the next
+        poll moment, any other error ends the watch.
+
+        Args:
+        ----
+            series: The series to watch.
+            interval: Poll every interval instead of at every slot boundary.
+            state: The watermarks to continue from, updated in place. Without
+                a state, the watch starts `look_back` before now.
+            look_back: How far before the watermark to look for revisions.
+            horizon: How far after now to fetch, for example for forecasts.
+            delay: How long to wait after a boundary before polling.
+            jitter: The maximum random time added to every poll.
+            items_per_page: The number of items to request per page.
+
+        Yields:
+        ------
+            Each series with its inserted and updated utilizations, as soon
+            as a poll finds any.
+
+        Raises:
+        ------
+            ValueError: If the interval is not positive.
+
+        """
+        if interval is not None and interval <= timedelta(0):
+            msg = "Interval must be positive."
+            raise ValueError(msg)
+        if state is None:
+            state = SyncState()
+        queue: asyncio.Queue[tuple[UtilizationSeries, SyncResult] | Exception] = (
+            asyncio.Queue()
+        )
+
+        sync = partial(
+            self.sync_utilizations,
+            state=state,
+            initial_start=datetime.now(UTC) - look_back,
+            look_back=look_back,
+            horizon=horizon,
+            items_per_page=items_per_page,
+        )
+        tasks = [
+            asyncio.create_task(
+                self._poll(
+                    item,
+                    queue,
+                    sync=sync,
+                    next_poll=partial(self._next_poll, interval=interval, delay=delay),
+                    jitter=jitter,
+                )
+            )
+            for item in dict.fromkeys(series)
+        ]
+        try:
+            while True:
+                update = await queue.get()
+                if isinstance(update, Exception):
+                    raise update
+                yield update
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    def _next_poll(
+        now: datetime,
+        granularity: str,
+        timezone: str,
+        *,
+        interval: timedelta | None,
+        delay: timedelta,
+    ) -> datetime:
+        """Get the moment of the next poll of a watched series.
+
+        Args:
+        ----
+            now: The current moment.
+            granularity: The name of the granularity of the series.
+            timezone: The name of the granularity timezone of the series.
+            interval: Poll every interval instead of at every slot boundary.
+            delay: How long to wait after a boundary before polling.
+
+        Returns:
+        -------
+            The next boundary after now, plus the delay.
+
+        """
+        if interval is None:
+            boundary = next_slot(
+                floor_slot(now, granularity, timezone), granularity, timezone
+            )
+        else:
+            step = interval.total_seconds()
+            boundary = datetime.fromtimestamp((now.timestamp() // step + 1) * step, UTC)
+        return boundary + delay
+
+    async def _poll(
+        self,
+        series: UtilizationSeries,
+        queue: asyncio.Queue[tuple[UtilizationSeries, SyncResult] | Exception],
+        *,
+        sync: Callable[[UtilizationSeries], Awaitable[SyncResult]],
+        next_poll: Callable[[datetime, str, str], datetime],
+        jitter: timedelta,
+    ) -> None:
+        """Poll a watched series until cancelled, queueing its changes.
+
+        Connection, rate limit and server errors are logged and the poll is
+        retried at the next poll moment. Other errors stop the poll.
+
+        Args:
+        ----
+            series: The series to poll.
+            queue: The queue for the changes, and for the error that stops
+                the poll.
+            sync: Function to sync the series with.
+            next_poll: Function to get the moment of the next poll.
+            jitter: The maximum random time added to every poll.
+
+        """
+        try:
+            granularity, timezone = await self._slot_names(series)
+            due = datetime.now(UTC)
+            while True:
+                wait = (due - datetime.now(UTC)).total_seconds()
+                # Spread the polls of many series over the jitter window
+                wait += random.uniform(0, jitter.total_seconds())  # noqa: S311
+                await asyncio.sleep(max(0.0, wait))
+                try:
+                    result = await sync(series)
+                except (
+                    NedNLConnectionError,
+                    NedNLRateLimitError,
+                    NedNLServerError,
+                ) as exception:
+                    # Transient, the next poll fetches the same window again
+                    _LOGGER.warning("Polling %s failed: %s", series, exception)
+                else:
+                    if result.inserts or result.updates:
+                        await queue.put((series, result))
+                due = next_poll(datetime.now(UTC), granularity, timezone)
+        except Exception as exception:  # noqa: BLE001, pylint: disable=broad-exception-caught
+            # Raised by the iterator, which cancels the other polls
+            await queue.put(exception)
+
+    async def _slot_names(self, series: UtilizationSeries) -> tuple[str, str]:
+        """Get the names of the granularity and timezone of a series.
+
+        Uses the catalog when loaded, and the reference data otherwise.
+
+        Args:
+        ----
+            series: The series to get the names for.
+
+        Returns:
+        -------
+            The name of the granularity and of the granularity timezone.
+
+        """
+        if self.catalog is not None:
+            return (
+                self.catalog.get_granularity(series.granularity_id).name,
+                self.catalog.get_granularity_timezone(
+                    series.granularity_timezone_id
+                ).name,
+            )
+        granularities = {item.id: item.name for item in await self.all_granularities()}
+        timezones = {
+            item.id: item.name for item in await self.all_granularity_timezones()
+        }
+        return (
+            granularities[series.granularity_id],
+            timezones[series.granularity_timezone_id],
+        )
+
+    async def _stored_utilizations(  # noqa: PLR0913, pylint: disable=too-many-arguments
+        self,
+        store: UtilizationStore,
+        series: UtilizationSeries,
+        start: datetime,
+        end: datetime,
+        *,
+        shard: Shard,
+        max_concurrency: int,
+        items_per_page: int | None,
+    ) -> list[Utilization]:
+        """Get utilizations from the store, fetching the missing periods first.
+
+        The missing periods are split in shards, like `backfill_utilizations`
+        does without a store. Fetched periods are only marked complete up to
+        `finalized_after` ago, as more recent data can still change.
+
+        Args:
+        ----
+            store: The store to use.
+            series: The series to get the utilization data for.
+            start: The start of the period (inclusive).
+            end: The end of the period (exclusive).
+            shard: The size of each shard: 'day', 'week', 'month' or 'year'.
+            max_concurrency: The maximum number of shards fetched in parallel.
+            items_per_page: The number of items to request per page.
+
+        Returns:
+        -------
+            Utilization data for the period, ordered by valid from.
+
+        """
+        gaps = await store.missing(series, start, end)
+        if gaps:
+            pages = await self._fetch_windows(
+                series,
+                [
+                    window
+                    for gap_start, gap_end in gaps
+                    for window in split_date_range(gap_start, gap_end, shard)
+                ],
+                decode_utilization_records,
+                max_concurrency=max_concurrency,
+                items_per_page=items_per_page,
+            )
+            await store.put(series, chain.from_iterable(pages))
+            final_until = datetime.now(UTC) - self.finalized_after
+            for gap_start, gap_end in gaps:
+                covered_until = min(gap_end, final_until)
+                if covered_until > gap_start:
+                    await store.put(series, [], (gap_start, covered_until))
+        return await store.get(series, start, end)
+
+    async def _fetch_windows[T](
+        self,
+        series: UtilizationSeries,
+        windows: Iterable[tuple[date, date]],
+        decode: Callable[[list[dict[str, Any]]], T],
+        *,
+        max_concurrency: int,
+        items_per_page: int | None = None,
+    ) -> list[T]:
+        """Fetch the utilizations of a series in independent windows.
+
+        Every window includes utilizations valid from its start and excludes
+        those valid from its end. At most `max_concurrency` windows are in
+        flight, each following all of its pages. Rows on the boundary of two
+        windows can be returned by both.
+
+        Args:
+        ----
+            series: The series to get the utilization data for.
+            windows: The start and end of every window.
+            decode: Function to decode the records of a page with.
+            max_concurrency: The maximum number of windows fetched in parallel.
+            items_per_page: The number of items to request per page.
+
+        Returns:
+        -------
+            The decoded pages of all windows, in order.
+
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch_window(start: date, end: date) -> list[T]:
+            params = self._utilization_params(
+                **asdict(series),
+                start_date=start.isoformat(),
+                end_date=end.isoformat(),
+                start_inclusive=True,
+            )
+            params["order[validfrom]"] = "asc"
+            if items_per_page is not None:
+                params["itemsPerPage"] = items_per_page
+            async with semaphore:
+                return [
+                    decode(records)
+                    async for records in self._iter_records("utilizations", params)
+                ]
+
+        tasks = [asyncio.create_task(fetch_window(*window)) for window in windows]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return list(chain.from_iterable(results))
+
+    async def _fetch_all_pages(
+        self,
+        uri: str,
+        params: dict[str, Any],
+    ) -> list[Utilization]:
+        """Fetch all pages of a collection into a single list.
+
+        Args:
+        ----
+            uri: Request URI of the collection.
+            params: Query parameters for the first page.
+
+        Returns:
+        -------
+            The items of all pages of the collection.
+
+        """
+        return [
+            utilization
+            async for page in self._iter_pages(uri, params)
+            for utilization in page.data
+        ]
+
+    async def _iter_chunks(
+        self,
+        uri: str,
+        params: dict[str, Any],
+        chunk_size: int,
+    ) -> AsyncGenerator[bytes, None]:
+        """Iterate over the body of a response in chunks.
+
+        Args:
+        ----
+            uri: Request URI.
+            params: Extra options to improve or limit the response.
+            chunk_size: The maximum number of bytes per chunk.
+
+        Yields:
+        ------
+            The chunks of the response body, in order.
+
+        Raises:
+        ------
+            NedNLAuthenticationError: If no API key is provided.
+            NedNLTimeoutError: If reading a chunk times out.
+            NedNLConnectionError: If the connection fails while reading.
+
+        """
+        if self.api_key is None or self.api_key == "":
+            msg = "No API key provided."
+            raise NedNLAuthenticationError(msg)
+
+        url = _build_url(uri)
+        metrics = (
+            RequestMetrics(METH_GET, url.path, dict(params)) if self.hooks else None
+        )
+        started = time.perf_counter()
+        try:
+            response, _ = await self._send_with_retry(
+                METH_GET,
+                url,
+                params=params,
+                headers={},
+                read_body=False,
+                metrics=metrics,
+            )
+            try:
+                while True:
+                    try:
+                        async with asyncio.timeout(self.request_timeout):
+                            chunk = await response.content.read(chunk_size)
+                    except TimeoutError as exception:
+                        msg = "Timeout occurred while reading from NED NL API."
+                        raise NedNLTimeoutError(msg) from exception
+                    except ClientError as exception:
+                        msg = "Error occurred while communicating with NED NL API."
+                        raise NedNLConnectionError(msg) from exception
+                    if not chunk:
+                        return
+                    if metrics is not None:
+                        metrics.bytes_received += len(chunk)
+                    yield chunk
+            finally:
+                response.release()
+        except BaseException as exception:
+            if metrics is not None:
+                metrics.error = exception
+            raise
+        finally:
+            if metrics is not None:
+                # Streamed bodies are parsed while they are read
+                metrics.body = metrics.stop("body")
+                metrics.total = time.perf_counter() - started
+                self._emit(metrics)
+
+    async def _iter_pages(
+        self,
+        uri: str,
+        params: dict[str, Any],
+    ) -> AsyncIterator[UtilizationsResponse]:
+        """Iterate over the pages of a collection by following the next links.
+
+        Args:
+        ----
+            uri: Request URI of the collection.
+            params: Query parameters for the first page.
+
+        Yields:
+        ------
+            Each page of the collection, in order.
+
+        """
+        query: dict[str, Any] | None = params
+        while True:
+            page = await self._fetch(uri, decode_utilizations, params=query)
+            yield page
+            if page.view is None or page.view.next is None:
+                return
+            # The next link already carries all query parameters
+            uri, query = page.view.next, None
+
+    async def _iter_records(
+        self,
+        uri: str,
+        params: dict[str, Any],
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Iterate over the raw records of each page of a collection.
+
+        Unlike `_iter_pages`, the records are not converted, so the caller can
+        decode every page into its own representation.
+
+        Args:
+        ----
+            uri: Request URI of the collection.
+            params: Query parameters for the first page.
+
+        Yields:
+        ------
+            The 'hydra:member' items of each page of the collection, in order.
+
+        """
+        query: dict[str, Any] | None = params
+        while True:
+            document = await self._fetch(uri, orjson.loads, params=query)
+            yield document["hydra:member"]
+            next_page = (document.get("hydra:view") or {}).get("hydra:next")
+            if next_page is None:
+                return
+            # The next link already carries all query parameters
+            uri, query = next_page, None
+
+    async def _iter_pages_concurrently(
+        self,
+        uri: str,
+        params: dict[str, Any],
+        max_concurrency: int,
+    ) -> AsyncIterator[UtilizationsResponse]:
+        """Iterate over the pages of a collection, prefetching pages in parallel.
+
+        The first page is fetched to learn the page size and total number of
+        items, after which a sliding window of at most `max_concurrency`
+        requests is kept in flight.
+
+        Args:
+        ----
+            uri: Request URI of the collection.
+            params: Query parameters for the first page.
+            max_concurrency: The maximum number of pages requested in parallel.
+
+        Yields:
+        ------
+            Each page of the collection, in order.
+
+        """
+        first = await self._fetch(uri, decode_utilizations, params=params)
+        yield first
+        if first.view is None or first.view.next is None or not first.data:
+            return
+
+        last_page = math.ceil(first.items / len(first.data))
+        next_page = 2
+        pending: deque[asyncio.Task[UtilizationsResponse]] = deque()
+        try:
+            while next_page <= last_page or pending:
+                while next_page <= last_page and len(pending) < max_concurrency:
+                    pending.append(
+                        asyncio.create_task(
+                            self._fetch(
+                                uri,
+                                decode_utilizations,
+                                params={**params, "page": next_page},
+                            )
+                        )
+                    )
+                    next_page += 1
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
     async def close(self) -> None:
         """Close open client session."""
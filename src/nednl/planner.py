@@ -0,0 +1,120 @@
+"""Asynchronous Python client for National Energy Dashboard NL."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .util import iter_slots
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
+
+    from .models import Utilization
+    from .util import GranularityName
+
+
+def _missing_slots(
+    utilizations: Iterable[Utilization],
+    start: datetime,
+    end: datetime,
+    granularity: GranularityName | str,
+    timezone: str,
+) -> tuple[list[datetime], list[int]]:
+    """Get all slots of a period and the indices of those without a row."""
+    present = {int(item.valid_from.timestamp()) for item in utilizations}
+    slots = list(iter_slots(start, end, granularity, timezone))
+    missing = [
+        index
+        for index, slot in enumerate(slots)
+        if int(slot.timestamp()) not in present
+    ]
+    return slots, missing
+
+
+def find_gaps(
+    utilizations: Iterable[Utilization],
+    start: datetime,
+    end: datetime,
+    granularity: GranularityName | str,
+    timezone: str = "UTC",
+) -> list[tuple[datetime, datetime]]:
+    """Find the periods of a series without utilizations.
+
+    Every slot of the granularity within the period is expected to have a
+    utilization valid from its start. Consecutive missing slots are combined.
+
+    Args:
+    ----
+        utilizations: The utilizations that are available.
+        start: The start of the period (inclusive).
+        end: The end of the period (exclusive).
+        granularity: The name of the granularity of the series.
+        timezone: The name of the granularity timezone of the series.
+
+    Returns:
+    -------
+        The missing periods, each including its start and excluding its end.
+
+    """
+    slots, missing = _missing_slots(utilizations, start, end, granularity, timezone)
+    gaps: list[tuple[datetime, datetime]] = []
+    for index in missing:
+        gap_end = slots[index + 1] if index + 1 < len(slots) else end
+        if gaps and gaps[-1][1] == slots[index]:
+            gaps[-1] = (gaps[-1][0], gap_end)
+        else:
+            gaps.append((slots[index], gap_end))
+    return gaps
+
+
+def plan_refetch(  # noqa: PLR0913, pylint: disable=too-many-arguments
+    utilizations: Iterable[Utilization],
+    start: datetime,
+    end: datetime,
+    granularity: GranularityName | str,
+    timezone: str = "UTC",
+    *,
+    items_per_page: int,
+) -> list[tuple[datetime, datetime]]:
+    """Plan the fewest single page queries that cover all missing slots.
+
+    Nearby gaps are combined into one query when the query still fits in a
+    single page, refetching the rows in between. Gaps that are larger than a
+    page are split. Each query starts at the first slot it still has to cover
+    and spans at most `items_per_page` slots, which gives the least queries.
+
+    Args:
+    ----
+        utilizations: The utilizations that are available.
+        start: The start of the period (inclusive).
+        end: The end of the period (exclusive).
+        granularity: The name of the granularity of the series.
+        timezone: The name of the granularity timezone of the series.
+        items_per_page: The maximum number of rows a query may return.
+
+    Returns:
+    -------
+        The periods to query, each including its start and excluding its end.
+
+    Raises:
+    ------
+        ValueError: If the page size is not positive.
+
+    """
+    if items_per_page < 1:
+        msg = "Items per page must be positive."
+        raise ValueError(msg)
+    slots, missing = _missing_slots(utilizations, start, end, granularity, timezone)
+    queries: list[tuple[datetime, datetime]] = []
+    position = 0
+    while position < len(missing):
+        first = missing[position]
+        while position < len(missing) and missing[position] < first + items_per_page:
+            position += 1
+        # End the query right after the last missing slot it covers
+        after_last = missing[position - 1] + 1
+        queries.append(
+            (slots[first], slots[after_last] if after_last < len(slots) else end)
+        )
+    return queries
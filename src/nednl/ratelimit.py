@@ -0,0 +1,58 @@
+"""Asynchronous Python client for National Energy Dashboard NL."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+
+
+@dataclass
+class RateLimiter:
+    """Token bucket rate limiter for requests to National Energy Dashboard NL.
+
+    Tokens are added at a steady rate of `requests_per_minute`, up to a maximum
+    of `burst` tokens. Every request takes a token, waiting until one becomes
+    available. The same limiter can be shared between multiple NedNL clients
+    that use the same API key, so they stay within one quota together.
+    """
+
+    requests_per_minute: float = 40.0
+    burst: int = 1
+
+    _tokens: float = field(init=False)
+    _updated: float = field(init=False)
+    _lock: asyncio.Lock = field(init=False, default_factory=asyncio.Lock)
+
+    def __post_init__(self) -> None:
+        """Validate the configuration and fill the bucket.
+
+        Raises
+        ------
+            ValueError: If the rate or burst size is not positive.
+
+        """
+        if self.requests_per_minute <= 0 or self.burst < 1:
+            msg = "Requests per minute and burst size must be positive."
+            raise ValueError(msg)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = time.monotonic()
+        earned = (now - self._updated) * self.requests_per_minute / 60
+        self._tokens = min(float(self.burst), self._tokens + earned)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a request is allowed and take a token.
+
+        Waiters are served in the order they started waiting.
+        """
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) * 60 / self.requests_per_minute)
+                self._refill()
+            self._tokens -= 1
@@ -0,0 +1,67 @@
+"""Asynchronous Python client for National Energy Dashboard NL."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+
+from .exceptions import (
+    NedNLError,
+    NedNLRateLimitError,
+    NedNLServerError,
+    NedNLTimeoutError,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Policy for retrying failed requests with exponential backoff.
+
+    The delay before retry `n` is `base_delay * 2 ** (n - 1)`, capped at
+    `max_delay` and randomized by up to `jitter` (as a fraction) in either
+    direction. When a rate limit response carries a Retry-After header, that
+    delay is used instead.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+    jitter: float = 0.1
+    retry_on: tuple[type[NedNLError], ...] = (
+        NedNLRateLimitError,
+        NedNLServerError,
+        NedNLTimeoutError,
+    )
+
+    def should_retry(self, exception: NedNLError, attempt: int) -> bool:
+        """Check whether a failed attempt should be retried.
+
+        Args:
+        ----
+            exception: The exception raised by the attempt.
+            attempt: The number of the failed attempt, starting at 1.
+
+        Returns:
+        -------
+            True if the request should be retried.
+
+        """
+        return attempt < self.max_attempts and isinstance(exception, self.retry_on)
+
+    def delay(self, attempt: int, exception: NedNLError | None = None) -> float:
+        """Get the number of seconds to wait before the next attempt.
+
+        Args:
+        ----
+            attempt: The number of the failed attempt, starting at 1.
+            exception: The exception raised by the attempt.
+
+        Returns:
+        -------
+            The delay in seconds.
+
+        """
+        if isinstance(exception, NedNLRateLimitError) and exception.retry_after:
+            return exception.retry_after
+        delay = min(self.max_delay, self.base_delay * 2.0 ** (attempt - 1))
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))  # noqa: S311
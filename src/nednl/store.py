@@ -0,0 +1,248 @@
+"""Asynchronous Python client for National Energy Dashboard NL."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from contextlib import closing
+from dataclasses import astuple, dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Protocol
+
+from .models import Utilization
+from .util import sqlite_transaction
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from .models import UtilizationSeries
+
+_SERIES_COLUMNS = (
+    "point, type, granularity, granularity_timezone, classification, activity"
+)
+
+
+class UtilizationStore(Protocol):
+    """Interface of a local store for utilization data.
+
+    Next to the rows of each series, a store keeps track of the periods that
+    are known to be complete, so only the missing periods have to be fetched
+    from the API. Periods include their start and exclude their end.
+    """
+
+    async def get(
+        self, series: UtilizationSeries, start: datetime, end: datetime
+    ) -> list[Utilization]:
+        """Get the stored rows valid from within a period, ordered by valid from."""
+
+    async def put(
+        self,
+        series: UtilizationSeries,
+        utilizations: Iterable[Utilization],
+        covered: tuple[datetime, datetime] | None = None,
+    ) -> None:
+        """Store rows, replacing rows with the same id, and mark a period complete."""
+
+    async def missing(
+        self, series: UtilizationSeries, start: datetime, end: datetime
+    ) -> list[tuple[datetime, datetime]]:
+        """Get the parts of a period that are not known to be complete."""
+
+
+def _timestamp(value: datetime) -> int:
+    """Convert a datetime to epoch seconds."""
+    return int(value.timestamp())
+
+
+def _datetime(value: int) -> datetime:
+    """Convert epoch seconds to a UTC datetime."""
+    return datetime.fromtimestamp(value, UTC)
+
+
+@dataclass
+class SQLiteUtilizationStore:
+    """Utilization store in a SQLite database file.
+
+    Rows are kept in a single table, indexed by series and valid from, with
+    the timestamps stored as epoch seconds. Rows are upserted on their id.
+    """
+
+    path: str | Path
+
+    def __post_init__(self) -> None:
+        """Create the tables if they do not exist yet."""
+        with sqlite_transaction(self.path) as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS utilizations ("
+                f"id INTEGER PRIMARY KEY, {_SERIES_COLUMNS}, "
+                "capacity INTEGER, volume INTEGER, percentage REAL, "
+                "emission INTEGER, emission_factor REAL, "
+                "valid_from INTEGER, valid_to INTEGER, last_update INTEGER)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS utilizations_series "
+                f"ON utilizations ({_SERIES_COLUMNS}, valid_from)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS coverage ("
+                f"{_SERIES_COLUMNS}, period_start INTEGER, period_end INTEGER)"
+            )
+
+    def _get(
+        self, series: UtilizationSeries, start: datetime, end: datetime
+    ) -> list[Utilization]:
+        """Read the rows of a period from the database."""
+        with closing(sqlite3.connect(self.path)) as connection:
+            rows = connection.execute(
+                "SELECT id, capacity, volume, percentage, emission, "
+                "emission_factor, valid_from, valid_to, last_update "
+                "FROM utilizations WHERE point = ? AND type = ? "
+                "AND granularity = ? AND granularity_timezone = ? "
+                "AND classification = ? AND activity = ? "
+                "AND valid_from >= ? AND valid_from < ? ORDER BY valid_from",
+                (*astuple(series), _timestamp(start), _timestamp(end)),
+            ).fetchall()
+        return [
+            Utilization(
+                id=row[0],
+                capacity=row[1],
+                volume=row[2],
+                percentage=row[3],
+                emission=row[4],
+                emission_factor=row[5],
+                valid_from=_datetime(row[6]),
+                valid_to=_datetime(row[7]),
+                last_update=_datetime(row[8]),
+            )
+            for row in rows
+        ]
+
+    def _put(
+        self,
+        series: UtilizationSeries,
+        utilizations: Iterable[Utilization],
+        covered: tuple[datetime, datetime] | None,
+    ) -> None:
+        """Write rows and a complete period to the database."""
+        key = astuple(series)
+        with sqlite_transaction(self.path) as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO utilizations VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        item.id,
+                        *key,
+                        item.capacity,
+                        item.volume,
+                        item.percentage,
+                        item.emission,
+                        item.emission_factor,
+                        _timestamp(item.valid_from),
+                        _timestamp(item.valid_to),
+                        _timestamp(item.last_update),
+                    )
+                    for item in utilizations
+                ),
+            )
+            if covered is None:
+                return
+            # Merge the period with the overlapping and adjacent ones
+            start, end = _timestamp(covered[0]), _timestamp(covered[1])
+            overlapping = connection.execute(
+                "SELECT MIN(period_start), MAX(period_end) FROM coverage "
+                "WHERE point = ? AND type = ? AND granularity = ? "
+                "AND granularity_timezone = ? AND classification = ? "
+                "AND activity = ? AND period_start <= ? AND period_end >= ?",
+                (*key, end, start),
+            ).fetchone()
+            if overlapping[0] is not None:
+                connection.execute(
+                    "DELETE FROM coverage WHERE point = ? AND type = ? "
+                    "AND granularity = ? AND granularity_timezone = ? "
+                    "AND classification = ? AND activity = ? "
+                    "AND period_start <= ? AND period_end >= ?",
+                    (*key, end, start),
+                )
+                start, end = min(start, overlapping[0]), max(end, overlapping[1])
+            connection.execute(
+                "INSERT INTO coverage VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (*key, start, end),
+            )
+
+    def _missing(
+        self, series: UtilizationSeries, start: datetime, end: datetime
+    ) -> list[tuple[datetime, datetime]]:
+        """Read the complete periods from the database and return the gaps."""
+        with closing(sqlite3.connect(self.path)) as connection:
+            periods = connection.execute(
+                "SELECT period_start, period_end FROM coverage "
+                "WHERE point = ? AND type = ? AND granularity = ? "
+                "AND granularity_timezone = ? AND classification = ? "
+                "AND activity = ? AND period_start < ? AND period_end > ? "
+                "ORDER BY period_start",
+                (*astuple(series), _timestamp(end), _timestamp(start)),
+            ).fetchall()
+        gaps: list[tuple[datetime, datetime]] = []
+        position = start
+        for period_start, period_end in periods:
+            if _datetime(period_start) > position:
+                gaps.append((position, _datetime(period_start)))
+            position = max(position, _datetime(period_end))
+        if position < end:
+            gaps.append((position, end))
+        return gaps
+
+    async def get(
+        self, series: UtilizationSeries, start: datetime, end: datetime
+    ) -> list[Utilization]:
+        """Get the stored rows valid from within a period.
+
+        Args:
+        ----
+            series: The series to get the rows of.
+            start: The start of the period (inclusive).
+            end: The end of the period (exclusive).
+
+        Returns:
+        -------
+            The stored rows, ordered by valid from.
+
+        """
+        return await asyncio.to_thread(self._get, series, start, end)
+
+    async def put(
+        self,
+        series: UtilizationSeries,
+        utilizations: Iterable[Utilization],
+        covered: tuple[datetime, datetime] | None = None,
+    ) -> None:
+        """Store rows, replacing rows with the same id.
+
+        Args:
+        ----
+            series: The series the rows belong to.
+            utilizations: The rows to store.
+            covered: A period the rows are known to be complete for, if any.
+
+        """
+        await asyncio.to_thread(self._put, series, list(utilizations), covered)
+
+    async def missing(
+        self, series: UtilizationSeries, start: datetime, end: datetime
+    ) -> list[tuple[datetime, datetime]]:
+        """Get the parts of a period that are not known to be complete.
+
+        Args:
+        ----
+            series: The series to check.
+            start: The start of the period (inclusive).
+            end: The end of the period (exclusive).
+
+        Returns:
+        -------
+            The missing periods, in chronological order.
+
+        """
+        return await asyncio.to_thread(self._missing, series, start, end)
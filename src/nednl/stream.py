@@ -0,0 +1,254 @@
+"""Asynchronous Python client for National Energy Dashboard NL."""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Self
+
+import orjson
+
+from .decoder import decode_utilization_records
+from .exceptions import NedNLError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+    from .models import Utilization
+
+_STRUCTURE = re.compile(rb'[{}\[\]",:]')
+_STRING_END = re.compile(rb'["\\]')
+
+
+@dataclass
+class HydraCollectionParser:
+    """Incremental parser for the members of a Hydra collection.
+
+    Chunks of a JSON document are fed as they are received. Items of the
+    member array are returned as soon as they are complete, the other
+    top-level values (such as 'hydra:totalItems') are kept once parsed. Only
+    the item that is still incomplete is buffered, never the whole document.
+    """
+
+    member_key: str = "hydra:member"
+    document: dict[str, Any] = field(init=False, default_factory=dict)
+    complete: bool = field(init=False, default=False)
+
+    _buffer: bytearray = field(init=False, default_factory=bytearray)
+    _position: int = field(init=False, default=0)
+    _depth: int = field(init=False, default=0)
+    _in_string: bool = field(init=False, default=False)
+    _string_start: int = field(init=False, default=0)
+    _expect_key: bool = field(init=False, default=False)
+    _key: str | None = field(init=False, default=None)
+    _value_start: int | None = field(init=False, default=None)
+    _in_members: bool = field(init=False, default=False)
+    _item_start: int | None = field(init=False, default=None)
+
+    @property
+    def total_items(self) -> int | None:
+        """Get the total number of items, once it has been received."""
+        total: int | None = self.document.get("hydra:totalItems")
+        return total
+
+    def feed(  # noqa: PLR0912, PLR0915, pylint: disable=too-many-branches,too-many-statements
+        self, chunk: bytes
+    ) -> list[Any]:
+        """Parse the next chunk of the document.
+
+        Args:
+        ----
+            chunk: The next bytes of the document.
+
+        Returns:
+        -------
+            The member items completed by this chunk, in document order.
+
+        """
+        buffer = self._buffer
+        buffer += chunk
+        items: list[Any] = []
+        position = self._position
+        while not self.complete:
+            if self._in_string:
+                match = _STRING_END.search(buffer, position)
+                if match is None:
+                    position = len(buffer)
+                    break
+                position = match.end()
+                if buffer[match.start()] == ord("\\"):
+                    if position == len(buffer):
+                        # The escaped character has not been received yet
+                        position -= 1
+                        break
+                    position += 1
+                    continue
+                self._in_string = False
+                if self._depth == 1 and self._expect_key:
+                    self._key = orjson.loads(buffer[self._string_start : position])
+                    self._expect_key = False
+                continue
+
+            match = _STRUCTURE.search(buffer, position)
+            if match is None:
+                position = len(buffer)
+                break
+            token = buffer[match.start()]
+            position = match.end()
+            if token == ord('"'):
+                self._in_string = True
+                self._string_start = match.start()
+            elif token == ord("{"):
+                self._depth += 1
+                if self._depth == 1:
+                    self._expect_key = True
+                elif self._in_members and self._depth == 3:
+                    self._item_start = match.start()
+                    # Items are usually flat objects, so try to parse up to the
+                    # first closing brace before scanning the item byte by byte.
+                    # A prefix that parses as an object always ends where the
+                    # object itself ends.
+                    end = buffer.find(b"}", position)
+                    if end == -1:
+                        # Wait for the rest of the item
+                        self._depth -= 1
+                        self._item_start = None
+                        position = match.start()
+                        break
+                    try:
+                        item = orjson.loads(buffer[match.start() : end + 1])
+                    except orjson.JSONDecodeError:
+                        continue
+                    items.append(item)
+                    self._depth -= 1
+                    self._item_start = None
+                    position = end + 1
+            elif token == ord("}"):
+                self._depth -= 1
+                if self._depth == 0:
+                    self._finish_value(position - 1)
+                    self.complete = True
+                elif self._depth == 2 and self._item_start is not None:
+                    items.append(orjson.loads(buffer[self._item_start : position]))
+                    self._item_start = None
+            elif token == ord("["):
+                self._depth += 1
+                if self._depth == 2 and self._key == self.member_key:
+                    self._in_members = True
+            elif token == ord("]"):
+                self._depth -= 1
+                if self._depth == 1:
+                    self._in_members = False
+            elif self._depth == 1:
+                if token == ord(":"):
+                    if self._key != self.member_key:
+                        self._value_start = position
+                else:
+                    self._finish_value(position - 1)
+                    self._expect_key = True
+
+        self._position = position
+        self._trim()
+        return items
+
+    def _finish_value(self, end: int) -> None:
+        """Store the top-level value that ends at the given position."""
+        if self._value_start is not None and self._key is not None:
+            self.document[self._key] = orjson.loads(
+                self._buffer[self._value_start : end]
+            )
+        self._value_start = None
+
+    def _trim(self) -> None:
+        """Drop the bytes of the buffer that are no longer needed."""
+        keep = self._position
+        for start in (
+            self._item_start,
+            self._value_start,
+            self._string_start if self._in_string else None,
+        ):
+            if start is not None:
+                keep = min(keep, start)
+        if keep == 0:
+            return
+        del self._buffer[:keep]
+        self._position -= keep
+        self._string_start -= keep
+        if self._item_start is not None:
+            self._item_start -= keep
+        if self._value_start is not None:
+            self._value_start -= keep
+
+
+@dataclass
+class UtilizationStream:
+    """Utilizations decoded while the response is being received.
+
+    Iterate over the stream to get the utilizations. Use it as an async
+    context manager to make sure the response is closed when iteration stops
+    early.
+    """
+
+    chunks: AsyncGenerator[bytes, None]
+
+    _parser: HydraCollectionParser = field(
+        init=False, default_factory=HydraCollectionParser
+    )
+    _pending: deque[Utilization] = field(init=False, default_factory=deque)
+
+    @property
+    def total_items(self) -> int | None:
+        """Get the total number of items, once it has been received."""
+        return self._parser.total_items
+
+    def __aiter__(self) -> Self:
+        """Get the stream as async iterator."""
+        return self
+
+    async def __anext__(self) -> Utilization:
+        """Get the next utilization.
+
+        Returns
+        -------
+            The next utilization of the response.
+
+        Raises
+        ------
+            StopAsyncIteration: If all utilizations have been received.
+            NedNLError: If the response ends before the document is complete.
+
+        """
+        while not self._pending:
+            chunk = await anext(self.chunks, None)
+            if chunk is None:
+                if not self._parser.complete:
+                    msg = "Unexpected end of response from NED NL API."
+                    raise NedNLError(msg)
+                raise StopAsyncIteration
+            self._pending.extend(decode_utilization_records(self._parser.feed(chunk)))
+        return self._pending.popleft()
+
+    async def aclose(self) -> None:
+        """Close the response."""
+        await self.chunks.aclose()
+
+    async def __aenter__(self) -> Self:
+        """Async enter.
+
+        Returns
+        -------
+            The UtilizationStream object.
+
+        """
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        """Async exit.
+
+        Args:
+        ----
+            _exc_info: Exec type.
+
+        """
+        await self.aclose()
@@ -0,0 +1,127 @@
+"""Asynchronous Python client for National Energy Dashboard NL."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Self
+
+import orjson
+
+from .models import UtilizationSeries
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .models import Utilization
+
+
+@dataclass(frozen=True, slots=True)
+class SyncWatermark:
+    """Object representing how far a utilization series has been synced."""
+
+    valid_from: datetime
+    last_update: datetime
+
+
+@dataclass(slots=True)
+class SyncResult:
+    """Object representing the changes found by a sync of a series."""
+
+    inserts: list[Utilization] = field(default_factory=list)
+    updates: list[Utilization] = field(default_factory=list)
+
+
+@dataclass
+class SyncState:
+    """Watermarks of synced utilization series.
+
+    The state is updated by `NedNL.sync_utilizations` after every successful
+    sync. Store it with `to_json` to continue where the previous run left off.
+    """
+
+    watermarks: dict[UtilizationSeries, SyncWatermark] = field(default_factory=dict)
+
+    def apply(
+        self,
+        series: UtilizationSeries,
+        utilizations: Iterable[Utilization],
+    ) -> SyncResult:
+        """Split fetched utilizations into inserts and updates.
+
+        Utilizations valid from after the watermark are inserts. Older ones are
+        updates if they were updated after the watermark, and are skipped
+        otherwise. The watermark of the series is moved to the latest valid
+        from and last update seen.
+
+        Args:
+        ----
+            series: The series the utilizations belong to.
+            utilizations: The utilizations fetched for the series.
+
+        Returns:
+        -------
+            The inserted and updated utilizations.
+
+        """
+        watermark = self.watermarks.get(series)
+        result = SyncResult()
+        for utilization in utilizations:
+            if watermark is None or utilization.valid_from > watermark.valid_from:
+                result.inserts.append(utilization)
+            elif utilization.last_update > watermark.last_update:
+                result.updates.append(utilization)
+
+        changed = result.inserts + result.updates
+        if changed:
+            valid_from = [item.valid_from for item in changed]
+            last_update = [item.last_update for item in changed]
+            if watermark is not None:
+                valid_from.append(watermark.valid_from)
+                last_update.append(watermark.last_update)
+            self.watermarks[series] = SyncWatermark(
+                valid_from=max(valid_from), last_update=max(last_update)
+            )
+        return result
+
+    def to_json(self) -> bytes:
+        """Serialize the state to JSON.
+
+        Returns
+        -------
+            The JSON representation of the state.
+
+        """
+        return orjson.dumps(
+            [
+                {
+                    "series": series,
+                    "valid_from": watermark.valid_from,
+                    "last_update": watermark.last_update,
+                }
+                for series, watermark in self.watermarks.items()
+            ]
+        )
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> Self:
+        """Deserialize a state from JSON.
+
+        Args:
+        ----
+            data: The JSON representation of the state, as made by `to_json`.
+
+        Returns:
+        -------
+            The sync state.
+
+        """
+        return cls(
+            watermarks={
+                UtilizationSeries(**item["series"]): SyncWatermark(
+                    valid_from=datetime.fromisoformat(item["valid_from"]),
+                    last_update=datetime.fromisoformat(item["last_update"]),
+                )
+                for item in orjson.loads(data)
+            }
+        )
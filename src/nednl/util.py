@@ -0,0 +1,239 @@
+"""Asynchronous Python client for National Energy Dashboard NL."""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import contextmanager
+from datetime import UTC, date, datetime, time, timedelta
+from typing import TYPE_CHECKING, Literal
+from zoneinfo import ZoneInfo
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+Shard = Literal["day", "week", "month", "year"]
+GranularityName = Literal["10Min", "15Min", "Hour", "Day", "Month", "Year"]
+
+_FIXED_STEPS: dict[str, timedelta] = {
+    "10Min": timedelta(minutes=10),
+    "15Min": timedelta(minutes=15),
+    "Hour": timedelta(hours=1),
+}
+_CALENDAR_SHARDS: dict[str, Shard] = {"Day": "day", "Month": "month", "Year": "year"}
+
+
+def parse_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 date or datetime, as used in the query parameters.
+
+    Args:
+    ----
+        value: The date or datetime, for example '2024-03-29'.
+
+    Returns:
+    -------
+        The datetime, in UTC if the value has no timezone.
+
+    Raises:
+    ------
+        ValueError: If the value is not a valid ISO 8601 date or datetime.
+
+    """
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=UTC)
+    return moment
+
+
+def _next_boundary(value: date, shard: Shard) -> date:
+    """Get the start of the shard following the one containing the value.
+
+    Args:
+    ----
+        value: The date or datetime to find the next boundary for.
+        shard: The size of the shards.
+
+    Returns:
+    -------
+        The next shard boundary, of the same type (and timezone) as the value.
+
+    Raises:
+    ------
+        ValueError: If the shard size is unknown.
+
+    """
+    day = value.date() if isinstance(value, datetime) else value
+    if shard == "day":
+        boundary = day + timedelta(days=1)
+    elif shard == "week":
+        boundary = day + timedelta(days=7 - day.weekday())
+    elif shard == "month":
+        boundary = (day.replace(day=1) + timedelta(days=32)).replace(day=1)
+    elif shard == "year":
+        boundary = date(day.year + 1, 1, 1)
+    else:
+        msg = f"Unknown shard size: {shard}"
+        raise ValueError(msg)
+
+    if isinstance(value, datetime):
+        return datetime.combine(boundary, time(), tzinfo=value.tzinfo)
+    return boundary
+
+
+def split_date_range(start: date, end: date, shard: Shard) -> list[tuple[date, date]]:
+    """Split a date range into consecutive, non-overlapping shards.
+
+    Shards are aligned to calendar boundaries (weeks start on Monday), except
+    for the first and last shard which start and end at the given values. Each
+    shard includes its start and excludes its end.
+
+    Args:
+    ----
+        start: The start of the range (inclusive).
+        end: The end of the range (exclusive).
+        shard: The size of the shards.
+
+    Returns:
+    -------
+        List of (start, end) tuples, in chronological order.
+
+    """
+    shards: list[tuple[date, date]] = []
+    shard_start = start
+    while shard_start < end:
+        shard_end = min(_next_boundary(shard_start, shard), end)
+        shards.append((shard_start, shard_end))
+        shard_start = shard_end
+    return shards
+
+
+def floor_slot(
+    moment: datetime,
+    granularity: GranularityName | str,
+    timezone: str = "UTC",
+) -> datetime:
+    """Get the start of the granularity slot containing a moment.
+
+    Days, months and years start at midnight in the given timezone, so slots
+    follow daylight saving time. Shorter slots are aligned in UTC.
+
+    Args:
+    ----
+        moment: A timezone aware datetime.
+        granularity: The name of the granularity, for example 'Hour'.
+        timezone: The name of the granularity timezone, for example 'UTC'.
+
+    Returns:
+    -------
+        The start of the slot, in UTC.
+
+    Raises:
+    ------
+        ValueError: If the granularity is unknown.
+
+    """
+    step = _FIXED_STEPS.get(granularity)
+    if step is not None:
+        seconds = int(step.total_seconds())
+        timestamp = int(moment.timestamp())
+        return datetime.fromtimestamp(timestamp - timestamp % seconds, UTC)
+
+    zone = ZoneInfo(timezone)
+    day = moment.astimezone(zone).date()
+    if granularity == "Day":
+        start = day
+    elif granularity == "Month":
+        start = day.replace(day=1)
+    elif granularity == "Year":
+        start = date(day.year, 1, 1)
+    else:
+        msg = f"Unknown granularity: {granularity}"
+        raise ValueError(msg)
+    return datetime.combine(start, time(), tzinfo=zone).astimezone(UTC)
+
+
+def next_slot(
+    slot: datetime,
+    granularity: GranularityName | str,
+    timezone: str = "UTC",
+) -> datetime:
+    """Get the start of the granularity slot following a slot.
+
+    Args:
+    ----
+        slot: The start of a slot, as returned by `floor_slot`.
+        granularity: The name of the granularity, for example 'Hour'.
+        timezone: The name of the granularity timezone, for example 'UTC'.
+
+    Returns:
+    -------
+        The start of the next slot, in UTC.
+
+    Raises:
+    ------
+        ValueError: If the granularity is unknown.
+
+    """
+    step = _FIXED_STEPS.get(granularity)
+    if step is not None:
+        return slot + step
+    if granularity not in _CALENDAR_SHARDS:
+        msg = f"Unknown granularity: {granularity}"
+        raise ValueError(msg)
+    zone = ZoneInfo(timezone)
+    boundary = _next_boundary(
+        slot.astimezone(zone).date(), _CALENDAR_SHARDS[granularity]
+    )
+    return datetime.combine(boundary, time(), tzinfo=zone).astimezone(UTC)
+
+
+def iter_slots(
+    start: datetime,
+    end: datetime,
+    granularity: GranularityName | str,
+    timezone: str = "UTC",
+) -> Iterator[datetime]:
+    """Iterate over the starts of the granularity slots within a period.
+
+    Args:
+    ----
+        start: The start of the period (inclusive).
+        end: The end of the period (exclusive).
+        granularity: The name of the granularity, for example 'Hour'.
+        timezone: The name of the granularity timezone, for example 'UTC'.
+
+    Yields:
+    ------
+        The start of every slot that starts within the period, in UTC.
+
+    """
+    slot = floor_slot(start, granularity, timezone)
+    if slot < start:
+        slot = next_slot(slot, granularity, timezone)
+    while slot < end:
+        yield slot
+        slot = next_slot(slot, granularity, timezone)
+
+
+@contextmanager
+def sqlite_transaction(path: str | Path) -> Iterator[sqlite3.Connection]:
+    """Open a SQLite database for a single transaction.
+
+    The transaction is committed when the block succeeds and rolled back when
+    it raises, after which the connection is closed.
+
+    Args:
+    ----
+        path: The path of the database file.
+
+    Yields:
+    ------
+        The connection to the database.
+
+    """
+    connection = sqlite3.connect(path)
+    try:
+        with connection:
+            yield connection
+    finally:
+        connection.close()
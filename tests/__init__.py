@@ -1,6 +1,28 @@
 """Asynchronous Python client for National Energy Dashboard NL."""
 
 from pathlib import Path
+from typing import TypedDict
+
+
+class SeriesIds(TypedDict):
+    """Ids of a utilization series, as keyword arguments of NedNL."""
+
+    point_id: int
+    type_id: int
+    granularity_id: int
+    granularity_timezone_id: int
+    classification_id: int
+    activity_id: int
+
+
+SERIES: SeriesIds = {
+    "point_id": 0,
+    "type_id": 2,
+    "granularity_id": 3,
+    "granularity_timezone_id": 1,
+    "classification_id": 2,
+    "activity_id": 1,
+}
 
 
 def load_fixtures(filename: str) -> str:
@@ -0,0 +1,269 @@
+"""Tests for the caches of National Energy Dashboard NL."""
+
+# pylint: disable=protected-access
+import asyncio
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from aiohttp import ClientSession
+from aiohttp.web_request import BaseRequest
+from aresponses import Response, ResponsesMockServer
+from yarl import URL
+
+from nednl import NedNL, SQLiteResponseCache, TTLCache
+from nednl.exceptions import NedNLServerError
+
+from . import SERIES, load_fixtures
+
+
+def add_points(aresponses: ResponsesMockServer, repeat: int = 1) -> None:
+    """Register the points endpoint."""
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/points",
+        "GET",
+        aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("points.json"),
+        ),
+        repeat=repeat,
+    )
+
+
+async def test_cached_reference_data(aresponses: ResponsesMockServer) -> None:
+    """Test reference data is only fetched once while cached."""
+    add_points(aresponses)
+    async with ClientSession() as session:
+        client = NedNL(api_key="TEST", session=session, cache=TTLCache())
+        first = await client.all_points()
+        first.clear()
+        second = await client.all_points()
+    assert second
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_concurrent_calls_share_fetch(aresponses: ResponsesMockServer) -> None:
+    """Test concurrent calls for the same endpoint share a single request."""
+    add_points(aresponses)
+    async with ClientSession() as session:
+        client = NedNL(api_key="TEST", session=session, cache=TTLCache())
+        first, second = await asyncio.gather(client.all_points(), client.all_points())
+    assert first == second
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_invalidate_and_ttl(aresponses: ResponsesMockServer) -> None:
+    """Test invalidated or expired entries are fetched again."""
+    add_points(aresponses, repeat=3)
+    cache = TTLCache(ttls={"points": 0})
+    async with ClientSession() as session:
+        client = NedNL(api_key="TEST", session=session, cache=cache)
+        await client.all_points()
+        await client.all_points()
+        cache.ttls.clear()
+        cache.invalidate("points")
+        await client.all_points()
+        await client.all_points()
+        cache.invalidate()
+        cache.invalidate("points")
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_invalidate_during_fetch() -> None:
+    """Test a fetch that is in flight during an invalidation is not cached."""
+    cache = TTLCache()
+    release = asyncio.Event()
+
+    async def fetch_old() -> str:
+        await release.wait()
+        return "old"
+
+    async def fetch_new() -> str:
+        return "new"
+
+    pending = asyncio.create_task(cache.get_or_fetch("points", fetch_old))
+    await asyncio.sleep(0)
+    cache.invalidate("points")
+    release.set()
+    assert await pending == "old"
+    assert await cache.get_or_fetch("points", fetch_new) == "new"
+
+
+async def test_errors_are_not_cached(aresponses: ResponsesMockServer) -> None:
+    """Test a failed fetch is not cached."""
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/points",
+        "GET",
+        aresponses.Response(
+            status=500,
+            content_type="application/ld+json",
+            body=load_fixtures("error_500.json"),
+        ),
+    )
+    add_points(aresponses)
+    async with ClientSession() as session:
+        client = NedNL(api_key="TEST", session=session, cache=TTLCache())
+        with pytest.raises(NedNLServerError):
+            await client.all_points()
+        assert await client.all_points()
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_response_cache_revalidation(
+    aresponses: ResponsesMockServer,
+    tmp_path: Path,
+) -> None:
+    """Test a cached response is revalidated with its ETag."""
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/points",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/ld+json", "ETag": '"v1"'},
+            body=load_fixtures("points.json"),
+        ),
+    )
+    conditional_headers: list[str | None] = []
+
+    async def not_modified(request: BaseRequest) -> Response:
+        conditional_headers.append(request.headers.get("If-None-Match"))
+        return aresponses.Response(status=304)
+
+    aresponses.add("api.ned.nl", "/v1/points", "GET", not_modified)
+
+    response_cache = SQLiteResponseCache(tmp_path / "cache.db")
+    async with ClientSession() as session:
+        client = NedNL(api_key="TEST", session=session, response_cache=response_cache)
+        first = await client.all_points()
+        # A new client, as if the worker restarted
+        client = NedNL(
+            api_key="TEST",
+            session=session,
+            response_cache=SQLiteResponseCache(tmp_path / "cache.db"),
+        )
+        second = await client.all_points()
+    assert first == second
+    assert conditional_headers == ['"v1"']
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_response_cache_finalized(
+    aresponses: ResponsesMockServer,
+    tmp_path: Path,
+) -> None:
+    """Test a finalized utilization window is served without a request."""
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/utilizations",
+        "GET",
+        aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("utilizations.json"),
+        ),
+    )
+    async with ClientSession() as session:
+        client = NedNL(
+            api_key="TEST",
+            session=session,
+            response_cache=SQLiteResponseCache(tmp_path / "cache.db"),
+        )
+        for _ in range(2):
+            utilizations = await client.utilization(
+                point_id=0,
+                type_id=2,
+                granularity_id=3,
+                granularity_timezone_id=1,
+                classification_id=2,
+                activity_id=1,
+                start_date="2024-03-29",
+                end_date="2024-03-30",
+            )
+            assert len(utilizations) == 143
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_response_cache_revalidated_until_final(
+    aresponses: ResponsesMockServer,
+    tmp_path: Path,
+) -> None:
+    """Test a revalidated window is served from the cache once it is final."""
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/utilizations",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/ld+json", "ETag": '"v1"'},
+            body=load_fixtures("utilizations.json"),
+        ),
+    )
+    aresponses.add(
+        "api.ned.nl", "/v1/utilizations", "GET", aresponses.Response(status=304)
+    )
+    async with ClientSession() as session:
+        # The window is still recent when it is first cached
+        client = NedNL(
+            api_key="TEST",
+            session=session,
+            response_cache=SQLiteResponseCache(tmp_path / "cache.db"),
+            finalized_after=timedelta(days=365_000),
+        )
+        first = await client.utilization(
+            **SERIES, start_date="2024-03-29", end_date="2024-03-30"
+        )
+        client.finalized_after = timedelta(days=7)
+        second = await client.utilization(
+            **SERIES, start_date="2024-03-29", end_date="2024-03-30"
+        )
+        third = await client.utilization(
+            **SERIES, start_date="2024-03-29", end_date="2024-03-30"
+        )
+    assert first == second == third
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_response_cache_without_validators(
+    aresponses: ResponsesMockServer,
+    tmp_path: Path,
+) -> None:
+    """Test responses without validators are not cached."""
+    add_points(aresponses, repeat=2)
+    async with ClientSession() as session:
+        client = NedNL(
+            api_key="TEST",
+            session=session,
+            response_cache=SQLiteResponseCache(tmp_path / "cache.db"),
+        )
+        await client.all_points()
+        await client.all_points()
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.parametrize(
+    ("params", "expected"),
+    [
+        ({"validfrom[strictly_before]": "2024-03-30"}, True),
+        ({"validfrom[before]": "2024-03-30T00:00:00+01:00"}, True),
+        ({"validfrom[strictly_before]": "3024-03-30"}, False),
+        ({"validfrom[strictly_before]": "yesterday"}, False),
+        ({}, False),
+    ],
+)
+def test_is_finalized(params: dict[str, str], expected: bool) -> None:  # noqa: FBT001
+    """Test which utilization windows are considered final."""
+    client = NedNL(api_key="TEST")
+    assert client._is_finalized(URL("https://api.ned.nl/v1/test"), params) is expected
+
+
+def test_cache_key_normalized() -> None:
+    """Test the cache key does not depend on the parameter order."""
+    url = URL("https://api.ned.nl/v1/utilizations?type=2")
+    assert NedNL._cache_key(url, {"point": 0, "activity": 1}) == NedNL._cache_key(
+        URL("https://api.ned.nl/v1/utilizations"),
+        {"activity": 1, "type": 2, "point": "0"},
+    )
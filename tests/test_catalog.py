@@ -0,0 +1,125 @@
+"""Tests for the reference data catalog of National Energy Dashboard NL."""
+
+import pytest
+from aiohttp import ClientSession
+from aiohttp.web_request import BaseRequest
+from aresponses import Response, ResponsesMockServer
+
+from nednl import NedCatalog, NedNL, Type, UtilizationSeries
+
+from . import SERIES, load_fixtures
+
+REFERENCE_DATA = {
+    "activities": "activities.json",
+    "classifications": "classifications.json",
+    "granularities": "granularities.json",
+    "granularity_time_zones": "granularity_timezones.json",
+    "points": "points.json",
+    "types": "types.json",
+}
+
+
+def add_reference_data(aresponses: ResponsesMockServer) -> None:
+    """Register the responses of all reference data endpoints."""
+    for uri, fixture in REFERENCE_DATA.items():
+        aresponses.add(
+            "api.ned.nl",
+            f"/v1/{uri}",
+            "GET",
+            aresponses.Response(
+                status=200,
+                content_type="application/ld+json",
+                body=load_fixtures(fixture),
+            ),
+        )
+
+
+async def test_catalog_lookups(aresponses: ResponsesMockServer) -> None:
+    """Test reference data is found by id, name and shortname."""
+    add_reference_data(aresponses)
+    async with ClientSession() as session:
+        catalog = await NedCatalog.load(NedNL(api_key="TEST", session=session))
+
+    solar = catalog.get_type(2)
+    assert solar.name == "Solar"
+    assert catalog.get_type("solar") is solar
+    assert catalog.get_type("S") is solar
+    assert catalog.get_type(solar) is solar
+    assert catalog.get_point("NL").id == 0
+    assert catalog.get_granularity("10min").id == 3
+    assert catalog.get_granularity_timezone("Europe/Amsterdam").id == 1
+    assert catalog.get_classification("Current").id == 2
+    assert catalog.get_activity("Providing").id == 1
+    assert catalog.series(
+        point_id="Nederland",
+        type_id=solar,
+        granularity_id="10Min",
+        granularity_timezone_id=1,
+        classification_id="current",
+        activity_id="providing",
+    ) == UtilizationSeries(**SERIES)
+
+    with pytest.raises(ValueError, match="Unknown type: 'Nuclear fusion'"):
+        catalog.get_type("Nuclear fusion")
+    with pytest.raises(ValueError, match="Unknown point: 999"):
+        catalog.get_point(999)
+    aresponses.assert_plan_strictly_followed()
+
+
+def test_catalog_serialization() -> None:
+    """Test a catalog is restored from JSON with working indexes."""
+    catalog = NedCatalog(types=[Type(id=2, name="Solar", shortname="S")])
+    restored = NedCatalog.from_json(catalog.to_json())
+
+    assert restored == catalog
+    assert restored.get_type("s").id == 2
+    assert restored.points == []
+
+
+async def test_utilization_by_name(aresponses: ResponsesMockServer) -> None:
+    """Test utilizations can be requested by names and reference data."""
+    query: dict[str, str] = {}
+
+    async def utilizations(request: BaseRequest) -> Response:
+        query.update(request.query)
+        return aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("utilizations_page_2.json"),
+        )
+
+    add_reference_data(aresponses)
+    aresponses.add("api.ned.nl", "/v1/utilizations", "GET", utilizations)
+    async with ClientSession() as session:
+        client = NedNL(api_key="TEST", session=session)
+        with pytest.raises(ValueError, match="catalog"):
+            await client.utilization(
+                point_id=SERIES["point_id"],
+                type_id="Solar",
+                granularity_id=SERIES["granularity_id"],
+                granularity_timezone_id=SERIES["granularity_timezone_id"],
+                classification_id=SERIES["classification_id"],
+                activity_id=SERIES["activity_id"],
+                start_date="2024-03-29",
+                end_date="2024-03-30",
+            )
+
+        catalog = await client.load_catalog()
+        await client.utilization(
+            point_id="NL",
+            type_id=catalog.get_type("Solar"),
+            granularity_id="10Min",
+            granularity_timezone_id="Europe/Amsterdam",
+            classification_id="Current",
+            activity_id="Providing",
+            start_date="2024-03-29",
+            end_date="2024-03-30",
+        )
+
+    assert client.catalog is catalog
+    assert {key: query[key] for key in ("point", "type", "granularity")} == {
+        "point": "0",
+        "type": "2",
+        "granularity": "3",
+    }
+    aresponses.assert_plan_strictly_followed()
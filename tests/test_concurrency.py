@@ -0,0 +1,133 @@
+"""Tests for the adaptive concurrency of National Energy Dashboard NL."""
+
+import asyncio
+
+import pytest
+from aiohttp import ClientSession
+from aresponses import ResponsesMockServer
+
+from nednl import AdaptiveConcurrency, NedNL, RequestMetrics
+from nednl.exceptions import (
+    NedNLNotFoundError,
+    NedNLRateLimitError,
+    NedNLServerError,
+)
+
+from . import load_fixtures
+
+
+async def test_additive_increase() -> None:
+    """Test the limit grows by one per limit's worth of stable requests."""
+    controller = AdaptiveConcurrency(initial_limit=2, max_limit=3)
+    # Requests of about 10 ms, so the latency is stable
+    for _ in range(2):
+        controller.release(await controller.acquire() - 0.01)
+    assert controller.limit == 2
+    controller.release(await controller.acquire() - 0.01)
+    assert controller.limit == 3
+    for _ in range(10):
+        controller.release(await controller.acquire() - 0.01)
+    assert controller.limit == 3
+    assert controller.in_flight == 0
+
+
+async def test_no_increase_on_slow_requests() -> None:
+    """Test the limit is held when the latency rises above the baseline."""
+    controller = AdaptiveConcurrency(initial_limit=2, latency_tolerance=2.0)
+    controller.release(await controller.acquire() - 0.01)
+    limit = controller.limit
+    for _ in range(10):
+        # A second is far slower than the baseline of the first request
+        controller.release(await controller.acquire() - 1)
+    assert controller.limit == limit
+
+
+async def test_multiplicative_decrease() -> None:
+    """Test overloads halve the limit, once for requests in flight together."""
+    controller = AdaptiveConcurrency(initial_limit=16)
+    slots = [await controller.acquire() for _ in range(4)]
+    for started in slots:
+        controller.release(started, NedNLRateLimitError({}))
+    assert controller.limit == 8
+
+    controller.release(await controller.acquire(), NedNLServerError({}))
+    assert controller.limit == 4
+    controller.release(await controller.acquire(), NedNLNotFoundError({}))
+    assert controller.limit == 4
+
+    for _ in range(5):
+        controller.release(await controller.acquire(), NedNLServerError({}))
+    assert controller.limit == 1
+
+
+async def test_waiters_are_served_in_order() -> None:
+    """Test requests over the limit wait for a free slot."""
+    controller = AdaptiveConcurrency(initial_limit=1, max_limit=1)
+    started = await controller.acquire()
+    order: list[int] = []
+
+    async def request(number: int) -> None:
+        controller.release(await controller.acquire())
+        order.append(number)
+
+    waiting = [asyncio.create_task(request(number)) for number in range(3)]
+    cancelled = asyncio.create_task(controller.acquire())
+    await asyncio.sleep(0)
+    assert controller.in_flight == 1
+    cancelled.cancel()
+    controller.release(started)
+    await asyncio.gather(*waiting)
+    assert order == [0, 1, 2]
+    assert controller.in_flight == 0
+
+
+def test_invalid_configuration() -> None:
+    """Test limits and factors are validated."""
+    with pytest.raises(ValueError, match="Limits"):
+        AdaptiveConcurrency(initial_limit=0)
+    with pytest.raises(ValueError, match="Limits"):
+        AdaptiveConcurrency(initial_limit=8, max_limit=4)
+    with pytest.raises(ValueError, match="decrease"):
+        AdaptiveConcurrency(decrease=1)
+
+
+async def test_client_adapts_to_rate_limiting(
+    aresponses: ResponsesMockServer,
+) -> None:
+    """Test a rate limited request lowers the limit of the client."""
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/points",
+        "GET",
+        aresponses.Response(
+            status=429,
+            headers={"Content-Type": "application/problem+json"},
+            text=load_fixtures("error_429.json"),
+        ),
+    )
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/points",
+        "GET",
+        aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("points.json"),
+        ),
+    )
+    controller = AdaptiveConcurrency(initial_limit=8)
+    reported: list[RequestMetrics] = []
+    async with ClientSession() as session:
+        client = NedNL(
+            api_key="TEST",
+            session=session,
+            concurrency=controller,
+            hooks=[reported.append],
+        )
+        with pytest.raises(NedNLRateLimitError):
+            await client.all_points()
+        await client.all_points()
+
+    assert controller.in_flight == 0
+    assert [metrics.concurrency_limit for metrics in reported] == [4, 4]
+    assert reported[1].concurrency_wait is not None
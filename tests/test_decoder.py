@@ -0,0 +1,50 @@
+"""Tests for the fast utilization decoder of National Energy Dashboard NL."""
+
+from datetime import UTC
+
+import pytest
+
+from nednl.decoder import (
+    decode_compact_utilizations,
+    decode_timestamps,
+    decode_utilizations,
+)
+from nednl.models import UtilizationsResponse
+
+from . import load_fixtures
+
+
+@pytest.mark.parametrize(
+    "fixture",
+    ["utilizations.json", "utilizations_page_1.json", "utilizations_page_2.json"],
+)
+def test_decode_utilizations(fixture: str) -> None:
+    """Test the fast path decodes exactly like the models."""
+    body = load_fixtures(fixture)
+    assert decode_utilizations(body.encode()) == UtilizationsResponse.from_json(body)
+
+
+def test_decode_compact_utilizations() -> None:
+    """Test compact utilizations convert to the same utilizations as the models."""
+    body = load_fixtures("utilizations.json")
+    compact = decode_compact_utilizations(body.encode())
+    expected = UtilizationsResponse.from_json(body).data
+    assert [item.to_utilization() for item in compact] == expected
+    assert compact[0].valid_from == expected[0].valid_from
+    assert compact[0].valid_from_timestamp == int(expected[0].valid_from.timestamp())
+    assert compact[0].valid_from.tzinfo is UTC
+
+
+def test_decode_timestamps() -> None:
+    """Test timestamps are decoded to epoch seconds."""
+    records = [
+        {
+            "validfrom": "2024-03-29T00:00:00+00:00",
+            "validto": "2024-03-29T01:00:00+01:00",
+        },
+        {"validfrom": "2024-03-29T00:10:00+00:00", "validto": "2024-03-29T00:20:00Z"},
+    ]
+    assert decode_timestamps(records, "validfrom", "validto") == (
+        [1711670400, 1711671000],
+        [1711670400, 1711671600],
+    )
@@ -0,0 +1,173 @@
+"""Tests for the bulk export of National Energy Dashboard NL."""
+
+import asyncio
+import csv
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from pathlib import Path
+
+import orjson
+import pytest
+from aiohttp import ClientSession
+from aiohttp.web_request import BaseRequest
+from aresponses import Response, ResponsesMockServer
+
+from nednl import NedNL, UtilizationSeries
+from nednl.cli import main
+from nednl.export import export_utilizations, series_directory, write_frame
+from nednl.frame import UtilizationFrame
+
+from . import SERIES, load_fixtures
+from .test_utilizations import add_utilization_pages
+
+SOLAR = UtilizationSeries(**SERIES)
+SOLAR_DIRECTORY = Path(
+    "point=0",
+    "type=2",
+    "granularity=3",
+    "granularity_timezone=1",
+    "classification=2",
+    "activity=1",
+)
+
+
+async def test_export_csv(aresponses: ResponsesMockServer, tmp_path: Path) -> None:
+    """Test every page is written to a part file of its series."""
+    add_utilization_pages(aresponses)
+    async with ClientSession() as session:
+        client = NedNL(api_key="TEST", session=session)
+        result = await export_utilizations(
+            client,
+            [SOLAR, SOLAR],
+            start_date=date(2024, 3, 29),
+            end_date=date(2024, 3, 30),
+            output=tmp_path,
+        )
+
+    assert (result.rows, result.files) == (4, 2)
+    assert series_directory(tmp_path, SOLAR) == tmp_path / SOLAR_DIRECTORY
+    with (tmp_path / SOLAR_DIRECTORY / "part-2024-03-29-0001.csv").open() as file:
+        rows = list(csv.DictReader(file))
+    assert [row["volume"] for row in rows] == ["100", "110"]
+    assert rows[0]["valid_from"] == "2024-03-29T00:00:00+00:00"
+    assert (tmp_path / SOLAR_DIRECTORY / "part-2024-03-29-0002.csv").exists()
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_export_in_process_pool(
+    aresponses: ResponsesMockServer,
+    tmp_path: Path,
+) -> None:
+    """Test pages are decoded and written by worker processes."""
+    add_utilization_pages(aresponses)
+    async with ClientSession() as session:
+        client = NedNL(api_key="TEST", session=session)
+        with ProcessPoolExecutor(1) as executor:
+            result = await export_utilizations(
+                client,
+                [SOLAR],
+                start_date=date(2024, 3, 29),
+                end_date=date(2024, 3, 30),
+                output=tmp_path,
+                file_format="jsonl",
+                executor=executor,
+            )
+
+    assert result.rows == 4
+    lines = (
+        (tmp_path / SOLAR_DIRECTORY / "part-2024-03-29-0002.jsonl")
+        .read_bytes()
+        .splitlines()
+    )
+    assert [orjson.loads(line)["volume"] for line in lines] == [120, 130]
+
+
+def test_write_frame_unknown_format(tmp_path: Path) -> None:
+    """Test an unknown export format is rejected."""
+    with pytest.raises(ValueError, match="Unknown export format"):
+        write_frame(UtilizationFrame(), tmp_path / "part.xml", "xml")  # type: ignore[arg-type]
+
+
+async def test_cli_export(
+    aresponses: ResponsesMockServer,
+    tmp_path: Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    """Test the export command resolves 'all' and writes the pages."""
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/activities",
+        "GET",
+        aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("activities.json"),
+        ),
+    )
+    requested: list[str] = []
+
+    async def utilizations(request: BaseRequest) -> Response:
+        requested.append(request.query["activity"])
+        return aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("utilizations_page_2.json"),
+        )
+
+    aresponses.add("api.ned.nl", "/v1/utilizations", "GET", utilizations, repeat=2)
+
+    # The command runs its own event loop
+    exit_code = await asyncio.to_thread(
+        main,
+        [
+            "--api-key",
+            "TEST",
+            "export",
+            "--points",
+            "0",
+            "--types",
+            "2",
+            "--activities",
+            "all",
+            "--from",
+            "2024-03-29",
+            "--to",
+            "2024-03-30",
+            "--output",
+            str(tmp_path),
+        ],
+    )
+
+    assert exit_code == 0
+    assert sorted(requested) == ["1", "2"]
+    assert capsys.readouterr().out == f"Exported 4 rows to 2 files in {tmp_path}\n"
+
+
+def test_cli_requires_api_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the command line fails without an API key."""
+    monkeypatch.delenv("NEDNL_API_KEY", raising=False)
+    with pytest.raises(SystemExit):
+        main(["export", "--points", "0", "--types", "2", "--from", "2024-03-29"])
+
+
+def test_cli_requires_positive_concurrency(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test the command line rejects a concurrency below one."""
+    with pytest.raises(SystemExit):
+        main(
+            [
+                "--api-key",
+                "key",
+                "export",
+                "--points",
+                "0",
+                "--types",
+                "2",
+                "--from",
+                "2024-03-29",
+                "--to",
+                "2024-03-30",
+                "--max-concurrency",
+                "0",
+            ]
+        )
+    assert "--max-concurrency must be at least 1" in capsys.readouterr().err
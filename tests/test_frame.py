@@ -0,0 +1,183 @@
+"""Tests for the columnar utilization frame of National Energy Dashboard NL."""
+
+from array import array
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+from aiohttp.web_request import BaseRequest
+from aresponses import Response, ResponsesMockServer
+
+from nednl import Granularity, GranularityTimezone, NedNL, Utilization, UtilizationFrame
+from nednl.models import UtilizationsResponse
+
+from . import SERIES, load_fixtures
+
+
+async def test_utilization_as_frame(
+    aresponses: ResponsesMockServer,
+    nednl_client: NedNL,
+) -> None:
+    """Test utilizations can be returned as frame."""
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/utilizations",
+        "GET",
+        aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("utilizations.json"),
+        ),
+    )
+    frame = await nednl_client.utilization(
+        point_id=0,
+        type_id=2,
+        granularity_id=3,
+        granularity_timezone_id=1,
+        classification_id=2,
+        activity_id=1,
+        start_date="2024-03-29",
+        end_date="2024-03-30",
+        as_frame=True,
+    )
+    expected = UtilizationsResponse.from_json(load_fixtures("utilizations.json")).data
+    assert len(frame) == 143
+    assert frame.to_utilizations() == expected
+    assert frame[0] == expected[0]
+
+
+async def test_backfill_as_frame(
+    aresponses: ResponsesMockServer,
+    nednl_client: NedNL,
+) -> None:
+    """Test the pages of all shards are combined into a single frame."""
+
+    async def response_handler(request: BaseRequest) -> Response:
+        start = request.query.get("validfrom[after]", "")
+        # The second day overlaps the last rows of the first day
+        page = 2 if "page" in request.query or start == "2024-03-30" else 1
+        return aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures(f"utilizations_page_{page}.json"),
+        )
+
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/utilizations",
+        "GET",
+        response_handler,
+        repeat=3,
+    )
+    frame = await nednl_client.backfill_utilizations(
+        **SERIES,
+        start_date=date(2024, 3, 29),
+        end_date=date(2024, 3, 31),
+        shard="day",
+        as_frame=True,
+    )
+    expected = [
+        utilization
+        for page in (1, 2)
+        for utilization in UtilizationsResponse.from_json(
+            load_fixtures(f"utilizations_page_{page}.json")
+        ).data
+    ]
+    assert frame.to_utilizations() == expected
+
+
+def test_frame_slicing_and_aggregation() -> None:
+    """Test rows can be selected and aggregated per column."""
+    frame = UtilizationFrame.from_json(load_fixtures("utilizations_page_1.json"))
+    frame = UtilizationFrame.concat(
+        [UtilizationFrame.from_json(load_fixtures("utilizations_page_2.json")), frame]
+    )
+    assert list(frame.volume) == [100, 110, 120, 130]
+    assert frame.sum("volume") == 460
+    assert frame.mean("volume") == 115
+    assert frame.min("capacity") == 600
+    assert frame.max("capacity") == 780
+
+    selection = frame.between(
+        datetime(2024, 3, 29, 0, 10, tzinfo=UTC),
+        datetime(2024, 3, 29, 0, 30, tzinfo=UTC),
+    )
+    assert list(selection.volume) == [110, 120]
+    assert list(frame[2:].id) == [64429489557, 64429627602]
+
+
+def test_frame_unique() -> None:
+    """Test repeated rows are dropped, keeping the first row of every id."""
+    page = UtilizationFrame.from_json(load_fixtures("utilizations_page_1.json"))
+    assert page.unique() is page
+    frame = UtilizationFrame.concat([page, page[1:]])
+    assert list(frame.volume) == [100, 110, 110]
+    assert list(frame.unique().volume) == [100, 110]
+
+
+def test_frame_from_utilizations() -> None:
+    """Test a frame is ordered by valid from when created from utilizations."""
+    utilizations = UtilizationsResponse.from_json(
+        load_fixtures("utilizations_page_1.json")
+    ).data
+    frame = UtilizationFrame.from_utilizations(reversed(utilizations))
+    assert frame.to_utilizations() == utilizations
+
+
+def test_empty_frame() -> None:
+    """Test aggregations of an empty frame."""
+    frame = UtilizationFrame()
+    assert len(frame) == 0
+    assert frame.sum("volume") == 0
+    assert frame.mean("volume") is None
+    assert frame.min("volume") is None
+    assert frame.max("volume") is None
+
+
+def test_frame_resample() -> None:
+    """Test rows are aggregated per slot with the right aggregation per column."""
+    frame = UtilizationFrame.concat(
+        UtilizationFrame.from_json(load_fixtures(f"utilizations_page_{page}.json"))
+        for page in (1, 2)
+    )
+    frame.emission = array("q", [10, 20, 30, 40])
+    frame.emission_factor = array("d", [0.1, 0.2, 0.3, 0.4])
+    resampled = frame.resample(Granularity(id=5, name="Hour"))
+    assert len(resampled) == 1
+    assert list(resampled.id) == [0]
+    assert list(resampled.volume) == [460]
+    assert list(resampled.emission) == [100]
+    assert list(resampled.capacity) == [690]
+    assert resampled.percentage[0] == pytest.approx(0.5)
+    assert resampled.emission_factor[0] == pytest.approx(
+        (0.1 * 100 + 0.2 * 110 + 0.3 * 120 + 0.4 * 130) / 460
+    )
+    assert resampled[0].valid_from == datetime(2024, 3, 29, tzinfo=UTC)
+    assert resampled[0].valid_to == datetime(2024, 3, 29, 1, tzinfo=UTC)
+
+
+def test_frame_resample_daylight_saving() -> None:
+    """Test days in Europe/Amsterdam follow daylight saving time."""
+    start = datetime(2024, 3, 30, 12, tzinfo=UTC)
+    frame = UtilizationFrame.from_utilizations(
+        Utilization(
+            id=hour,
+            capacity=10,
+            volume=1,
+            percentage=0.1,
+            emission=0,
+            emission_factor=0.0,
+            valid_from=start + timedelta(hours=hour),
+            valid_to=start + timedelta(hours=hour + 1),
+            last_update=start,
+        )
+        for hour in range(48)
+    )
+    resampled = frame.resample(
+        "Day", GranularityTimezone(id=1, name="Europe/Amsterdam")
+    )
+    # 12:00 UTC until midnight (23:00 UTC), a 23 hour day, and the rest
+    assert list(resampled.volume) == [11, 23, 14]
+    assert list(resampled.emission_factor) == [0.0, 0.0, 0.0]
+    assert resampled[1].valid_from == datetime(2024, 3, 30, 23, tzinfo=UTC)
+    assert resampled[1].valid_to == datetime(2024, 3, 31, 22, tzinfo=UTC)
+    assert len(UtilizationFrame().resample("Hour")) == 0
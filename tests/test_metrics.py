@@ -0,0 +1,255 @@
+"""Tests for the request metrics of National Energy Dashboard NL."""
+
+import asyncio
+import sys
+from typing import Any
+
+import pytest
+from aiohttp import ClientSession
+from aresponses import ResponsesMockServer
+
+from nednl import (
+    NedNL,
+    OpenTelemetryHook,
+    PrometheusHook,
+    RequestMetrics,
+    RetryPolicy,
+    TTLCache,
+)
+from nednl.exceptions import NedNLServerError
+
+from . import SERIES, load_fixtures
+
+
+def _points_response(aresponses: ResponsesMockServer, repeat: int = 1) -> None:
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/points",
+        "GET",
+        aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("points.json"),
+        ),
+        repeat=repeat,
+    )
+
+
+async def test_hooks_receive_metrics(aresponses: ResponsesMockServer) -> None:
+    """Test every request reports its timings, size and status."""
+    _points_response(aresponses)
+    reported: list[RequestMetrics] = []
+    async with NedNL(api_key="TEST", hooks=[reported.append]) as client:
+        await client.all_points()
+
+    assert len(reported) == 1
+    metrics = reported[0]
+    assert metrics.method == "GET"
+    assert metrics.endpoint == "/v1/points"
+    assert metrics.status == 200
+    assert metrics.attempts == 1
+    assert metrics.cache is None
+    assert metrics.error is None
+    assert metrics.bytes_received == len(load_fixtures("points.json").encode())
+    # The internal session is traced
+    assert metrics.ttfb is not None
+    assert metrics.body is not None
+    assert metrics.parse_time is not None
+    assert metrics.total is not None
+    assert metrics.total >= metrics.ttfb
+
+
+async def test_hooks_not_called_for_cached_reference_data(
+    aresponses: ResponsesMockServer,
+) -> None:
+    """Test reference data from the TTL cache does not count as a request."""
+    _points_response(aresponses)
+    reported: list[RequestMetrics] = []
+    async with ClientSession() as session:
+        client = NedNL(
+            api_key="TEST", session=session, cache=TTLCache(), hooks=[reported.append]
+        )
+        await client.all_points()
+        await client.all_points()
+
+    assert len(reported) == 1
+
+
+async def test_hooks_report_retries_and_errors(
+    aresponses: ResponsesMockServer,
+) -> None:
+    """Test retried attempts are counted and failures are reported."""
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/utilizations",
+        "GET",
+        aresponses.Response(
+            status=500,
+            headers={"Content-Type": "application/problem+json"},
+            text='{"detail": "Internal error"}',
+        ),
+        repeat=2,
+    )
+    reported: list[RequestMetrics] = []
+    async with ClientSession() as session:
+        client = NedNL(
+            api_key="TEST",
+            session=session,
+            retry_policy=RetryPolicy(max_attempts=2, base_delay=0),
+            hooks=[reported.append],
+        )
+        with pytest.raises(NedNLServerError):
+            await client.utilization(
+                **SERIES, start_date="2024-03-29", end_date="2024-03-30"
+            )
+
+    metrics = reported[0]
+    assert metrics.status == 500
+    assert metrics.attempts == 2
+    assert metrics.params["point"] == SERIES["point_id"]
+    assert isinstance(metrics.error, NedNLServerError)
+    assert metrics.parse_time is None
+
+
+async def test_failing_hook_is_logged(
+    aresponses: ResponsesMockServer,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a hook that raises does not replace the result of the request."""
+    _points_response(aresponses)
+    reported: list[RequestMetrics] = []
+
+    def failing_hook(_metrics: RequestMetrics) -> None:
+        raise ZeroDivisionError
+
+    async with NedNL(api_key="TEST", hooks=[failing_hook, reported.append]) as client:
+        points = await client.all_points()
+
+    assert points
+    # The other hooks are still called
+    assert len(reported) == 1
+    assert "Error in request hook" in caplog.text
+
+
+async def test_hooks_report_coalesced_requests(
+    aresponses: ResponsesMockServer,
+) -> None:
+    """Test callers sharing an in-flight request are marked as coalesced."""
+    _points_response(aresponses)
+    reported: list[RequestMetrics] = []
+    async with ClientSession() as session:
+        client = NedNL(api_key="TEST", session=session, hooks=[reported.append])
+        sizes = await asyncio.gather(
+            client._fetch("points", len),  # pylint: disable=protected-access
+            client._fetch("points", len),  # pylint: disable=protected-access
+        )
+
+    assert sizes[0] == sizes[1]
+    assert sorted(str(metrics.cache) for metrics in reported) == ["None", "coalesced"]
+
+
+class FakeInstrument:
+    """Instrument that keeps the values it records."""
+
+    def __init__(self) -> None:
+        """Start without values."""
+        self.values: list[tuple[float, dict[str, str]]] = []
+
+    def record(self, value: float, attributes: dict[str, str]) -> None:
+        """Record a histogram value."""
+        self.values.append((value, attributes))
+
+    def add(self, value: float, attributes: dict[str, str]) -> None:
+        """Add to a counter."""
+        self.values.append((value, attributes))
+
+    def set(self, value: float) -> None:  # noqa: A003, RUF100
+        """Set a gauge."""
+        self.values.append((value, {}))
+
+
+class FakeMeter:
+    """Meter that creates fake instruments."""
+
+    def __init__(self) -> None:
+        """Start without instruments."""
+        self.instruments: dict[str, FakeInstrument] = {}
+
+    def create_histogram(self, name: str, **_kwargs: Any) -> FakeInstrument:
+        """Create a histogram."""
+        return self.instruments.setdefault(name, FakeInstrument())
+
+    def create_counter(self, name: str, **_kwargs: Any) -> FakeInstrument:
+        """Create a counter."""
+        return self.instruments.setdefault(name, FakeInstrument())
+
+    def create_gauge(self, name: str, **_kwargs: Any) -> FakeInstrument:
+        """Create a gauge."""
+        return self.instruments.setdefault(name, FakeInstrument())
+
+
+def test_opentelemetry_hook() -> None:
+    """Test metrics are recorded with the instruments of a meter."""
+    meter = FakeMeter()
+    hook = OpenTelemetryHook(meter)
+    hook(
+        RequestMetrics(
+            "GET",
+            "/v1/points",
+            {},
+            status=200,
+            attempts=3,
+            ttfb=0.25,
+            total=0.5,
+            bytes_received=1024,
+            concurrency_limit=8,
+        )
+    )
+
+    labels = {"endpoint": "/v1/points", "status": "200", "cache": "none"}
+    assert meter.instruments["nednl.request.duration"].values == [
+        (0.25, {**labels, "phase": "ttfb"}),
+        (0.5, {**labels, "phase": "total"}),
+    ]
+    assert meter.instruments["nednl.response.size"].values == [(1024, labels)]
+    assert meter.instruments["nednl.requests"].values == [(1, labels)]
+    assert meter.instruments["nednl.retries"].values == [(2, labels)]
+    assert meter.instruments["nednl.concurrency.limit"].values == [(8, {})]
+
+
+def test_prometheus_hook() -> None:
+    """Test metrics are recorded in a Prometheus registry."""
+    prometheus_client = pytest.importorskip("prometheus_client")
+    registry = prometheus_client.CollectorRegistry()
+    hook = PrometheusHook(registry)
+    hook(
+        RequestMetrics(
+            "GET",
+            "/v1/points",
+            {},
+            status=200,
+            attempts=3,
+            total=0.5,
+            bytes_received=1024,
+            concurrency_limit=8,
+        )
+    )
+
+    labels = {"endpoint": "/v1/points", "status": "200", "cache": "none"}
+    assert registry.get_sample_value("nednl_requests_total", labels) == 1
+    assert registry.get_sample_value("nednl_response_bytes_total", labels) == 1024
+    assert registry.get_sample_value("nednl_retries_total", labels) == 2
+    assert registry.get_sample_value("nednl_concurrency_limit") == 8
+    assert (
+        registry.get_sample_value(
+            "nednl_request_duration_seconds_sum", {**labels, "phase": "total"}
+        )
+        == 0.5
+    )
+
+
+def test_prometheus_hook_requires_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a clear error is raised when the Prometheus client is missing."""
+    monkeypatch.setitem(sys.modules, "prometheus_client", None)
+    with pytest.raises(ImportError, match="requires the prometheus_client"):
+        PrometheusHook()
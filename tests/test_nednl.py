@@ -5,7 +5,7 @@ import asyncio
 from unittest.mock import patch
 
 import pytest
-from aiohttp import ClientError, ClientResponse, ClientSession
+from aiohttp import ClientError, ClientResponse, ClientSession, TCPConnector
 from aresponses import Response, ResponsesMockServer
 
 from nednl import NedNL
@@ -59,6 +59,55 @@ async def test_internal_session(aresponses: ResponsesMockServer) -> None:
         await client._request("test")
 
 
+async def test_internal_session_connector(aresponses: ResponsesMockServer) -> None:
+    """Test the internal session uses a connector with the configured pool."""
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/test",
+        "GET",
+        aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("points.json"),
+        ),
+    )
+    async with NedNL(
+        api_key="TEST",
+        connection_limit=20,
+        connection_limit_per_host=10,
+        keep_alive=False,
+    ) as client:
+        await client._request("test")
+        assert client.session is not None
+        connector = client.session.connector
+        assert isinstance(connector, TCPConnector)
+        assert connector.limit == 20
+        assert connector.limit_per_host == 10
+        assert connector.force_close
+
+
+async def test_changed_api_key(aresponses: ResponsesMockServer) -> None:
+    """Test a changed API key is sent with the next request."""
+    tokens: list[str] = []
+
+    async def response_handler(request: ClientResponse) -> Response:
+        tokens.append(request.headers["X-AUTH-TOKEN"])
+        return aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("points.json"),
+        )
+
+    aresponses.add("api.ned.nl", "/v1/test", "GET", response_handler)
+    aresponses.add("api.ned.nl", "/v1/test", "GET", response_handler)
+    async with ClientSession() as session:
+        client = NedNL(api_key="OLD", session=session)
+        await client._request("test")
+        client.api_key = "NEW"
+        await client._request("test")
+    assert tokens == ["OLD", "NEW"]
+
+
 async def test_timeout(aresponses: ResponsesMockServer) -> None:
     """Test timeout error handling."""
 
@@ -167,3 +216,48 @@ async def test_invalid_json_error_response(
     )
     with pytest.raises(NedNLNotFoundError):
         assert await nednl_client._request("test")
+
+
+async def test_coalesce_identical_requests(
+    aresponses: ResponsesMockServer,
+    nednl_client: NedNL,
+) -> None:
+    """Test identical requests in flight share one response."""
+
+    async def response_handler(_: ClientResponse) -> Response:
+        await asyncio.sleep(0.1)
+        return aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("points.json"),
+        )
+
+    aresponses.add("api.ned.nl", "/v1/test", "GET", response_handler)
+    cancelled = asyncio.create_task(nednl_client._request("test", params={"a": 1}))
+    waiting = asyncio.create_task(nednl_client._request("test", params={"a": "1"}))
+    await asyncio.sleep(0.01)
+    cancelled.cancel()
+    assert await waiting == load_fixtures("points.json").encode()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    assert not nednl_client._inflight
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_coalesce_disabled(aresponses: ResponsesMockServer) -> None:
+    """Test identical requests are sent separately when coalescing is disabled."""
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/test",
+        "GET",
+        aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("points.json"),
+        ),
+        repeat=2,
+    )
+    async with ClientSession() as session:
+        client = NedNL(api_key="TEST", session=session, coalesce_requests=False)
+        await asyncio.gather(client._request("test"), client._request("test"))
+    aresponses.assert_plan_strictly_followed()
@@ -0,0 +1,145 @@
+"""Tests for the refetch planner of National Energy Dashboard NL."""
+
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from aiohttp.web_request import BaseRequest
+from aresponses import Response, ResponsesMockServer
+
+from nednl import NedNL, UtilizationSeries
+from nednl.models import Utilization
+from nednl.planner import find_gaps, plan_refetch
+
+from . import SERIES, load_fixtures
+
+START = datetime(2024, 3, 29, tzinfo=UTC)
+HOUR = timedelta(hours=1)
+
+
+def hourly(*hours: int) -> list[Utilization]:
+    """Create hourly utilizations starting at the given hours after START."""
+    return [
+        Utilization(
+            id=hour,
+            capacity=0,
+            volume=hour,
+            percentage=0.0,
+            emission=0,
+            emission_factor=0.0,
+            valid_from=START + hour * HOUR,
+            valid_to=START + (hour + 1) * HOUR,
+            last_update=START,
+        )
+        for hour in hours
+    ]
+
+
+def test_find_gaps() -> None:
+    """Test consecutive missing slots are combined into gaps."""
+    utilizations = hourly(0, 1, 4, 6, 7)
+    assert find_gaps(utilizations, START, START + 10 * HOUR, "Hour") == [
+        (START + 2 * HOUR, START + 4 * HOUR),
+        (START + 5 * HOUR, START + 6 * HOUR),
+        (START + 8 * HOUR, START + 10 * HOUR),
+    ]
+    assert find_gaps(utilizations, START, START + 2 * HOUR, "Hour") == []
+
+
+@pytest.mark.parametrize(
+    ("items_per_page", "expected"),
+    [
+        # Everything fits in one page, so a single query refetches the rows
+        (24, [(2, 10)]),
+        # Gaps close together share a query, but no query exceeds four slots
+        (4, [(2, 6), (8, 10)]),
+        (1, [(2, 3), (3, 4), (5, 6), (8, 9), (9, 10)]),
+    ],
+)
+def test_plan_refetch(items_per_page: int, expected: list[tuple[int, int]]) -> None:
+    """Test gaps are collapsed into the fewest queries that fit a page."""
+    queries = plan_refetch(
+        hourly(0, 1, 4, 6, 7),
+        START,
+        START + 10 * HOUR,
+        "Hour",
+        items_per_page=items_per_page,
+    )
+    assert queries == [
+        (START + start * HOUR, START + end * HOUR) for start, end in expected
+    ]
+
+
+def test_plan_refetch_invalid_page_size() -> None:
+    """Test the page size must be positive."""
+    with pytest.raises(ValueError, match="must be positive"):
+        plan_refetch([], START, START + HOUR, "Hour", items_per_page=0)
+
+
+async def test_fill_gaps(
+    aresponses: ResponsesMockServer,
+    nednl_client: NedNL,
+) -> None:
+    """Test only the planned queries are requested and results are merged."""
+    for endpoint, fixture in (
+        ("granularities", "granularities.json"),
+        ("granularity_time_zones", "granularity_timezones.json"),
+    ):
+        aresponses.add(
+            "api.ned.nl",
+            f"/v1/{endpoint}",
+            "GET",
+            aresponses.Response(
+                status=200,
+                content_type="application/ld+json",
+                body=load_fixtures(fixture),
+            ),
+        )
+
+    async def missing_rows(request: BaseRequest) -> Response:
+        assert request.query["itemsPerPage"] == "200"
+        assert request.query["validfrom[after]"] == "2024-03-29T00:20:00+00:00"
+        assert request.query["validfrom[strictly_before]"] == (
+            "2024-03-29T00:40:00+00:00"
+        )
+        return aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("utilizations_page_2.json"),
+        )
+
+    aresponses.add("api.ned.nl", "/v1/utilizations", "GET", missing_rows)
+    # Only the first two 10 minute slots are available
+    utilizations = [
+        Utilization(
+            id=minutes,
+            capacity=0,
+            volume=0,
+            percentage=0.0,
+            emission=0,
+            emission_factor=0.0,
+            valid_from=START + timedelta(minutes=minutes),
+            valid_to=START + timedelta(minutes=minutes + 10),
+            last_update=START,
+        )
+        for minutes in (0, 10)
+    ]
+    result = await nednl_client.fill_gaps(
+        replace(UtilizationSeries(**SERIES), granularity_timezone_id=0),
+        utilizations,
+        start_date=START,
+        end_date=START + timedelta(minutes=40),
+    )
+    assert [item.valid_from.minute for item in result] == [0, 10, 20, 30]
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_fill_gaps_naive_dates(nednl_client: NedNL) -> None:
+    """Test naive dates are rejected before any request is made."""
+    with pytest.raises(ValueError, match="timezone aware"):
+        await nednl_client.fill_gaps(
+            UtilizationSeries(**SERIES),
+            [],
+            start_date=START.replace(tzinfo=None),
+            end_date=START + timedelta(minutes=40),
+        )
@@ -0,0 +1,59 @@
+"""Tests for the rate limiter of National Energy Dashboard NL."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from aiohttp import ClientSession
+from aresponses import ResponsesMockServer
+
+from nednl import NedNL, RateLimiter
+
+from . import load_fixtures
+
+
+async def test_burst_then_paced() -> None:
+    """Test requests within the burst pass directly and later ones are paced."""
+    limiter = RateLimiter(requests_per_minute=600, burst=2)
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    await limiter.acquire()
+    await limiter.acquire()
+    assert loop.time() - start < 0.05
+
+    await limiter.acquire()
+    assert loop.time() - start >= 0.09
+
+
+@pytest.mark.parametrize(
+    ("requests_per_minute", "burst"),
+    [(0, 1), (60, 0)],
+)
+def test_invalid_configuration(requests_per_minute: float, burst: int) -> None:
+    """Test the rate and burst size must be positive."""
+    with pytest.raises(ValueError, match="must be positive"):
+        RateLimiter(requests_per_minute=requests_per_minute, burst=burst)
+
+
+async def test_shared_rate_limiter(aresponses: ResponsesMockServer) -> None:
+    """Test every request of every client takes a token from the limiter."""
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/points",
+        "GET",
+        aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("points.json"),
+        ),
+        repeat=2,
+    )
+    limiter = RateLimiter()
+    limiter.acquire = AsyncMock()  # type: ignore[method-assign]
+    async with ClientSession() as session:
+        first = NedNL(api_key="TEST", session=session, rate_limiter=limiter)
+        second = NedNL(api_key="TEST", session=session, rate_limiter=limiter)
+        await first.all_points()
+        await second.all_points()
+    assert limiter.acquire.await_count == 2
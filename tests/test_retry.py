@@ -0,0 +1,133 @@
+"""Tests for retrying requests to National Energy Dashboard NL."""
+
+# pylint: disable=protected-access
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import pytest
+from aiohttp import ClientSession
+from aresponses import ResponsesMockServer
+
+from nednl import NedNL, RetryPolicy
+from nednl.exceptions import (
+    NedNLNotFoundError,
+    NedNLRateLimitError,
+    NedNLServerError,
+    NedNLTimeoutError,
+)
+
+from . import load_fixtures
+
+
+def add_error(
+    aresponses: ResponsesMockServer,
+    status: int,
+    headers: dict[str, str] | None = None,
+) -> None:
+    """Register an error response for the test endpoint."""
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/test",
+        "GET",
+        aresponses.Response(
+            status=status,
+            headers={"Content-Type": "application/ld+json", **(headers or {})},
+            body=load_fixtures(f"error_{status}.json"),
+        ),
+    )
+
+
+async def test_retry_server_error(aresponses: ResponsesMockServer) -> None:
+    """Test a server error is retried until the request succeeds."""
+    add_error(aresponses, 500)
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/test",
+        "GET",
+        aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("points.json"),
+        ),
+    )
+    async with ClientSession() as session:
+        client = NedNL(
+            api_key="TEST",
+            session=session,
+            retry_policy=RetryPolicy(base_delay=0),
+        )
+        assert await client._request("test")
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_retry_attempts_exhausted(aresponses: ResponsesMockServer) -> None:
+    """Test the last error is raised when all attempts fail."""
+    for _ in range(3):
+        add_error(aresponses, 500)
+    async with ClientSession() as session:
+        client = NedNL(
+            api_key="TEST",
+            session=session,
+            retry_policy=RetryPolicy(max_attempts=3, base_delay=0),
+        )
+        with pytest.raises(NedNLServerError):
+            await client._request("test")
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_no_retry_client_error(aresponses: ResponsesMockServer) -> None:
+    """Test errors that are not configured to be retried are raised directly."""
+    add_error(aresponses, 404)
+    async with ClientSession() as session:
+        client = NedNL(
+            api_key="TEST",
+            session=session,
+            retry_policy=RetryPolicy(base_delay=0),
+        )
+        with pytest.raises(NedNLNotFoundError):
+            await client._request("test")
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_rate_limit_retry_after(
+    aresponses: ResponsesMockServer,
+    nednl_client: NedNL,
+) -> None:
+    """Test the Retry-After header is exposed on the rate limit error."""
+    add_error(aresponses, 429, {"Retry-After": "30"})
+    with pytest.raises(NedNLRateLimitError) as excinfo:
+        await nednl_client._request("test")
+    assert excinfo.value.retry_after == 30
+    assert RetryPolicy().delay(1, excinfo.value) == 30
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, None),
+        ("", None),
+        ("120", 120),
+        ("-5", 0),
+        ("soon", None),
+        (format_datetime(datetime.now(UTC) - timedelta(minutes=1), usegmt=True), 0),
+    ],
+)
+def test_parse_retry_after(value: str | None, expected: float | None) -> None:
+    """Test parsing of the Retry-After header."""
+    assert NedNL._parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date() -> None:
+    """Test a Retry-After header with an HTTP date in the future."""
+    retry_at = datetime.now(UTC) + timedelta(minutes=2)
+    delay = NedNL._parse_retry_after(format_datetime(retry_at, usegmt=True))
+    assert delay is not None
+    assert 100 < delay <= 120
+
+
+def test_backoff_delay() -> None:
+    """Test the delay doubles per attempt and is capped."""
+    policy = RetryPolicy(base_delay=1, max_delay=5, jitter=0)
+    assert [policy.delay(attempt) for attempt in (1, 2, 3, 4)] == [1, 2, 4, 5]
+    assert policy.should_retry(NedNLTimeoutError("Timeout"), 1)
+    assert not policy.should_retry(NedNLTimeoutError("Timeout"), 3)
@@ -0,0 +1,166 @@
+"""Tests for the local utilization store of National Energy Dashboard NL."""
+
+from dataclasses import replace
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+
+from aiohttp import ClientSession
+from aiohttp.web_request import BaseRequest
+from aresponses import Response, ResponsesMockServer
+
+from nednl import NedNL, SQLiteUtilizationStore, UtilizationSeries
+from nednl.models import UtilizationsResponse
+
+from . import SERIES, load_fixtures
+
+SOLAR = UtilizationSeries(**SERIES)
+DAY = datetime(2024, 3, 29, tzinfo=UTC)
+
+
+async def test_store_range_and_upsert(tmp_path: Path) -> None:
+    """Test rows are queried by valid from and upserted on id."""
+    store = SQLiteUtilizationStore(tmp_path / "store.db")
+    utilizations = UtilizationsResponse.from_json(
+        load_fixtures("utilizations_page_1.json")
+    ).data
+    await store.put(SOLAR, utilizations)
+    await store.put(SOLAR, [replace(utilizations[1], volume=111)])
+
+    stored = await store.get(SOLAR, DAY, DAY + timedelta(days=1))
+    assert [item.volume for item in stored] == [100, 111]
+    assert stored[0] == utilizations[0]
+    assert await store.get(SOLAR, DAY + timedelta(minutes=5), DAY) == []
+    other = replace(SOLAR, point_id=1)
+    assert await store.get(other, DAY, DAY + timedelta(days=1)) == []
+
+
+async def test_store_missing(tmp_path: Path) -> None:
+    """Test complete periods are merged and gaps are reported."""
+    store = SQLiteUtilizationStore(tmp_path / "store.db")
+    hour = timedelta(hours=1)
+    assert await store.missing(SOLAR, DAY, DAY + 4 * hour) == [(DAY, DAY + 4 * hour)]
+
+    await store.put(SOLAR, [], (DAY + hour, DAY + 2 * hour))
+    await store.put(SOLAR, [], (DAY + 2 * hour, DAY + 3 * hour))
+    assert await store.missing(SOLAR, DAY, DAY + 4 * hour) == [
+        (DAY, DAY + hour),
+        (DAY + 3 * hour, DAY + 4 * hour),
+    ]
+    assert await store.missing(SOLAR, DAY + hour, DAY + 3 * hour) == []
+
+    await store.put(SOLAR, [], (DAY, DAY + 4 * hour))
+    assert await store.missing(SOLAR, DAY, DAY + 4 * hour) == []
+
+
+async def test_backfill_from_store(
+    aresponses: ResponsesMockServer,
+    tmp_path: Path,
+) -> None:
+    """Test a finalized period is fetched once and then read from the store."""
+    requested: list[str] = []
+
+    async def first_page(request: BaseRequest) -> Response:
+        requested.append(request.query["validfrom[after]"])
+        return aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("utilizations_page_1.json"),
+        )
+
+    aresponses.add("api.ned.nl", "/v1/utilizations", "GET", first_page)
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/utilizations",
+        "GET",
+        aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("utilizations_page_2.json"),
+        ),
+    )
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/utilizations",
+        "GET",
+        aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("utilizations_page_1.json"),
+        ),
+    )
+
+    async with ClientSession() as session:
+        client = NedNL(
+            api_key="TEST",
+            session=session,
+            store=SQLiteUtilizationStore(tmp_path / "store.db"),
+        )
+        utilizations = await client.backfill_utilizations(
+            **SERIES, start_date=date(2024, 3, 29), end_date=date(2024, 3, 30)
+        )
+        stored = await client.backfill_utilizations(
+            **SERIES,
+            start_date=date(2024, 3, 29),
+            end_date=date(2024, 3, 30),
+            as_frame=True,
+        )
+        compact = await client.backfill_utilizations(
+            **SERIES,
+            start_date=date(2024, 3, 29),
+            end_date=date(2024, 3, 30),
+            compact=True,
+        )
+        # A single page is still requested from the API, even with a store
+        first = await client.utilization(
+            **SERIES, start_date="2024-03-29", end_date="2024-03-30"
+        )
+
+    assert [item.volume for item in utilizations] == [100, 110, 120, 130]
+    assert stored.to_utilizations() == utilizations
+    assert [item.to_utilization() for item in compact] == utilizations
+    assert [item.volume for item in first] == [100, 110]
+    assert requested == ["2024-03-29T00:00:00+00:00"]
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_backfill_from_cold_store_in_shards(
+    aresponses: ResponsesMockServer,
+    tmp_path: Path,
+) -> None:
+    """Test the missing periods of a cold store are fetched in shards."""
+    requested: list[tuple[str, str]] = []
+
+    async def response_handler(request: BaseRequest) -> Response:
+        requested.append(
+            (
+                request.query["validfrom[after]"],
+                request.query["validfrom[strictly_before]"],
+            )
+        )
+        return aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("utilizations_page_2.json"),
+        )
+
+    aresponses.add("api.ned.nl", "/v1/utilizations", "GET", response_handler, repeat=3)
+
+    async with ClientSession() as session:
+        client = NedNL(
+            api_key="TEST",
+            session=session,
+            store=SQLiteUtilizationStore(tmp_path / "store.db"),
+        )
+        await client.backfill_utilizations(
+            **SERIES,
+            start_date=date(2024, 1, 1),
+            end_date=date(2024, 4, 1),
+            shard="month",
+        )
+
+    assert sorted(requested) == [
+        ("2024-01-01T00:00:00+00:00", "2024-02-01T00:00:00+00:00"),
+        ("2024-02-01T00:00:00+00:00", "2024-03-01T00:00:00+00:00"),
+        ("2024-03-01T00:00:00+00:00", "2024-04-01T00:00:00+00:00"),
+    ]
+    aresponses.assert_plan_strictly_followed()
@@ -0,0 +1,69 @@
+"""Tests for the incremental parser of National Energy Dashboard NL."""
+
+import orjson
+import pytest
+
+from nednl.stream import HydraCollectionParser
+
+from . import load_fixtures
+
+
+def parse(body: bytes, chunk_size: int) -> tuple[HydraCollectionParser, list[object]]:
+    """Feed a body to a new parser in chunks of the given size."""
+    parser = HydraCollectionParser()
+    items: list[object] = []
+    for start in range(0, len(body), chunk_size):
+        items.extend(parser.feed(body[start : start + chunk_size]))
+    return parser, items
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 20])
+@pytest.mark.parametrize("fixture", ["utilizations.json", "utilizations_page_1.json"])
+def test_parse_fixture(fixture: str, chunk_size: int) -> None:
+    """Test members and top-level values match a full parse for any chunking."""
+    body = load_fixtures(fixture).encode()
+    document = orjson.loads(body)
+    parser, items = parse(body, chunk_size)
+    assert parser.complete
+    assert items == document["hydra:member"]
+    assert parser.total_items == document["hydra:totalItems"]
+    assert parser.document["hydra:view"] == document.get("hydra:view")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1 << 20])
+def test_parse_nested_and_escaped(chunk_size: int) -> None:
+    """Test members with nested values and escaped braces and quotes."""
+    document = {
+        "hydra:totalItems": 3,
+        "hydra:member": [
+            {"id": 1, "name": 'brace } and "quote" \\', "tags": ["a", "]"]},
+            {"id": 2, "nested": {"inner": {"value": [1, {"x": "}"}]}}},
+            {},
+        ],
+        "other": {"hydra:member": [{"id": 4}]},
+    }
+    parser, items = parse(orjson.dumps(document), chunk_size)
+    assert parser.complete
+    assert items == document["hydra:member"]
+    assert parser.total_items == 3
+    assert parser.document["other"] == document["other"]
+
+
+def test_total_items_before_members() -> None:
+    """Test the total number of items is known before any member completes."""
+    parser = HydraCollectionParser()
+    assert parser.total_items is None
+    assert parser.feed(b'{"hydra:totalItems": 2, "hydra:member": [{"id"') == []
+    assert parser.total_items == 2
+    assert parser.feed(b': 1}, {"id": 2}]}') == [{"id": 1}, {"id": 2}]
+    assert parser.complete
+
+
+def test_buffer_is_trimmed() -> None:
+    """Test completed members are not kept in the buffer."""
+    parser = HydraCollectionParser()
+    parser.feed(b'{"hydra:member": [')
+    for index in range(1000):
+        assert parser.feed(b'{"id": %d}, {"id"' % index) == [{"id": index}]
+        parser.feed(b": 0}, ")
+    assert len(parser._buffer) < 32
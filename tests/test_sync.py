@@ -0,0 +1,297 @@
+"""Tests for the incremental sync of National Energy Dashboard NL."""
+
+from contextlib import aclosing
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import orjson
+import pytest
+from aiohttp import ClientSession
+from aiohttp.web_request import BaseRequest
+from aresponses import Response, ResponsesMockServer
+
+from nednl import (
+    Granularity,
+    GranularityTimezone,
+    NedCatalog,
+    NedNL,
+    SyncState,
+    SyncWatermark,
+    UtilizationSeries,
+)
+from nednl.exceptions import NedNLNotFoundError
+from nednl.models import UtilizationsResponse
+
+from . import SERIES, load_fixtures
+
+SOLAR = UtilizationSeries(**SERIES)
+UPDATED = datetime(2024, 4, 2, 6, 37, 53, tzinfo=UTC)
+
+
+def test_apply_first_sync() -> None:
+    """Test all rows are inserts when a series has no watermark."""
+    utilizations = UtilizationsResponse.from_json(
+        load_fixtures("utilizations_page_1.json")
+    ).data
+    state = SyncState()
+    result = state.apply(SOLAR, utilizations)
+    assert result.inserts == utilizations
+    assert result.updates == []
+    assert state.watermarks[SOLAR] == SyncWatermark(
+        valid_from=datetime(2024, 3, 29, 0, 10, tzinfo=UTC), last_update=UPDATED
+    )
+
+
+def test_apply_unchanged() -> None:
+    """Test rows at or before the watermark are skipped if not updated."""
+    utilizations = UtilizationsResponse.from_json(
+        load_fixtures("utilizations_page_1.json")
+    ).data
+    watermark = SyncWatermark(
+        valid_from=datetime(2024, 3, 30, tzinfo=UTC), last_update=UPDATED
+    )
+    state = SyncState(watermarks={SOLAR: watermark})
+    result = state.apply(SOLAR, utilizations)
+    assert result.inserts == result.updates == []
+    assert state.watermarks[SOLAR] is watermark
+
+
+def test_state_json() -> None:
+    """Test the state can be stored and restored."""
+    state = SyncState(
+        watermarks={
+            SOLAR: SyncWatermark(
+                valid_from=datetime(2024, 3, 29, tzinfo=UTC), last_update=UPDATED
+            )
+        }
+    )
+    assert SyncState.from_json(state.to_json()) == state
+
+
+async def test_sync_utilizations(
+    aresponses: ResponsesMockServer,
+    nednl_client: NedNL,
+) -> None:
+    """Test only the tail is fetched and changes are split by watermark."""
+    watermark = SyncWatermark(
+        valid_from=datetime(2024, 3, 29, 0, 10, tzinfo=UTC),
+        last_update=datetime(2024, 4, 1, tzinfo=UTC),
+    )
+    state = SyncState(watermarks={SOLAR: watermark})
+
+    async def response_handler(request: BaseRequest) -> Response:
+        assert request.query["validfrom[after]"] == "2024-03-28T23:10:00+00:00"
+        assert request.query["order[validfrom]"] == "asc"
+        return aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("utilizations_page_1.json"),
+        )
+
+    aresponses.add("api.ned.nl", "/v1/utilizations", "GET", response_handler)
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/utilizations",
+        "GET",
+        aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("utilizations_page_2.json"),
+        ),
+    )
+    result = await nednl_client.sync_utilizations(
+        SOLAR, state, look_back=timedelta(hours=1)
+    )
+    assert [item.volume for item in result.inserts] == [120, 130]
+    assert [item.volume for item in result.updates] == [100, 110]
+    assert state.watermarks[SOLAR] == SyncWatermark(
+        valid_from=datetime(2024, 3, 29, 0, 30, tzinfo=UTC), last_update=UPDATED
+    )
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_sync_utilizations_initial(
+    aresponses: ResponsesMockServer,
+    nednl_client: NedNL,
+) -> None:
+    """Test a series without watermark is synced from the initial start."""
+
+    async def response_handler(request: BaseRequest) -> Response:
+        assert request.query["validfrom[after]"] == "2024-03-29T00:00:00+00:00"
+        return aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("utilizations.json"),
+        )
+
+    aresponses.add("api.ned.nl", "/v1/utilizations", "GET", response_handler)
+    state = SyncState()
+    result = await nednl_client.sync_utilizations(
+        SOLAR, state, initial_start=datetime(2024, 3, 29, tzinfo=UTC)
+    )
+    assert len(result.inserts) == 143
+    assert result.updates == []
+    assert SOLAR in state.watermarks
+
+
+async def test_sync_utilizations_forecast(
+    aresponses: ResponsesMockServer,
+    nednl_client: NedNL,
+) -> None:
+    """Test a forecast row does not move the next window into the future."""
+    now = datetime.now(UTC).replace(microsecond=0)
+    page = orjson.loads(load_fixtures("utilizations_page_2.json"))
+    del page["hydra:view"]
+    measured, forecast = page["hydra:member"]
+    measured["validfrom"] = (now - timedelta(hours=1)).isoformat()
+    forecast["validfrom"] = (now + timedelta(hours=6)).isoformat()
+    starts: list[datetime] = []
+
+    def add_response(body: dict[str, Any]) -> None:
+        async def response_handler(request: BaseRequest) -> Response:
+            starts.append(datetime.fromisoformat(request.query["validfrom[after]"]))
+            return aresponses.Response(
+                status=200,
+                content_type="application/ld+json",
+                body=orjson.dumps(body),
+            )
+
+        aresponses.add("api.ned.nl", "/v1/utilizations", "GET", response_handler)
+
+    add_response(page)
+    state = SyncState()
+    result = await nednl_client.sync_utilizations(
+        SOLAR, state, initial_start=now - timedelta(hours=2)
+    )
+    assert len(result.inserts) == 2
+
+    # The measured row is revised after the forecast moved the watermark
+    measured["volume"] = 125
+    measured["lastupdate"] = (UPDATED + timedelta(days=1)).isoformat()
+    add_response(page)
+    result = await nednl_client.sync_utilizations(SOLAR, state)
+    assert starts[1] <= datetime.now(UTC) - timedelta(hours=2)
+    assert [item.volume for item in result.updates] == [125]
+    assert result.inserts == []
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_watch_utilizations(aresponses: ResponsesMockServer) -> None:
+    """Test polls only yield new and revised rows."""
+    body = load_fixtures("utilizations_page_2.json")
+    revised = body.replace('"volume": 120', '"volume": 121', 1).replace(
+        '"2024-04-02T06:37:53+00:00"', '"2024-04-02T07:00:00+00:00"', 1
+    )
+    for response in (body, body, revised):
+        aresponses.add(
+            "api.ned.nl",
+            "/v1/utilizations",
+            "GET",
+            aresponses.Response(
+                status=200, content_type="application/ld+json", body=response
+            ),
+        )
+
+    async with ClientSession() as session:
+        client = NedNL(
+            api_key="TEST",
+            session=session,
+            catalog=NedCatalog(
+                granularities=[Granularity(id=3, name="10Min")],
+                granularity_timezones=[GranularityTimezone(id=1, name="UTC")],
+            ),
+        )
+        updates = client.watch_utilizations(
+            [SOLAR],
+            interval=timedelta(milliseconds=10),
+            delay=timedelta(0),
+            jitter=timedelta(0),
+        )
+        series, first = await anext(updates)
+        _, second = await anext(updates)
+        await updates.aclose()
+
+    assert series == SOLAR
+    assert [item.volume for item in first.inserts] == [120, 130]
+    # The unchanged poll in between is not yielded
+    assert second.inserts == []
+    assert [item.volume for item in second.updates] == [121]
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_watch_utilizations_retries_server_errors(
+    aresponses: ResponsesMockServer,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a transient error is logged and the series is polled again."""
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/utilizations",
+        "GET",
+        aresponses.Response(
+            status=500,
+            headers={"Content-Type": "application/problem+json"},
+            text='{"detail": "Internal error"}',
+        ),
+    )
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/utilizations",
+        "GET",
+        aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("utilizations_page_2.json"),
+        ),
+    )
+
+    async with ClientSession() as session:
+        client = NedNL(
+            api_key="TEST",
+            session=session,
+            catalog=NedCatalog(
+                granularities=[Granularity(id=3, name="10Min")],
+                granularity_timezones=[GranularityTimezone(id=1, name="UTC")],
+            ),
+        )
+        async with aclosing(
+            client.watch_utilizations(
+                [SOLAR],
+                interval=timedelta(milliseconds=10),
+                delay=timedelta(0),
+                jitter=timedelta(0),
+            )
+        ) as updates:
+            _, result = await anext(updates)
+
+    assert [item.volume for item in result.inserts] == [120, 130]
+    assert "Polling" in caplog.text
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_watch_utilizations_error(aresponses: ResponsesMockServer) -> None:
+    """Test a failing poll ends the watch with its error."""
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/utilizations",
+        "GET",
+        aresponses.Response(
+            status=404,
+            headers={"Content-Type": "application/problem+json"},
+            text='{"detail": "Not found"}',
+        ),
+    )
+    async with ClientSession() as session:
+        client = NedNL(
+            api_key="TEST",
+            session=session,
+            catalog=NedCatalog(
+                granularities=[Granularity(id=3, name="10Min")],
+                granularity_timezones=[GranularityTimezone(id=1, name="UTC")],
+            ),
+        )
+        with pytest.raises(NedNLNotFoundError):
+            async for _ in client.watch_utilizations([SOLAR], jitter=timedelta(0)):
+                pass
+        with pytest.raises(ValueError, match="Interval must be positive"):
+            await anext(client.watch_utilizations([SOLAR], interval=timedelta(0)))
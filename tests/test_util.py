@@ -0,0 +1,137 @@
+"""Tests for the utilities of National Energy Dashboard NL."""
+
+from datetime import UTC, date, datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from nednl.util import (
+    Shard,
+    floor_slot,
+    iter_slots,
+    next_slot,
+    parse_datetime,
+    split_date_range,
+)
+
+
+@pytest.mark.parametrize(
+    ("shard", "expected"),
+    [
+        (
+            "day",
+            [
+                (date(2024, 1, 30), date(2024, 1, 31)),
+                (date(2024, 1, 31), date(2024, 2, 1)),
+                (date(2024, 2, 1), date(2024, 2, 2)),
+            ],
+        ),
+        (
+            "week",
+            [(date(2024, 1, 30), date(2024, 2, 2))],
+        ),
+        (
+            "month",
+            [
+                (date(2024, 1, 30), date(2024, 2, 1)),
+                (date(2024, 2, 1), date(2024, 2, 2)),
+            ],
+        ),
+        (
+            "year",
+            [(date(2024, 1, 30), date(2024, 2, 2))],
+        ),
+    ],
+)
+def test_split_date_range(shard: Shard, expected: list[tuple[date, date]]) -> None:
+    """Test a date range is split on calendar boundaries."""
+    assert split_date_range(date(2024, 1, 30), date(2024, 2, 2), shard) == expected
+
+
+def test_split_datetime_range_keeps_timezone() -> None:
+    """Test shards of a datetime range keep the timezone of the start."""
+    amsterdam = ZoneInfo("Europe/Amsterdam")
+    shards = split_date_range(
+        datetime(2023, 12, 15, 12, tzinfo=amsterdam),
+        datetime(2024, 1, 15, tzinfo=amsterdam),
+        "year",
+    )
+    assert shards == [
+        (
+            datetime(2023, 12, 15, 12, tzinfo=amsterdam),
+            datetime(2024, 1, 1, tzinfo=amsterdam),
+        ),
+        (
+            datetime(2024, 1, 1, tzinfo=amsterdam),
+            datetime(2024, 1, 15, tzinfo=amsterdam),
+        ),
+    ]
+    assert shards[0][1] == datetime(2023, 12, 31, 23, tzinfo=UTC)
+
+
+def test_split_empty_date_range() -> None:
+    """Test an empty date range has no shards."""
+    assert split_date_range(date(2024, 2, 2), date(2024, 2, 2), "day") == []
+
+
+def test_split_date_range_unknown_shard() -> None:
+    """Test an unknown shard size is rejected."""
+    with pytest.raises(ValueError, match="Unknown shard size"):
+        split_date_range(date(2024, 1, 1), date(2024, 2, 1), "decade")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2024-03-29", datetime(2024, 3, 29, tzinfo=UTC)),
+        (
+            "2024-03-29T01:00:00+01:00",
+            datetime(2024, 3, 29, 1, tzinfo=ZoneInfo("Europe/Amsterdam")),
+        ),
+    ],
+)
+def test_parse_datetime(value: str, expected: datetime) -> None:
+    """Test naive values are parsed as UTC."""
+    assert parse_datetime(value) == expected
+    assert parse_datetime(value).tzinfo is not None
+
+
+def test_iter_slots_daylight_saving() -> None:
+    """Test days follow daylight saving time in the granularity timezone."""
+    slots = list(
+        iter_slots(
+            datetime(2024, 3, 30, tzinfo=UTC),
+            datetime(2024, 4, 2, tzinfo=UTC),
+            "Day",
+            "Europe/Amsterdam",
+        )
+    )
+    assert slots == [
+        datetime(2024, 3, 30, 23, tzinfo=UTC),
+        datetime(2024, 3, 31, 22, tzinfo=UTC),
+        datetime(2024, 4, 1, 22, tzinfo=UTC),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("granularity", "expected"),
+    [
+        ("15Min", datetime(2024, 3, 31, 1, 45, tzinfo=UTC)),
+        ("Hour", datetime(2024, 3, 31, 1, tzinfo=UTC)),
+        ("Month", datetime(2024, 2, 29, 23, tzinfo=UTC)),
+        ("Year", datetime(2023, 12, 31, 23, tzinfo=UTC)),
+    ],
+)
+def test_floor_slot(granularity: str, expected: datetime) -> None:
+    """Test moments are floored to the start of their slot."""
+    moment = datetime(2024, 3, 31, 1, 59, tzinfo=UTC)
+    assert floor_slot(moment, granularity, "Europe/Amsterdam") == expected
+
+
+def test_unknown_granularity() -> None:
+    """Test an unknown granularity raises an error."""
+    moment = datetime(2024, 3, 31, tzinfo=UTC)
+    with pytest.raises(ValueError, match="Unknown granularity"):
+        floor_slot(moment, "Week")
+    with pytest.raises(ValueError, match="Unknown granularity"):
+        next_slot(moment, "Week")
@@ -0,0 +1,378 @@
+"""Tests for fetching utilizations from National Energy Dashboard NL."""
+
+from dataclasses import replace
+from datetime import date
+
+import pytest
+from aiohttp.web_request import BaseRequest
+from aresponses import Response, ResponsesMockServer
+
+from nednl import NedNL, UtilizationSeries
+from nednl.exceptions import NedNLError, NedNLNotFoundError
+
+from . import SERIES, load_fixtures
+
+
+def add_utilization_pages(aresponses: ResponsesMockServer) -> None:
+    """Register both pages of the paginated utilizations fixture."""
+    for page in (1, 2):
+        aresponses.add(
+            "api.ned.nl",
+            "/v1/utilizations",
+            "GET",
+            aresponses.Response(
+                status=200,
+                content_type="application/ld+json",
+                body=load_fixtures(f"utilizations_page_{page}.json"),
+            ),
+        )
+
+
+async def test_iter_utilizations(
+    aresponses: ResponsesMockServer,
+    nednl_client: NedNL,
+) -> None:
+    """Test all pages are fetched by following the Hydra next links."""
+    add_utilization_pages(aresponses)
+    utilizations = [
+        item
+        async for item in nednl_client.iter_utilizations(
+            **SERIES,
+            start_date="2024-03-29",
+            end_date="2024-03-30",
+            items_per_page=2,
+        )
+    ]
+    assert [item.volume for item in utilizations] == [100, 110, 120, 130]
+    aresponses.assert_plan_strictly_followed()
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+async def test_iter_utilizations_single_page(
+    aresponses: ResponsesMockServer,
+    nednl_client: NedNL,
+    max_concurrency: int,
+) -> None:
+    """Test iteration stops when the response has no next link."""
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/utilizations",
+        "GET",
+        aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("utilizations.json"),
+        ),
+    )
+    utilizations = [
+        item
+        async for item in nednl_client.iter_utilizations(
+            **SERIES,
+            start_date="2024-03-29",
+            end_date="2024-03-30",
+            max_concurrency=max_concurrency,
+        )
+    ]
+    assert len(utilizations) == 143
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_iter_utilizations_concurrently(
+    aresponses: ResponsesMockServer,
+    nednl_client: NedNL,
+) -> None:
+    """Test remaining pages are requested by page number when prefetching."""
+    requested_pages: list[str] = []
+
+    async def response_handler(request: BaseRequest) -> Response:
+        page = request.query.get("page", "1")
+        requested_pages.append(page)
+        return aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures(f"utilizations_page_{page}.json"),
+        )
+
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/utilizations",
+        "GET",
+        response_handler,
+        repeat=2,
+    )
+    utilizations = [
+        item
+        async for item in nednl_client.iter_utilizations(
+            **SERIES,
+            start_date="2024-03-29",
+            end_date="2024-03-30",
+            max_concurrency=4,
+        )
+    ]
+    assert [item.volume for item in utilizations] == [100, 110, 120, 130]
+    assert requested_pages == ["1", "2"]
+
+
+async def test_backfill_utilizations(
+    aresponses: ResponsesMockServer,
+    nednl_client: NedNL,
+) -> None:
+    """Test shards are fetched separately, merged and de-duplicated."""
+    requested_shards: list[tuple[str, str]] = []
+
+    async def response_handler(request: BaseRequest) -> Response:
+        start = request.query.get("validfrom[after]", "")
+        if "page" not in request.query:
+            requested_shards.append(
+                (start, request.query["validfrom[strictly_before]"])
+            )
+        # The second day overlaps the last rows of the first day
+        page = 2 if "page" in request.query or start == "2024-03-30" else 1
+        return aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures(f"utilizations_page_{page}.json"),
+        )
+
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/utilizations",
+        "GET",
+        response_handler,
+        repeat=3,
+    )
+    utilizations = await nednl_client.backfill_utilizations(
+        **SERIES,
+        start_date=date(2024, 3, 29),
+        end_date=date(2024, 3, 31),
+        shard="day",
+    )
+    assert [item.volume for item in utilizations] == [100, 110, 120, 130]
+    assert sorted(requested_shards) == [
+        ("2024-03-29", "2024-03-30"),
+        ("2024-03-30", "2024-03-31"),
+    ]
+
+
+async def test_backfill_utilizations_error(
+    aresponses: ResponsesMockServer,
+    nednl_client: NedNL,
+) -> None:
+    """Test a failing shard fails the backfill."""
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/utilizations",
+        "GET",
+        aresponses.Response(
+            status=404,
+            content_type="application/ld+json",
+            body=load_fixtures("error_404.json"),
+        ),
+        repeat=2,
+    )
+    with pytest.raises(NedNLNotFoundError):
+        await nednl_client.backfill_utilizations(
+            **SERIES,
+            start_date=date(2024, 3, 29),
+            end_date=date(2024, 3, 31),
+            shard="day",
+        )
+
+
+async def test_utilization_many(
+    aresponses: ResponsesMockServer,
+    nednl_client: NedNL,
+) -> None:
+    """Test a failing series does not affect the other series."""
+
+    async def response_handler(request: BaseRequest) -> Response:
+        if request.query["point"] == "1":
+            return aresponses.Response(
+                status=404,
+                content_type="application/ld+json",
+                body=load_fixtures("error_404.json"),
+            )
+        return aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("utilizations.json"),
+        )
+
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/utilizations",
+        "GET",
+        response_handler,
+        repeat=2,
+    )
+    solar = UtilizationSeries(**SERIES)
+    missing = replace(solar, point_id=1)
+    results = await nednl_client.utilization_many(
+        series=[solar, missing, solar],
+        start_date="2024-03-29",
+        end_date="2024-03-30",
+        max_concurrency=2,
+    )
+    assert list(results) == [solar, missing]
+    assert isinstance(results[missing], NedNLNotFoundError)
+    utilizations = results[solar]
+    assert isinstance(utilizations, list)
+    assert len(utilizations) == 143
+
+
+async def test_stream_utilizations(
+    aresponses: ResponsesMockServer,
+    nednl_client: NedNL,
+) -> None:
+    """Test a streamed page decodes like a regular request."""
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/utilizations",
+        "GET",
+        aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("utilizations.json"),
+        ),
+        repeat=2,
+    )
+    expected = await nednl_client.utilization(
+        **SERIES, start_date="2024-03-29", end_date="2024-03-30"
+    )
+    async with nednl_client.stream_utilizations(
+        **SERIES, start_date="2024-03-29", end_date="2024-03-30", chunk_size=256
+    ) as stream:
+        assert stream.total_items is None
+        utilizations = [item async for item in stream]
+        assert stream.total_items == len(expected)
+    assert utilizations == expected
+    aresponses.assert_plan_strictly_followed()
+
+
+async def test_stream_utilizations_error(
+    aresponses: ResponsesMockServer,
+    nednl_client: NedNL,
+) -> None:
+    """Test error responses are raised when the stream starts."""
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/utilizations",
+        "GET",
+        aresponses.Response(
+            status=404,
+            content_type="application/ld+json",
+            body=load_fixtures("error_404.json"),
+        ),
+    )
+    stream = nednl_client.stream_utilizations(
+        **SERIES, start_date="2024-03-29", end_date="2024-03-30"
+    )
+    with pytest.raises(NedNLNotFoundError):
+        await anext(stream)
+
+
+async def test_stream_utilizations_truncated(
+    aresponses: ResponsesMockServer,
+    nednl_client: NedNL,
+) -> None:
+    """Test a response that ends before the document is complete."""
+    body = load_fixtures("utilizations.json")
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/utilizations",
+        "GET",
+        aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=body[: len(body) // 2],
+        ),
+    )
+    stream = nednl_client.stream_utilizations(
+        **SERIES, start_date="2024-03-29", end_date="2024-03-30"
+    )
+    with pytest.raises(NedNLError, match="Unexpected end"):
+        _ = [item async for item in stream]
+
+
+async def test_utilization_compact(
+    aresponses: ResponsesMockServer,
+    nednl_client: NedNL,
+) -> None:
+    """Test compact utilizations hold the same data as regular ones."""
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/utilizations",
+        "GET",
+        aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures("utilizations.json"),
+        ),
+        repeat=2,
+    )
+    expected = await nednl_client.utilization(
+        **SERIES, start_date="2024-03-29", end_date="2024-03-30"
+    )
+    compact = await nednl_client.utilization(
+        **SERIES, start_date="2024-03-29", end_date="2024-03-30", compact=True
+    )
+    assert [item.to_utilization() for item in compact] == expected
+
+
+async def test_backfill_compact(
+    aresponses: ResponsesMockServer,
+    nednl_client: NedNL,
+) -> None:
+    """Test the pages of all shards are merged as compact utilizations."""
+
+    async def response_handler(request: BaseRequest) -> Response:
+        start = request.query.get("validfrom[after]", "")
+        # The second day overlaps the last rows of the first day
+        page = 2 if "page" in request.query or start == "2024-03-30" else 1
+        return aresponses.Response(
+            status=200,
+            content_type="application/ld+json",
+            body=load_fixtures(f"utilizations_page_{page}.json"),
+        )
+
+    aresponses.add(
+        "api.ned.nl",
+        "/v1/utilizations",
+        "GET",
+        response_handler,
+        repeat=6,
+    )
+    expected = await nednl_client.backfill_utilizations(
+        **SERIES,
+        start_date=date(2024, 3, 29),
+        end_date=date(2024, 3, 31),
+        shard="day",
+    )
+    compact = await nednl_client.backfill_utilizations(
+        **SERIES,
+        start_date=date(2024, 3, 29),
+        end_date=date(2024, 3, 31),
+        shard="day",
+        compact=True,
+    )
+    assert [item.to_utilization() for item in compact] == expected
+
+
+async def test_utilization_compact_frame(nednl_client: NedNL) -> None:
+    """Test a frame cannot be combined with compact utilizations."""
+    with pytest.raises(ValueError, match="cannot be combined"):
+        await nednl_client.utilization(  # type: ignore[call-overload]
+            **SERIES,
+            start_date="2024-03-29",
+            end_date="2024-03-30",
+            as_frame=True,
+            compact=True,
+        )
+    with pytest.raises(ValueError, match="cannot be combined"):
+        await nednl_client.backfill_utilizations(  # type: ignore[call-overload]
+            **SERIES,
+            start_date=date(2024, 3, 29),
+            end_date=date(2024, 3, 30),
+            as_frame=True,
+            compact=True,
+        )